@@ -63,6 +63,40 @@ class DrydockConfig(object):
             help=
             'How often will an instance attempt to claim leadership, in seconds'
         ),
+        cfg.IntOpt(
+            'effective_site_cache_size',
+            min=0,
+            default=16,
+            help=
+            'Number of compiled site designs to cache, 0 disables the cache'
+        ),
+        cfg.IntOpt(
+            'compiled_node_cache_size',
+            min=0,
+            default=1024,
+            help=
+            'Number of compiled node models to keep for reuse, 0 disables '
+            'reuse'
+        ),
+        cfg.IntOpt(
+            'design_compile_workers',
+            min=1,
+            default=1,
+            help=
+            'Number of threads used to compile the applied models of nodes'
+        ),
+        cfg.IntOpt(
+            'validation_workers',
+            min=1,
+            default=1,
+            help='Number of threads used to run design validation rules'),
+        cfg.StrOpt(
+            'schema_validator',
+            default='jsonschema',
+            choices=['jsonschema', 'fastjsonschema'],
+            help=
+            'Library used to validate design documents against their schema. '
+            'fastjsonschema must be installed separately.'),
     ]
 
     # Logging options
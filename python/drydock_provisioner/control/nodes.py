@@ -15,9 +15,7 @@ import falcon
 import json
 
 from drydock_provisioner import policy
-from drydock_provisioner import config
-
-from drydock_provisioner.drivers.node.maasdriver.api_client import MaasRequestFactory
+from drydock_provisioner.drivers.node.maasdriver.api_client import get_shared_request_factory
 from drydock_provisioner.drivers.node.maasdriver.models.machine import Machines
 
 from .base import BaseResource, StatefulResource
@@ -30,16 +28,14 @@ class NodesResource(BaseResource):
     @policy.ApiEnforcer('physical_provisioner:read_data')
     def on_get(self, req, resp):
         try:
-            maas_client = MaasRequestFactory(
-                config.config_mgr.conf.maasdriver.maas_api_url,
-                config.config_mgr.conf.maasdriver.maas_api_key)
+            maas_client = get_shared_request_factory()
 
             machine_list = Machines(maas_client)
             machine_list.refresh()
+            machine_list.collect_power_params()
 
             node_view = list()
             for m in machine_list:
-                m.get_power_params()
                 node_view.append(
                     dict(
                         hostname=m.hostname,
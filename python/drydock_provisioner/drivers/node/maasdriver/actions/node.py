@@ -13,10 +13,12 @@
 # limitations under the License.
 """Task driver for completing node provisioning with Canonical MaaS 2.2+."""
 
-import time
 import logging
 import re
 import math
+import threading
+import functools
+import concurrent.futures
 import yaml
 
 from datetime import datetime
@@ -31,6 +33,9 @@ from drydock_provisioner.control.util import get_internal_api_href
 from drydock_provisioner.orchestrator.actions.orchestrator import BaseAction
 from drydock_provisioner.drivers.node.maasdriver.errors import RackControllerConflict
 from drydock_provisioner.drivers.node.maasdriver.errors import ApiNotAvailable
+from drydock_provisioner.drivers.node.maasdriver.inventory import MachineInventory
+from drydock_provisioner.drivers.node.maasdriver.result_collector import ResultCollector
+from drydock_provisioner.drivers.node.maasdriver.status_watcher import MachineStatusWatcher
 
 import drydock_provisioner.drivers.node.maasdriver.models.fabric as maas_fabric
 import drydock_provisioner.drivers.node.maasdriver.models.vlan as maas_vlan
@@ -40,6 +45,7 @@ import drydock_provisioner.drivers.node.maasdriver.models.tag as maas_tag
 import drydock_provisioner.drivers.node.maasdriver.models.sshkey as maas_keys
 import drydock_provisioner.drivers.node.maasdriver.models.boot_resource as maas_boot_res
 import drydock_provisioner.drivers.node.maasdriver.models.rack_controller as maas_rack
+import drydock_provisioner.drivers.node.maasdriver.models.node_results as maas_nr
 import drydock_provisioner.drivers.node.maasdriver.models.partition as maas_partition
 import drydock_provisioner.drivers.node.maasdriver.models.volumegroup as maas_vg
 import drydock_provisioner.drivers.node.maasdriver.models.repository as maas_repo
@@ -47,18 +53,94 @@ import drydock_provisioner.drivers.node.maasdriver.models.domain as maas_domain
 
 
 class BaseMaasAction(BaseAction):
-    def __init__(self, *args, maas_client=None):
+    def __init__(self,
+                 *args,
+                 maas_client=None,
+                 inventory=None,
+                 status_watcher=None,
+                 result_collector=None):
         super().__init__(*args)
 
         self.maas_client = maas_client
 
+        # Without a shared inventory, always query MaaS for current state
+        if inventory is None:
+            inventory = MachineInventory(maas_client, ttl=0)
+        self.inventory = inventory
+
+        if status_watcher is None:
+            status_watcher = MachineStatusWatcher(
+                maas_client,
+                poll_interval=config.config_mgr.conf.maasdriver.poll_interval)
+        self.status_watcher = status_watcher
+
+        # Shared by the subtasks of a driver task to batch the work done
+        # once machines finish commissioning
+        self.result_collector = result_collector
+
         self.logger = logging.getLogger(
             config.config_mgr.conf.logging.nodedriver_logger_name)
 
+    def start_async(self, executor):
+        """Start the action, returning a future for its completion.
+
+        Actions that wait on MaaS status changes can override this to
+        give up their executor thread while waiting.
+
+        :param executor: instance of concurrent.futures.Executor
+        :return: a concurrent.futures.Future completed with the action
+        """
+        return executor.submit(self.start)
+
     def _add_detail_logs(self, node, machine, stage, result_type='all'):
-        result_details = machine.get_task_results(result_type=result_type)
+        self._add_batch_detail_logs([(node, machine)], {result_type: stage})
+
+    def _add_batch_detail_logs(self, node_machines, stages, build_data=None):
+        """Save the MaaS task results of many nodes as build data.
+
+        Results for all the nodes are fetched from MaaS in a single request
+        and saved with a single insert.
+
+        :param node_machines: list of (objects.BaremetalNode,
+                              models.machine.Machine) tuples
+        :param stages: dict of MaaS result type to the stage name recorded
+                       for those results
+        :param build_data: list of additional objects.BuildData to save
+        """
+        build_data = list(build_data or [])
+
+        result_details = get_node_results(
+            [m for (_, m) in node_machines], stages)
+        build_data.extend(
+            self._get_result_build_data(result_details, node_machines,
+                                        stages))
+
+        self.state_manager.post_build_data(build_data)
+        self._link_detail_logs()
+
+    def _get_result_build_data(self, result_details, node_machines, stages):
+        """Convert the MaaS task results of nodes to build data of this task.
+
+        :param result_details: instance of models.node_results.NodeResults
+                               as returned by ``get_node_results``
+        :param node_machines: list of (objects.BaremetalNode,
+                              models.machine.Machine) tuples to convert
+                              results of
+        :param stages: dict of MaaS result type to the stage name recorded
+                       for those results
+        :return: list of objects.BuildData
+        """
+        build_data = []
+        nodes = {m.resource_id: n for (n, m) in node_machines}
+        single_node = len(result_details.system_id_list) == 1
+
         for r in result_details:
-            if r.get_decoded_data():
+            node = nodes.get(r.get_system_id())
+            if node is None and single_node and len(nodes) == 1:
+                node = node_machines[0][0]
+            stage = stages.get(r.get_type_desc(),
+                               stages.get(result_details.result_type))
+            if node is not None and stage is not None and r.get_decoded_data():
                 bd = objects.BuildData(
                     node_name=node.name,
                     task_id=self.task.task_id,
@@ -66,7 +148,11 @@ class BaseMaasAction(BaseAction):
                     generator="{}:{}".format(stage, r.name),
                     data_format='text/plain',
                     data_element=r.get_decoded_data())
-                self.state_manager.post_build_data(bd)
+                build_data.append(bd)
+
+        return build_data
+
+    def _link_detail_logs(self):
         log_href = "%s/tasks/%s/builddata" % (get_internal_api_href("v1.0"),
                                               str(self.task.task_id))
         self.task.result.add_link('detail_logs', log_href)
@@ -249,8 +335,7 @@ class DestroyNode(BaseMaasAction):
         :return: None
         """
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            self.inventory.get_machines()
         except Exception as ex:
             self.logger.warning("Error accessing the MaaS API.", exc_info=ex)
             self.task.set_status(hd_fields.TaskStatus.Complete)
@@ -283,7 +368,8 @@ class DestroyNode(BaseMaasAction):
                                                       site_design)
         for n in nodes:
             try:
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
 
                 if machine is None:
                     msg = "Could not locate machine for node {}".format(n.name)
@@ -308,6 +394,7 @@ class DestroyNode(BaseMaasAction):
 
                     try:
                         machine.release(erase_disk=True, quick_erase=True)
+                        self.inventory.invalidate(machine.resource_id)
                     except errors.DriverError:
                         msg = "Error Releasing node {}, skipping".format(
                             n.name)
@@ -318,28 +405,13 @@ class DestroyNode(BaseMaasAction):
                         continue
 
                     # node release with erase disk will take sometime monitor it
-                    attempts = 0
-                    max_attempts = (
-                        config.config_mgr.conf.timeouts.destroy_node
-                        * 60) // config.config_mgr.conf.maasdriver.poll_interval
-
-                    while (attempts < max_attempts
-                            and (not machine.status_name.startswith('Ready')
-                                 and not
-                                 machine.status_name.startswith('Failed'))):
-                        attempts = attempts + 1
-                        time.sleep(
-                            config.config_mgr.conf.maasdriver.poll_interval)
-                        try:
-                            machine.refresh()
-                            self.logger.debug(
-                                "Polling node {} status attempt {:d} of {:d}: {}"
-                                .format(n.name, attempts, max_attempts,
-                                        machine.status_name))
-                        except Exception:
-                            self.logger.warning(
-                                "Error updating node {} status during release node, will re-attempt."
-                                .format(n.name))
+                    self.logger.debug(
+                        "Waiting for node {} release.".format(n.name))
+                    machine.status_name = self.status_watcher.wait_for_status(
+                        machine.resource_id,
+                        lambda s: s.startswith('Ready') or s.startswith('Failed'),
+                        config.config_mgr.conf.timeouts.destroy_node * 60
+                    ) or machine.status_name
                     if machine.status_name.startswith('Ready'):
                         msg = "Node {} released and disk erased.".format(
                             n.name)
@@ -378,6 +450,7 @@ class DestroyNode(BaseMaasAction):
                     pass
 
                 machine.delete()
+                self.inventory.invalidate(machine.resource_id)
                 msg = "Deleted Node: {} in status: {}.".format(
                     n.name, machine.status_name)
                 self.logger.info(msg)
@@ -1090,7 +1163,8 @@ class IdentifyNode(BaseMaasAction):
 
         for n in nodes:
             try:
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
                 if machine is None:
                     self.task.failure(focus=n.get_id())
                     self.task.add_status_msg(
@@ -1100,6 +1174,7 @@ class IdentifyNode(BaseMaasAction):
                         ctx_type='node')
                 elif type(machine) == maas_machine.Machine:
                     machine.update_identity(n, domain=n.get_domain(site_design))
+                    self.inventory.invalidate(machine.resource_id)
                     msg = "Node %s identified in MaaS" % n.name
                     self.logger.debug(msg)
                     self.task.add_status_msg(
@@ -1145,8 +1220,7 @@ class ConfigureHardware(BaseMaasAction):
 
     def start(self):
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            self.inventory.get_machines()
         except Exception as ex:
             self.logger.debug("Error accessing the MaaS API.", exc_info=ex)
             self.task.set_status(hd_fields.TaskStatus.Complete)
@@ -1178,12 +1252,23 @@ class ConfigureHardware(BaseMaasAction):
         nodes = self.orchestrator.process_node_filter(self.task.node_filter,
                                                       site_design)
 
+        # Nodes commissioned by other subtasks of the driver task share a
+        # collector, so results are collected for all of them at once
+        result_collector = self.result_collector
+        if result_collector is None:
+            result_collector = ResultCollector(
+                self.status_watcher, ConfigureHardware.complete_commissioning)
+
+        # Futures of nodes being commissioned
+        commissioning = dict()
+
         # TODO(sh8121att): Better way of representing the node statuses than static strings
         for n in nodes:
             try:
                 self.logger.debug(
                     "Locating node %s for commissioning" % (n.name))
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
                 if type(machine) == maas_rack.RackController:
                     msg = "Located node %s in MaaS as rack controller. Skipping." % (
                         n.name)
@@ -1200,58 +1285,17 @@ class ConfigureHardware(BaseMaasAction):
                             "Located node %s in MaaS, starting commissioning" %
                             (n.name))
                         machine.commission()
+                        self.inventory.invalidate(machine.resource_id)
 
-                        # Poll machine status
-                        attempts = 0
-                        max_attempts = (
+                        # Wait for commissioning to complete
+                        self.logger.debug(
+                            "Waiting for node %s commissioning." % (n.name))
+                        result_future = result_collector.watch(
+                            machine.resource_id,
+                            lambda s: s == 'Ready' or s.startswith('Failed'),
                             config.config_mgr.conf.timeouts.configure_hardware
-                            * 60
-                        ) // config.config_mgr.conf.maasdriver.poll_interval
-
-                        while (attempts < max_attempts
-                               and (machine.status_name != 'Ready'
-                                    and not
-                                    machine.status_name.startswith('Failed'))):
-                            attempts = attempts + 1
-                            time.sleep(config.config_mgr.conf.maasdriver.
-                                       poll_interval)
-                            try:
-                                machine.refresh()
-                                self.logger.debug(
-                                    "Polling node %s status attempt %d of %d: %s"
-                                    % (n.name, attempts, max_attempts,
-                                       machine.status_name))
-                            except Exception:
-                                self.logger.warning(
-                                    "Error updating node %s status during commissioning, will re-attempt."
-                                    % (n.name),
-                                    exc_info=True)
-                        if machine.status_name == 'Ready':
-                            msg = "Node %s commissioned." % (n.name)
-                            self.logger.info(msg)
-                            self.task.add_status_msg(
-                                msg=msg,
-                                error=False,
-                                ctx=n.name,
-                                ctx_type='node')
-                            self.task.success(focus=n.get_id())
-                            self.collect_build_data(machine)
-                        else:
-                            msg = "Node %s failed commissioning." % (n.name)
-                            self.logger.info(msg)
-                            self.task.add_status_msg(
-                                msg=msg,
-                                error=True,
-                                ctx=n.name,
-                                ctx_type='node')
-                            self.task.failure(focus=n.get_id())
-                        self._add_detail_logs(
-                            n,
-                            machine,
-                            'commission',
-                            result_type='commissioning')
-                        self._add_detail_logs(
-                            n, machine, 'testing', result_type='testing')
+                            * 60, (self, n, machine))
+                        commissioning[result_future] = n
                     elif machine.status_name in ['Commissioning', 'Testing']:
                         msg = "Located node %s in MaaS, node already being commissioned. Skipping..." % (
                             n.name)
@@ -1291,13 +1335,96 @@ class ConfigureHardware(BaseMaasAction):
                     msg=msg, error=True, ctx=n.name, ctx_type='node')
                 self.task.failure(focus=n.get_id())
 
+        for f in concurrent.futures.as_completed(commissioning.keys()):
+            if f.exception() is not None:
+                n = commissioning[f]
+                msg = "Error commissioning node %s: %s" % (
+                    n.name, str(f.exception()))
+                self.logger.warning(msg)
+                self.task.add_status_msg(
+                    msg=msg, error=True, ctx=n.name, ctx_type='node')
+                self.task.failure(focus=n.get_id())
+
         self.task.set_status(hd_fields.TaskStatus.Complete)
         self.task.save()
         return
 
+    @staticmethod
+    def complete_commissioning(commissioned):
+        """Record the result of commissioning a batch of nodes.
+
+        The nodes may belong to the subtasks of different ConfigureHardware
+        actions. The MaaS task results of all the nodes are fetched with a
+        single request and saved with their build data in a single insert.
+        Each subtask adds one status message per node and is saved once.
+        MaaS has no bulk form of the machine details call, so the build data
+        of each node is still fetched with a request per node.
+
+        :param commissioned: list of ((ConfigureHardware,
+                             objects.BaremetalNode, models.machine.Machine),
+                             status name) tuples
+        """
+        stages = {'commissioning': 'commission', 'testing': 'testing'}
+        build_data = []
+        actions = []
+
+        for ((action, n, machine), status) in commissioned:
+            if action not in actions:
+                actions.append(action)
+            if status is not None:
+                machine.status_name = status
+            if machine.status_name == 'Ready':
+                node_build_data = action.get_build_data(machine)
+                build_data.extend(node_build_data)
+                msg = "Node %s commissioned, saving %d build data elements." % (
+                    n.name, len(node_build_data))
+                action.logger.info(msg)
+                action.task.add_status_msg(
+                    msg=msg, error=False, ctx=n.name, ctx_type='node')
+                action.task.success(focus=n.get_id())
+            else:
+                msg = "Node %s failed commissioning." % (n.name)
+                action.logger.info(msg)
+                action.task.add_status_msg(
+                    msg=msg, error=True, ctx=n.name, ctx_type='node')
+                action.task.failure(focus=n.get_id())
+
+        try:
+            result_details = get_node_results(
+                [machine for ((_, _, machine), _) in commissioned], stages)
+            for action in actions:
+                build_data.extend(
+                    action._get_result_build_data(
+                        result_details,
+                        [(n, machine) for ((a, n, machine), _) in commissioned
+                         if a is action], stages))
+            actions[0].state_manager.post_build_data(build_data)
+            for action in actions:
+                action._link_detail_logs()
+        except Exception as ex:
+            actions[0].logger.error(
+                "Error saving commissioning results for %s" % ", ".join(
+                    [n.name for ((_, n, _), _) in commissioned]),
+                exc_info=ex)
+
     def collect_build_data(self, machine):
         """Collect MaaS build data after commissioning."""
+        build_data = self.get_build_data(machine)
+        self.task.add_status_msg(
+            msg="Saving %d build data elements." % len(build_data),
+            error=False,
+            ctx=machine.hostname,
+            ctx_type='node')
+        self.state_manager.post_build_data(build_data)
+
+    def get_build_data(self, machine):
+        """Get the MaaS build data of a machine after commissioning.
+
+        :param machine: instance of models.machine.Machine
+        :return: list of objects.BuildData
+        """
         self.logger.debug("Collecting build data for %s" % machine.hostname)
+        build_data = []
         try:
             data = machine.get_details()
             if data:
@@ -1313,18 +1440,12 @@ class ConfigureHardware(BaseMaasAction):
                         collected_date=datetime.utcnow(),
                         data_format=df,
                         data_element=d.decode())
-                    self.logger.debug(
-                        "Saving build data from generator %s" % t)
-                    self.state_manager.post_build_data(bd)
-                    self.task.add_status_msg(
-                        msg="Saving build data element.",
-                        error=False,
-                        ctx=machine.hostname,
-                        ctx_type='node')
+                    build_data.append(bd)
         except Exception as ex:
             self.logger.error(
                 "Error collecting node build data for %s" % machine.hostname,
                 exc_info=ex)
+        return build_data
 
 
 class ApplyNodeNetworking(BaseMaasAction):
@@ -1332,8 +1453,7 @@ class ApplyNodeNetworking(BaseMaasAction):
 
     def start(self):
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            self.inventory.get_machines()
 
             fabrics = maas_fabric.Fabrics(self.maas_client)
             fabrics.refresh()
@@ -1377,7 +1497,8 @@ class ApplyNodeNetworking(BaseMaasAction):
                 self.logger.debug(
                     "Locating node %s for network configuration" % (n.name))
 
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
 
                 if type(machine) is maas_rack.RackController:
                     msg = ("Node %s is a rack controller, skipping deploy action." %
@@ -1398,6 +1519,7 @@ class ApplyNodeNetworking(BaseMaasAction):
                         self.logger.debug(msg)
                         try:
                             machine.release()
+                            self.inventory.invalidate(machine.resource_id)
                             machine.refresh()
                         except errors.DriverError:
                             msg = (
@@ -1700,8 +1822,7 @@ class ApplyNodePlatform(BaseMaasAction):
 
     def start(self):
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            self.inventory.get_machines()
 
             tag_list = maas_tag.Tags(self.maas_client)
             tag_list.refresh()
@@ -1741,7 +1862,8 @@ class ApplyNodePlatform(BaseMaasAction):
                 self.logger.debug(
                     "Locating node %s for platform configuration" % (n.name))
 
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
 
                 if machine is None:
                     msg = "Could not locate machine for node %s" % n.name
@@ -1888,8 +2010,7 @@ class ApplyNodeStorage(BaseMaasAction):
 
     def start(self):
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            self.inventory.get_machines()
         except Exception as ex:
             self.logger.debug("Error accessing the MaaS API.", exc_info=ex)
             self.task.set_status(hd_fields.TaskStatus.Complete)
@@ -1926,7 +2047,8 @@ class ApplyNodeStorage(BaseMaasAction):
                 self.logger.debug(
                     "Locating node %s for storage configuration" % (n.name))
 
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
 
                 if machine is None:
                     msg = "Could not locate machine for node %s" % n.name
@@ -1974,6 +2096,7 @@ class ApplyNodeStorage(BaseMaasAction):
                 self.logger.debug(msg)
                 self.task.add_status_msg(
                     msg=msg, error=False, ctx=n.name, ctx_type='node')
+                machine.prefetch('block_devices', 'volume_groups')
                 machine.reset_storage_config()
 
                 (root_dev, root_block) = n.find_fs_block_device('/')
@@ -2243,9 +2366,119 @@ class DeployNode(BaseMaasAction):
     """Action to write persistent OS to node."""
 
     def start(self):
+        deployments = self.begin_deployments()
+
+        if deployments is None:
+            return
+
+        for (n, machine) in deployments:
+            self.logger.debug("Waiting for node %s deployment." % (n.name))
+            status = self.status_watcher.wait_for_status(
+                machine.resource_id, DeployNode.deployment_done,
+                config.config_mgr.conf.timeouts.deploy_node * 60)
+            self.finish_deployment(n, machine, status)
+
+        self.task.set_status(hd_fields.TaskStatus.Complete)
+        self.task.save()
+
+        return
+
+    def start_async(self, executor):
+        """Start the action without holding a thread while nodes deploy.
+
+        Deployment of each node is started on ``executor``. Waiting for
+        the deployment to complete is left to the status watcher, which
+        schedules the rest of the node's work back on ``executor``.
+
+        :param executor: instance of concurrent.futures.Executor
+        :return: a concurrent.futures.Future completed with the action
+        """
+        action_future = concurrent.futures.Future()
+
+        def begin():
+            deployments = self.begin_deployments()
+
+            if deployments is None:
+                action_future.set_result(None)
+            elif not deployments:
+                self.task.set_status(hd_fields.TaskStatus.Complete)
+                self.task.save()
+                action_future.set_result(None)
+            else:
+                pending = _Countdown(len(deployments))
+                for (n, machine) in deployments:
+                    self.logger.debug(
+                        "Waiting for node %s deployment." % (n.name))
+                    status_future = self.status_watcher.watch(
+                        machine.resource_id, DeployNode.deployment_done,
+                        config.config_mgr.conf.timeouts.deploy_node * 60)
+                    status_future.add_done_callback(
+                        functools.partial(resume, n, machine, pending))
+
+        def resume(n, machine, pending, status_future):
+            # Called on the status watcher's poll thread, so the rest of
+            # the node's work must not run here
+            try:
+                work = functools.partial(finish, n, machine, pending,
+                                         status_future.result())
+            except Exception as ex:
+                work = functools.partial(fail, n, pending, ex)
+
+            try:
+                executor.submit(work)
+            except RuntimeError:
+                # The executor was shut down, finish on a thread of its own
+                threading.Thread(
+                    target=work, name='maas-deploy-finish',
+                    daemon=True).start()
+
+        def fail(n, pending, ex):
+            msg = "Error waiting for deployment of node %s: %s" % (
+                n.name, str(ex))
+            self.logger.error(msg)
+            self.task.add_status_msg(
+                msg=msg, error=True, ctx=n.name, ctx_type='node')
+            self.task.failure(focus=n.get_id())
+            complete(pending)
+
+        def finish(n, machine, pending, status):
+            try:
+                self.finish_deployment(n, machine, status)
+            except Exception as ex:
+                msg = "Error completing deployment of node %s: %s" % (
+                    n.name, str(ex))
+                self.logger.error(msg)
+                self.task.failure(focus=n.get_id())
+            complete(pending)
+
+        def complete(pending):
+            if pending.count_down():
+                self.task.set_status(hd_fields.TaskStatus.Complete)
+                self.task.save()
+                action_future.set_result(None)
+
+        def begin_done(begin_future):
+            if begin_future.exception() is not None:
+                action_future.set_exception(begin_future.exception())
+
+        executor.submit(begin).add_done_callback(begin_done)
+
+        return action_future
+
+    @staticmethod
+    def deployment_done(status_name):
+        """Check if a MaaS status name ends a deployment."""
+        return (status_name.startswith('Deployed')
+                or status_name.startswith('Failed'))
+
+    def begin_deployments(self):
+        """Start deployment of the nodes in this task.
+
+        :return: a list of (node, machine) tuples for each node being deployed
+                 or None if the action failed before any nodes were processed
+        """
         try:
-            machine_list = maas_machine.Machines(self.maas_client)
-            machine_list.refresh()
+            machine_list = self.inventory.get_machines()
         except Exception as ex:
             self.logger.debug("Error accessing the MaaS API.", exc_info=ex)
             self.task.set_status(hd_fields.TaskStatus.Complete)
@@ -2277,9 +2510,12 @@ class DeployNode(BaseMaasAction):
         nodes = self.orchestrator.process_node_filter(self.task.node_filter,
                                                       site_design)
 
+        deployments = []
+
         for n in nodes:
             try:
-                machine = find_node_in_maas(self.maas_client, n)
+                machine = find_node_in_maas(
+                    self.maas_client, n, inventory=self.inventory)
 
                 if type(machine) is maas_rack.RackController:
                     msg = "Skipping configuration of rack controller %s." % n.name
@@ -2301,7 +2537,9 @@ class DeployNode(BaseMaasAction):
                 elif machine.status_name == 'Ready':
                     msg = "Acquiring node %s for deployment" % (n.name)
                     self.logger.info(msg)
-                    machine = machine_list.acquire_node(n.name)
+                    machine = machine_list.acquire_node(
+                        n.name, refresh=False)
+                    self.inventory.invalidate(machine.resource_id)
                     self.task.add_status_msg(
                         msg=msg, error=False, ctx=n.name, ctx_type='node')
                 else:
@@ -2392,6 +2630,7 @@ class DeployNode(BaseMaasAction):
                     platform=n.image,
                     kernel=n.kernel,
                     user_data=user_data_string)
+                self.inventory.invalidate(machine.resource_id)
             except errors.DriverError:
                 msg = "Error deploying node %s, skipping" % n.name
                 self.logger.warning(msg)
@@ -2400,50 +2639,56 @@ class DeployNode(BaseMaasAction):
                 self.task.failure(focus=n.get_id())
                 continue
 
-            attempts = 0
-            max_attempts = (
-                config.config_mgr.conf.timeouts.deploy_node
-                * 60) // config.config_mgr.conf.maasdriver.poll_interval
+            deployments.append((n, machine))
 
-            while (attempts < max_attempts
-                   and (not machine.status_name.startswith('Deployed')
-                        and not machine.status_name.startswith('Failed'))):
-                attempts = attempts + 1
-                time.sleep(config.config_mgr.conf.maasdriver.poll_interval)
-                try:
-                    machine.refresh()
-                    self.logger.debug(
-                        "Polling node %s status attempt %d of %d: %s" %
-                        (n.name, attempts, max_attempts, machine.status_name))
-                except Exception:
-                    self.logger.warning(
-                        "Error updating node %s status during commissioning, will re-attempt."
-                        % (n.name))
-            if machine.status_name.startswith('Deployed'):
-                msg = "Node %s deployed" % (n.name)
-                self.logger.info(msg)
-                self.task.add_status_msg(
-                    msg=msg, error=False, ctx=n.name, ctx_type='node')
-                self.task.success(focus=n.get_id())
-            elif machine.status_name.startswith('Failed'):
-                msg = "Node %s deployment failed" % (n.name)
-                self.logger.info(msg)
-                self.task.add_status_msg(
-                    msg=msg, error=True, ctx=n.name, ctx_type='node')
-                self.task.failure(focus=n.get_id())
-            else:
-                msg = "Node %s deployment timed out" % (n.name)
-                self.logger.warning(msg)
-                self.task.add_status_msg(
-                    msg=msg, error=True, ctx=n.name, ctx_type='node')
-                self.task.failure(focus=n.get_id())
-            self._add_detail_logs(n, machine, 'deploy', result_type='deploy')
-        self.task.set_status(hd_fields.TaskStatus.Complete)
-        self.task.save()
+        return deployments
 
-        return
+    def finish_deployment(self, n, machine, status):
+        """Record the result of deploying a node.
 
-def find_node_in_maas(maas_client, node_model):
+        :param n: instance of objects.BaremetalNode being deployed
+        :param machine: instance of models.machine.Machine for the node
+        :param status: last known MaaS status name of the machine
+        """
+        if status is not None:
+            machine.status_name = status
+
+        if machine.status_name.startswith('Deployed'):
+            msg = "Node %s deployed" % (n.name)
+            self.logger.info(msg)
+            self.task.add_status_msg(
+                msg=msg, error=False, ctx=n.name, ctx_type='node')
+            self.task.success(focus=n.get_id())
+        elif machine.status_name.startswith('Failed'):
+            msg = "Node %s deployment failed" % (n.name)
+            self.logger.info(msg)
+            self.task.add_status_msg(
+                msg=msg, error=True, ctx=n.name, ctx_type='node')
+            self.task.failure(focus=n.get_id())
+        else:
+            msg = "Node %s deployment timed out" % (n.name)
+            self.logger.warning(msg)
+            self.task.add_status_msg(
+                msg=msg, error=True, ctx=n.name, ctx_type='node')
+            self.task.failure(focus=n.get_id())
+        self._add_detail_logs(n, machine, 'deploy', result_type='deploy')
+
+
+class _Countdown(object):
+    """Thread-safe countdown of outstanding work."""
+
+    def __init__(self, count):
+        self.count = count
+        self.lock = threading.Lock()
+
+    def count_down(self):
+        """Decrement the count, returning True when it reaches zero."""
+        with self.lock:
+            self.count = self.count - 1
+            return self.count == 0
+
+
+def find_node_in_maas(maas_client, node_model, inventory=None):
     """Find a node in MAAS matching the node_model.
 
     Note that the returned Machine may be a simple Machine or
@@ -2451,17 +2696,41 @@ def find_node_in_maas(maas_client, node_model):
 
     :param maas_client: instance of an active session to MAAS
     :param node_model: instance of objects.Node to match
+    :param inventory: optional instance of inventory.MachineInventory to
+                      search rather than querying MaaS
     :returns: instance of maasdriver.models.Machine
     """
+    if inventory is None:
+        inventory = MachineInventory(maas_client, ttl=0)
 
-    machine_list = maas_machine.Machines(maas_client)
-    machine_list.refresh()
+    machine_list = inventory.get_machines()
     machine = machine_list.identify_baremetal_node(node_model)
 
     if not machine:
         # If node isn't found a normal node, check rack controllers
-        rackd_list = maas_rack.RackControllers(maas_client)
-        rackd_list.refresh()
+        rackd_list = inventory.get_rack_controllers()
         machine = rackd_list.identify_baremetal_node(node_model)
 
     return machine
+
+
+def get_node_results(machines, stages):
+    """Fetch the MaaS task results of ``machines`` in a single request.
+
+    :param machines: list of maasdriver.models.Machine
+    :param stages: dict of MaaS result type to the stage name recorded
+                   for those results
+    :returns: instance of maasdriver.models.node_results.NodeResults
+    """
+    if len(stages) == 1:
+        result_type = list(stages.keys())[0]
+    else:
+        result_type = 'all'
+
+    result_details = maas_nr.NodeResults(
+        machines[0].api_client,
+        system_id_list=[m.resource_id for m in machines],
+        result_type=result_type)
+    result_details.refresh()
+
+    return result_details
@@ -14,13 +14,49 @@
 """Client for submitting authenticated requests to MaaS API."""
 
 import logging
+import threading
+import time
 
 from oauthlib import oauth1
 import requests
+import requests.adapters as req_adapters
 import requests.auth as req_auth
 import base64
 
 import drydock_provisioner.error as errors
+import drydock_provisioner.config as config
+
+from drydock_provisioner.drivers.node.maasdriver.throttle import AdaptiveThrottle
+
+# Process-wide request factories keyed by (base_url, apikey)
+_shared_factories = dict()
+_shared_factories_lock = threading.Lock()
+
+
+def get_shared_request_factory():
+    """Return the process-wide MaasRequestFactory for the configured MaaS.
+
+    A single instance is kept per MaaS URL and API key so that all
+    callers reuse its pooled connections.
+    """
+    conf = config.config_mgr.conf.maasdriver
+    key = (conf.maas_api_url, conf.maas_api_key)
+
+    with _shared_factories_lock:
+        factory = _shared_factories.get(key)
+        if factory is None:
+            factory = MaasRequestFactory(
+                conf.maas_api_url,
+                conf.maas_api_key,
+                timeout=(conf.http_connect_timeout, conf.http_read_timeout),
+                pool_connections=conf.http_pool_connections,
+                pool_maxsize=conf.http_pool_maxsize,
+                keep_alive=conf.http_keep_alive,
+                throttle_retries=conf.http_throttle_retries,
+                throttle_backoff=conf.http_throttle_backoff)
+            _shared_factories[key] = factory
+
+    return factory
 
 
 class MaasOauth(req_auth.AuthBase):
@@ -53,14 +89,64 @@ class MaasOauth(req_auth.AuthBase):
 
 
 class MaasRequestFactory(object):
-    def __init__(self, base_url, apikey):
+    """Factory for authenticated requests to the MaaS API.
+
+    Instances are safe to share between threads. Connections to MaaS are
+    pooled and kept alive between requests. The number of requests in flight
+    adapts to MaaS load: it is reduced when MaaS responds with HTTP 429 or
+    503, and those requests are retried after a backoff.
+
+    :param base_url: The MaaS URL, ending in /MAAS
+    :param apikey: The MaaS API key
+    :param timeout: Default (connect, read) timeout in seconds for requests
+    :param pool_connections: Number of per-host connection pools to cache
+    :param pool_maxsize: Maximum number of connections to each host. Requests
+                         beyond this wait for a free connection.
+    :param keep_alive: Whether to keep connections open between requests
+    :param throttle_retries: Number of times to retry a request MaaS throttled
+    :param throttle_backoff: Base backoff in seconds between retries of a
+                             throttled request
+    """
+
+    # HTTP status codes MaaS uses to signal it is overloaded
+    THROTTLE_CODES = [429, 503]
+    # A 503 may be returned after MaaS applied a request, so only requests
+    # that are safe to repeat are retried on it. A 429 is returned before
+    # the request is processed, so any request is retried on it.
+    IDEMPOTENT_METHODS = ['GET', 'HEAD', 'OPTIONS']
+    MAX_BACKOFF = 60
+
+    def __init__(self,
+                 base_url,
+                 apikey,
+                 timeout=(2, 30),
+                 pool_connections=10,
+                 pool_maxsize=16,
+                 keep_alive=True,
+                 throttle_retries=5,
+                 throttle_backoff=1):
         # The URL in the config should end in /MAAS/, but the api is behind /MAAS/api/2.0/
         self.base_url = base_url + "/api/2.0/"
         self.apikey = apikey
+        self.timeout = timeout
 
         self.signer = MaasOauth(apikey)
         self.http_session = requests.Session()
 
+        adapter = req_adapters.HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=True)
+        self.http_session.mount('http://', adapter)
+        self.http_session.mount('https://', adapter)
+
+        if not keep_alive:
+            self.http_session.headers['Connection'] = 'close'
+
+        self.throttle = AdaptiveThrottle(max_limit=pool_maxsize)
+        self.throttle_retries = throttle_retries
+        self.throttle_backoff = throttle_backoff
+
         # TODO(sh8121att) Get logger name from config
         self.logger = logging.getLogger('drydock')
 
@@ -76,6 +162,14 @@ class MaasRequestFactory(object):
     def put(self, endpoint, **kwargs):
         return self._send_request('PUT', endpoint, **kwargs)
 
+    def get_metrics(self):
+        """Return a dict of metrics on requests to MaaS.
+
+        Includes the request queue depth, requests in flight, the current
+        concurrency limit, count of throttle events and average latency.
+        """
+        return self.throttle.get_metrics()
+
     def test_connectivity(self):
         try:
             resp = self.get('version/')
@@ -157,10 +251,9 @@ class MaasRequestFactory(object):
         elif 'op' in kwargs.keys():
             kwargs.pop('op')
 
-        # TODO(sh8121att) timeouts should be configurable
         timeout = kwargs.pop('timeout', None)
         if timeout is None:
-            timeout = (2, 30)
+            timeout = self.timeout
 
         request = requests.Request(
             method=method,
@@ -170,9 +263,30 @@ class MaasRequestFactory(object):
             params=params,
             **kwargs)
 
-        prepared_req = self.http_session.prepare_request(request)
+        attempts = 0
+        while True:
+            # Prepare on each attempt so the request is signed again
+            prepared_req = self.http_session.prepare_request(request)
+            resp = self._send_throttled(prepared_req, timeout)
+
+            if not self._retry_throttled(prepared_req, resp):
+                break
 
-        resp = self.http_session.send(prepared_req, timeout=timeout)
+            if attempts >= self.throttle_retries:
+                self.logger.debug(
+                    "MaaS throttled request %s %s, retries exhausted." %
+                    (prepared_req.method, prepared_req.url))
+                raise errors.TransientDriverError(
+                    "MAAS Error: %s - %s" % (resp.status_code, resp.text))
+
+            attempts = attempts + 1
+            backoff = self._get_backoff(resp, attempts)
+            self.logger.debug(
+                "MaaS throttled request %s %s, retry %d of %d in %s seconds. "
+                "Metrics: %s" % (prepared_req.method, prepared_req.url,
+                                 attempts, self.throttle_retries, backoff,
+                                 str(self.get_metrics())))
+            time.sleep(backoff)
 
         if resp.status_code >= 400:
             self.logger.debug(
@@ -182,3 +296,38 @@ class MaasRequestFactory(object):
             raise errors.DriverError(
                 "MAAS Error: %s - %s" % (resp.status_code, resp.text))
         return resp
+
+    def _retry_throttled(self, prepared_req, resp):
+        """Return whether a request MaaS responded to with ``resp`` can be retried."""
+        if resp.status_code == 429:
+            return True
+        if resp.status_code in self.THROTTLE_CODES:
+            return prepared_req.method in self.IDEMPOTENT_METHODS
+        return False
+
+    def _send_throttled(self, prepared_req, timeout):
+        """Send a request once the throttle allows it."""
+        self.throttle.acquire()
+        start = time.monotonic()
+        try:
+            resp = self.http_session.send(prepared_req, timeout=timeout)
+        except requests.Timeout:
+            self.throttle.release(throttled=True)
+            raise
+        except Exception:
+            self.throttle.release()
+            raise
+
+        self.throttle.release(
+            latency=time.monotonic() - start,
+            throttled=resp.status_code in self.THROTTLE_CODES)
+        return resp
+
+    def _get_backoff(self, resp, attempt):
+        """Seconds to wait before retrying a throttled request."""
+        retry_after = resp.headers.get('Retry-After')
+        try:
+            backoff = float(retry_after)
+        except (TypeError, ValueError):
+            backoff = self.throttle_backoff * (2**(attempt - 1))
+        return min(backoff, self.MAX_BACKOFF)
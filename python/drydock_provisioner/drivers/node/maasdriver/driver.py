@@ -13,6 +13,7 @@
 """Task driver for completing node provisioning with Canonical MaaS 2.2+."""
 
 import logging
+import threading
 import uuid
 import concurrent.futures
 
@@ -23,8 +24,11 @@ import drydock_provisioner.objects.fields as hd_fields
 import drydock_provisioner.config as config
 
 from drydock_provisioner.drivers.node.driver import NodeDriver
-from drydock_provisioner.drivers.node.maasdriver.api_client import MaasRequestFactory
+from drydock_provisioner.drivers.node.maasdriver.api_client import get_shared_request_factory
 from drydock_provisioner.drivers.node.maasdriver.models.boot_resource import BootResources
+from drydock_provisioner.drivers.node.maasdriver.inventory import MachineInventory
+from drydock_provisioner.drivers.node.maasdriver.result_collector import ResultCollector
+from drydock_provisioner.drivers.node.maasdriver.status_watcher import MachineStatusWatcher
 
 from .actions.node import ValidateNodeServices
 from .actions.node import CreateStorageTemplate
@@ -53,6 +57,46 @@ class MaasNodeDriver(NodeDriver):
             'poll_interval',
             default=10,
             help='Polling interval for querying MaaS status in seconds'),
+        cfg.IntOpt(
+            'inventory_ttl',
+            default=60,
+            help='Time in seconds a MaaS machine inventory snapshot shared '
+            'by the subtasks of a task is considered current'),
+        cfg.IntOpt(
+            'http_connect_timeout',
+            default=2,
+            help='Timeout for connecting to the MaaS API in seconds'),
+        cfg.IntOpt(
+            'http_read_timeout',
+            default=30,
+            help='Timeout for reading MaaS API responses in seconds'),
+        cfg.IntOpt(
+            'http_pool_connections',
+            default=10,
+            help='Number of per-host HTTP connection pools to cache'),
+        cfg.IntOpt(
+            'http_pool_maxsize',
+            default=16,
+            help='Maximum number of concurrent connections to the MaaS API'),
+        cfg.BoolOpt(
+            'http_keep_alive',
+            default=True,
+            help='Keep HTTP connections to the MaaS API open for reuse'),
+        cfg.IntOpt(
+            'http_throttle_retries',
+            default=5,
+            help='Number of times to retry a MaaS API request rejected '
+            'because MaaS is overloaded'),
+        cfg.IntOpt(
+            'http_throttle_backoff',
+            default=1,
+            help='Base backoff in seconds before retrying a MaaS API request '
+            'rejected because MaaS is overloaded'),
+        cfg.BoolOpt(
+            'async_waits',
+            default=False,
+            help='Release worker threads while actions wait on MaaS status '
+            'changes, resuming the action when the status is reached'),
     ]
 
     driver_name = 'maasdriver'
@@ -101,6 +145,19 @@ class MaasNodeDriver(NodeDriver):
         self.logger = logging.getLogger(
             cfg.CONF.logging.nodedriver_logger_name)
 
+        self.status_watcher = None
+        self.status_watcher_lock = threading.Lock()
+
+    def get_status_watcher(self):
+        """Return the status watcher shared by all tasks of this driver."""
+        with self.status_watcher_lock:
+            if self.status_watcher is None:
+                self.status_watcher = MachineStatusWatcher(
+                    get_shared_request_factory(),
+                    poll_interval=config.config_mgr.conf.maasdriver.
+                    poll_interval)
+            return self.status_watcher
+
     def execute_task(self, task_id):
         # actions that should be threaded for execution
         threaded_actions = [
@@ -149,12 +206,24 @@ class MaasNodeDriver(NodeDriver):
             else:
                 target_nodes = self.orchestrator.get_target_nodes(task)
 
+            maas_client = get_shared_request_factory()
+
+            # All subtasks share a single snapshot of the MaaS inventory
+            inventory = MachineInventory(
+                maas_client,
+                ttl=config.config_mgr.conf.maasdriver.inventory_ttl)
+
+            # Nodes finishing commissioning in the same polling round have
+            # their results collected together across subtasks
+            result_collector = None
+            if task.action == hd_fields.OrchestratorAction.ConfigureHardware:
+                result_collector = ResultCollector(
+                    self.get_status_watcher(),
+                    ConfigureHardware.complete_commissioning)
+
             with concurrent.futures.ThreadPoolExecutor(max_workers=16) as e:
                 subtask_futures = dict()
                 for n in target_nodes:
-                    maas_client = MaasRequestFactory(
-                        config.config_mgr.conf.maasdriver.maas_api_url,
-                        config.config_mgr.conf.maasdriver.maas_api_key)
                     nf = self.orchestrator.create_nodefilter_from_nodelist([n])
                     subtask = self.orchestrator.create_task(
                         design_ref=task.design_ref,
@@ -167,9 +236,16 @@ class MaasNodeDriver(NodeDriver):
                         subtask,
                         self.orchestrator,
                         self.state_manager,
-                        maas_client=maas_client)
-                    subtask_futures[subtask.get_id().bytes] = e.submit(
-                        action.start)
+                        maas_client=maas_client,
+                        inventory=inventory,
+                        status_watcher=self.get_status_watcher(),
+                        result_collector=result_collector)
+                    if config.config_mgr.conf.maasdriver.async_waits:
+                        subtask_futures[subtask.get_id().bytes] = \
+                            action.start_async(e)
+                    else:
+                        subtask_futures[subtask.get_id().bytes] = e.submit(
+                            action.start)
 
                 timeout = action_timeouts.get(
                     task.action,
@@ -196,9 +272,7 @@ class MaasNodeDriver(NodeDriver):
             task.align_result()
         else:
             try:
-                maas_client = MaasRequestFactory(
-                    config.config_mgr.conf.maasdriver.maas_api_url,
-                    config.config_mgr.conf.maasdriver.maas_api_key)
+                maas_client = get_shared_request_factory()
                 action = self.action_class_map.get(task.action, None)(
                     task,
                     self.orchestrator,
@@ -223,9 +297,7 @@ class MaasNodeDriver(NodeDriver):
 
     def get_available_images(self):
         """Return images available in MAAS."""
-        maas_client = MaasRequestFactory(
-            config.config_mgr.conf.maasdriver.maas_api_url,
-            config.config_mgr.conf.maasdriver.maas_api_key)
+        maas_client = get_shared_request_factory()
 
         br = BootResources(maas_client)
         br.refresh()
@@ -237,9 +309,7 @@ class MaasNodeDriver(NodeDriver):
 
         :param image_name: str image name (e.g. 'xenial')
         """
-        maas_client = MaasRequestFactory(
-            config.config_mgr.conf.maasdriver.maas_api_url,
-            config.config_mgr.conf.maasdriver.maas_api_key)
+        maas_client = get_shared_request_factory()
 
         br = BootResources(maas_client)
         br.refresh()
@@ -0,0 +1,136 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared, time-bounded snapshot of the MaaS machine inventory."""
+
+import logging
+import threading
+import time
+
+import drydock_provisioner.drivers.node.maasdriver.models.machine as maas_machine
+import drydock_provisioner.drivers.node.maasdriver.models.rack_controller as maas_rack
+
+
+class MachineInventory(object):
+    """A cache of the MaaS machine and rack controller collections.
+
+    A single instance is shared by all the subtasks of a driver task so
+    that the inventory is downloaded from MaaS once per ``ttl`` period
+    rather than once per node. Snapshots are never modified in place
+    by the inventory: a refresh or invalidation swaps in a new collection
+    so callers iterating an older snapshot are not disturbed.
+
+    :param api_client: An instance of api_client.MaasRequestFactory
+    :param ttl: Number of seconds a snapshot is considered current. A
+                ``ttl`` of 0 refreshes the snapshot on every access.
+    """
+
+    def __init__(self, api_client, ttl=0):
+        self.api_client = api_client
+        self.ttl = ttl
+        self.logger = logging.getLogger('drydock.nodedriver.maasdriver')
+
+        self._lock = threading.RLock()
+        # Keyed by collection class, values are [collection, snapshot time]
+        self._snapshots = dict()
+        # system_ids to be reloaded from MaaS on next access
+        self._stale_ids = set()
+
+    def get_machines(self):
+        """Return the current snapshot of MaaS machines.
+
+        :return: instance of models.machine.Machines
+        """
+        return self._get_snapshot(maas_machine.Machines)
+
+    def get_rack_controllers(self):
+        """Return the current snapshot of MaaS rack controllers.
+
+        :return: instance of models.rack_controller.RackControllers
+        """
+        return self._get_snapshot(maas_rack.RackControllers)
+
+    def invalidate(self, system_id=None):
+        """Mark cached inventory as out of date.
+
+        Call after a change made to a machine in MaaS so that the next
+        access reloads it.
+
+        :param system_id: The MaaS system_id of the changed machine. If None,
+                          the whole inventory is discarded.
+        """
+        with self._lock:
+            if system_id is None:
+                self._snapshots.clear()
+                self._stale_ids.clear()
+            else:
+                self._stale_ids.add(system_id)
+
+    def _get_snapshot(self, collection_class):
+        with self._lock:
+            snapshot = self._snapshots.get(collection_class)
+
+            if snapshot is None or self._expired(snapshot[1]):
+                collection = collection_class(self.api_client)
+                collection.refresh()
+                snapshot = [collection, time.monotonic()]
+                self._snapshots[collection_class] = snapshot
+                self._stale_ids.difference_update(collection.resources.keys())
+            elif self._stale_ids:
+                self._reload_stale()
+
+            return snapshot[0]
+
+    def _expired(self, snapshot_time):
+        return (time.monotonic() - snapshot_time) >= self.ttl
+
+    def _reload_stale(self):
+        """Reload invalidated machines into copies of the cached snapshots."""
+        failed = set()
+
+        for snapshot in self._snapshots.values():
+            collection = snapshot[0]
+            stale = [i for i in self._stale_ids if collection.contains(i)]
+
+            if not stale:
+                continue
+
+            new_collection = collection.__class__(self.api_client)
+            new_collection.resources = dict(collection.resources)
+            new_collection.power_params_loaded = collection.power_params_loaded
+
+            for system_id in stale:
+                res = collection.collection_resource(
+                    self.api_client, resource_id=system_id)
+                try:
+                    res.refresh()
+                    # Power parameters are not part of the machine
+                    # representation, keep those already collected
+                    res.power_parameters = collection.select(
+                        system_id).power_parameters
+                    new_collection.resources[system_id] = res
+                except Exception as ex:
+                    # Keep the previous entry and leave the id stale so
+                    # the next access retries the reload
+                    self.logger.warning(
+                        "Could not reload %s, keeping previous inventory "
+                        "entry." % system_id,
+                        exc_info=ex)
+                    failed.add(system_id)
+
+            new_collection.reindex()
+            snapshot[0] = new_collection
+
+        # Ids that failed to reload stay stale, ids not present in any
+        # snapshot have nothing to reload
+        self._stale_ids = failed
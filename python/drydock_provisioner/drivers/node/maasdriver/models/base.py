@@ -20,6 +20,7 @@ augmented with operations specific to those resources
 import json
 import re
 import logging
+import threading
 
 import drydock_provisioner.error as errors
 
@@ -169,17 +170,21 @@ class ResourceCollectionBase(object):
     """A collection of MaaS resources.
 
     Rather than a simple list, we will key the collection on resource
-    ID for more efficient access.
+    ID for more efficient access. Hash indexes are also kept for the
+    attributes listed in ``index_fields`` so that queries on them
+    do not scan the whole collection.
 
     :param api_client: An instance of api_client.MaasRequestFactory
     """
 
     collection_url = ''
     collection_resource = ResourceBase
+    index_fields = []
 
     def __init__(self, api_client):
         self.api_client = api_client
         self.resources = {}
+        self.indexes = {f: {} for f in self.index_fields}
         self.logger = logging.getLogger('drydock.nodedriver.maasdriver')
 
     def interpolate_url(self):
@@ -228,6 +233,7 @@ class ResourceCollectionBase(object):
     def append(self, res):
         if isinstance(res, self.collection_resource):
             self.resources[res.resource_id] = res
+            self._index_resource(res)
 
     """
     Initialize or refresh the collection list from MaaS
@@ -246,8 +252,55 @@ class ResourceCollectionBase(object):
                     i = self.collection_resource.from_dict(self.api_client, o)
                     self.resources[i.resource_id] = i
 
+            self.reindex()
+
         return
 
+    def reindex(self):
+        """Rebuild the attribute indexes from the current resources.
+
+        Should be called if indexed attributes of resources in this
+        collection are changed in place.
+        """
+        self.indexes = {f: {} for f in self.index_fields}
+        for res in self.resources.values():
+            self._index_resource(res)
+
+    def _index_resource(self, res):
+        for f in self.index_fields:
+            index = self.indexes.setdefault(f, {})
+            for k in self._index_keys(res, f):
+                index.setdefault(k, []).append(res)
+
+    def _index_keys(self, res, field):
+        """Return the keys ``res`` should be indexed under for ``field``."""
+        return [str(self._query_value(res, field))]
+
+    def _query_value(self, res, field):
+        """Return the value of ``field`` on ``res`` used for queries."""
+        return getattr(res, field, None)
+
+    def _indexed_candidates(self, query):
+        """Use an index to find the resources that may satisfy ``query``.
+
+        :return: a list of candidate resources or None if no index can be used
+        """
+        for (k, v) in query.items():
+            if k in self.indexes:
+                candidates = []
+                for res in self.indexes[k].get(str(v), []):
+                    # Skip entries for resources since replaced or removed
+                    if (self.resources.get(res.resource_id) is res
+                            and res not in candidates):
+                        candidates.append(res)
+                if candidates:
+                    return candidates
+                # A miss may be due to an attribute changed in place
+                # after indexing, so fall back to a full scan
+                return None
+
+        return None
+
     """
     Check if resource id is in this collection
     """
@@ -270,9 +323,22 @@ class ResourceCollectionBase(object):
     """
 
     def query(self, query):
-        result = list(self.resources.values())
+        candidates = self._indexed_candidates(query)
+        if candidates is not None:
+            result = self._filter(candidates, query)
+            if result:
+                return result
+            # Candidates may all fail the check if an attribute changed
+            # in place after indexing, so fall back to a full scan
+
+        return self._filter(self.resources.values(), query)
+
+    def _filter(self, resources, query):
+        result = list(resources)
         for (k, v) in query.items():
-            result = [i for i in result if str(getattr(i, k, None)) == str(v)]
+            result = [
+                i for i in result if str(self._query_value(i, k)) == str(v)
+            ]
 
         return result
 
@@ -311,3 +377,75 @@ class ResourceCollectionBase(object):
     def __len__(self):
         """Resource count."""
         return len(self.resources)
+
+
+class LazyResourceCollection(object):
+    """A proxy for a ResourceCollectionBase that defers loading from MaaS.
+
+    The wrapped collection is instantiated and refreshed on first access
+    rather than when the proxy is created. Attribute access, iteration and
+    length are passed through to the loaded collection.
+
+    :param collection_class: The ResourceCollectionBase subclass to proxy
+    :param api_client: An instance of api_client.MaasRequestFactory
+    :param ignore_errors: If True, errors loading the collection are logged
+                          and an empty collection is used
+    :param kwargs: Passed to the ``collection_class`` initializer
+    """
+
+    def __init__(self,
+                 collection_class,
+                 api_client,
+                 ignore_errors=False,
+                 **kwargs):
+        self._collection_class = collection_class
+        self._api_client = api_client
+        self._ignore_errors = ignore_errors
+        self._kwargs = kwargs
+        self._collection = None
+        self._load_lock = threading.Lock()
+        self.logger = logging.getLogger('drydock.nodedriver.maasdriver')
+
+    def is_loaded(self):
+        """Check if the proxied collection has been fetched from MaaS."""
+        return self._collection is not None
+
+    def load(self):
+        """Fetch the proxied collection if it has not been loaded yet.
+
+        :return: the loaded instance of ``collection_class``
+        """
+        with self._load_lock:
+            if self._collection is None:
+                collection = self._collection_class(self._api_client,
+                                                    **self._kwargs)
+                try:
+                    collection.refresh()
+                except Exception:
+                    if not self._ignore_errors:
+                        raise
+                    self.logger.warning(
+                        "Failed loading %s for %s." %
+                        (self._collection_class.__name__, str(self._kwargs)))
+                self._collection = collection
+
+        return self._collection
+
+    def refresh(self):
+        """Load the collection, or refresh it if already loaded."""
+        if self.is_loaded():
+            self._collection.refresh()
+        else:
+            self.load()
+
+    def __getattr__(self, name):
+        # Only called for attributes not defined on the proxy itself
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
@@ -57,16 +57,12 @@ class BlockDevice(model_base.ResourceBase):
         super().__init__(api_client, **kwargs)
 
         if hasattr(self, 'resource_id') and hasattr(self, 'system_id'):
-            try:
-                self.partitions = maas_partition.Partitions(
-                    api_client,
-                    system_id=self.system_id,
-                    device_id=self.resource_id)
-                self.partitions.refresh()
-            except Exception:
-                self.logger.warning(
-                    "Could not load partitions on node %s block device %s" %
-                    (self.system_id, self.resource_id))
+            self.partitions = model_base.LazyResourceCollection(
+                maas_partition.Partitions,
+                api_client,
+                ignore_errors=True,
+                system_id=self.system_id,
+                device_id=self.resource_id)
         else:
             self.partitions = None
 
@@ -264,6 +260,7 @@ class BlockDevices(model_base.ResourceCollectionBase):
 
     collection_url = 'nodes/{system_id}/blockdevices/'
     collection_resource = BlockDevice
+    index_fields = ['name']
 
     def __init__(self, api_client, **kwargs):
         super().__init__(api_client)
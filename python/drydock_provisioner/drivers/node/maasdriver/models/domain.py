@@ -29,3 +29,4 @@ class Domains(model_base.ResourceCollectionBase):
 
     collection_url = 'domains/'
     collection_resource = Domain
+    index_fields = ['name']
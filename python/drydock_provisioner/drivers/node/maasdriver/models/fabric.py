@@ -50,6 +50,7 @@ class Fabrics(model_base.ResourceCollectionBase):
 
     collection_url = 'fabrics/'
     collection_resource = Fabric
+    index_fields = ['name']
 
     def __init__(self, api_client):
         super(Fabrics, self).__init__(api_client)
@@ -293,6 +293,7 @@ class Interfaces(model_base.ResourceCollectionBase):
 
     collection_url = 'nodes/{system_id}/interfaces/'
     collection_resource = Interface
+    index_fields = ['name']
 
     def __init__(self, api_client, **kwargs):
         super(Interfaces, self).__init__(api_client)
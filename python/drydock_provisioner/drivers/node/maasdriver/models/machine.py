@@ -38,37 +38,57 @@ class Machine(model_base.ResourceBase):
         'resource_id', 'hostname', 'power_type', 'power_state',
         'power_parameters', 'interfaces', 'boot_interface', 'memory',
         'cpu_count', 'tag_names', 'status_name', 'boot_mac', 'boot_ip',
-        'owner_data', 'block_devices', 'volume_groups', 'domain'
+        'owner_data', 'block_devices', 'volume_groups', 'domain',
+        'mac_addresses'
     ]
     json_fields = ['hostname', 'power_type', 'domain']
+    sub_collections = ('interfaces', 'block_devices', 'volume_groups')
 
     def __init__(self, api_client, **kwargs):
         super(Machine, self).__init__(api_client, **kwargs)
 
-        # Replace generic dicts with interface collection model
+        # Replace generic dicts with collection models that are
+        # only fetched from MaaS when first accessed
         if hasattr(self, 'resource_id'):
-            self.interfaces = maas_interface.Interfaces(
-                api_client, system_id=self.resource_id)
-            self.interfaces.refresh()
-            try:
-                self.block_devices = maas_blockdev.BlockDevices(
-                    api_client, system_id=self.resource_id)
-                self.block_devices.refresh()
-            except Exception:
-                self.logger.warning("Failed loading node %s block devices." %
-                                    (self.resource_id))
-            try:
-                self.volume_groups = maas_vg.VolumeGroups(
-                    api_client, system_id=self.resource_id)
-                self.volume_groups.refresh()
-            except Exception:
-                self.logger.warning(
-                    "Failed load node %s volume groups." % (self.resource_id))
+            self.interfaces = model_base.LazyResourceCollection(
+                maas_interface.Interfaces,
+                api_client,
+                system_id=self.resource_id)
+            self.block_devices = model_base.LazyResourceCollection(
+                maas_blockdev.BlockDevices,
+                api_client,
+                ignore_errors=True,
+                system_id=self.resource_id)
+            self.volume_groups = model_base.LazyResourceCollection(
+                maas_vg.VolumeGroups,
+                api_client,
+                ignore_errors=True,
+                system_id=self.resource_id)
         else:
             self.interfaces = None
             self.block_devices = None
             self.volume_groups = None
 
+    def prefetch(self, *collections):
+        """Load sub-resource collections of this machine from MaaS.
+
+        Sub-resources are otherwise fetched lazily on first access.
+
+        :param collections: names of the collections to load, any of
+                            ``interfaces``, ``block_devices`` or
+                            ``volume_groups``. If none are given, all
+                            are loaded.
+        """
+        if not collections:
+            collections = Machine.sub_collections
+
+        for c in collections:
+            if c not in Machine.sub_collections:
+                raise ValueError("Unknown machine sub-collection %s" % c)
+            proxy = getattr(self, c, None)
+            if proxy is not None:
+                proxy.load()
+
     def interface_for_ip(self, ip_address):
         """Find the machine interface that will respond to ip_address.
 
@@ -510,29 +530,130 @@ class Machine(model_base.ResourceBase):
                     refined_dict['boot_ip'] = obj_dict['boot_interface'][
                         'links'][0].get('ip_address', None)
 
+        # Capture all interface MACs to allow node id without
+        # loading the interface collection
+        if isinstance(obj_dict.get('interface_set', None), list):
+            refined_dict['mac_addresses'] = [
+                i.get('mac_address') for i in obj_dict['interface_set']
+                if isinstance(i, dict) and i.get('mac_address')
+            ]
+
         i = cls(api_client, **refined_dict)
         return i
 
 
+class MachineStatus(object):
+    """Compact, read-only record of the status of a MaaS machine.
+
+    Used where only machine status is needed so the rest of the
+    machine representation does not need to be kept in memory.
+    """
+
+    __slots__ = ('system_id', 'hostname', 'status_name', 'power_state')
+
+    def __init__(self,
+                 system_id,
+                 hostname=None,
+                 status_name=None,
+                 power_state=None):
+        self.system_id = system_id
+        self.hostname = hostname
+        self.status_name = status_name
+        self.power_state = power_state
+
+    @classmethod
+    def from_dict(cls, obj_dict):
+        return cls(*[obj_dict.get(f) for f in cls.__slots__])
+
+    @classmethod
+    def project(cls, pairs):
+        """Reduce a decoded JSON object to the fields of this record.
+
+        Used as a JSON ``object_pairs_hook`` so that nested objects of the
+        machine representation are discarded as they are decoded.
+        """
+        return {k: v for k, v in pairs if k in cls.__slots__}
+
+
 class Machines(model_base.ResourceCollectionBase):
 
     collection_url = 'machines/'
     collection_resource = Machine
+    index_fields = [
+        'hostname', 'boot_ip', 'mac_address', 'power_params.power_address'
+    ]
 
     def __init__(self, api_client, **kwargs):
         super(Machines, self).__init__(api_client)
+        self.power_params_loaded = False
+
+    def refresh(self):
+        super().refresh()
+        self.power_params_loaded = False
 
-    # Add the OOB power parameters to each machine instance
-    def collect_power_params(self):
-        for k, v in self.resources.items():
-            v.get_power_params()
+    def collect_power_params(self, force=False):
+        """Add the OOB power parameters to each machine instance.
+
+        Parameters for the whole collection are fetched in a single request
+        and kept until the collection is refreshed.
+
+        :param force: Fetch the power parameters even if already loaded
+        """
+        if self.power_params_loaded and not force:
+            return
 
-    def acquire_node(self, node_name):
+        url = self.interpolate_url()
+
+        try:
+            resp = self.api_client.get(url, op='power_parameters')
+            power_params = resp.json()
+        except errors.DriverError:
+            self.logger.debug(
+                "Bulk power parameter query failed, querying each machine.")
+            for k, v in self.resources.items():
+                v.get_power_params()
+        else:
+            for k, v in self.resources.items():
+                v.power_parameters = power_params.get(k, {})
+
+        self.power_params_loaded = True
+        self.reindex()
+
+    def list_status(self, system_ids=None):
+        """Query the status of machines without loading the collection.
+
+        :param system_ids: List of MaaS system_ids to query, or None for all
+        :return: a dict of system_id to instances of MachineStatus
+        """
+        url = self.interpolate_url()
+
+        if system_ids is not None:
+            resp = self.api_client.get(url, params={'id': list(system_ids)})
+        else:
+            resp = self.api_client.get(url)
+
+        if resp.status_code != 200:
+            raise errors.DriverError(
+                "Failed to list machine status - MaaS error %s: %s" %
+                (resp.status_code, resp.text))
+
+        statuses = dict()
+
+        for o in resp.json(object_pairs_hook=MachineStatus.project):
+            if isinstance(o, dict) and o.get('system_id') is not None:
+                statuses[o.get('system_id')] = MachineStatus.from_dict(o)
+
+        return statuses
+
+    def acquire_node(self, node_name, refresh=True):
         """Acquire a commissioned node fro deployment.
 
         :param node_name: The hostname of a node to acquire
+        :param refresh: Whether to refresh the collection from MaaS before
+                        checking the node status
         """
-        self.refresh()
+        if refresh:
+            self.refresh()
 
         node = self.singleton({'hostname': node_name})
 
@@ -616,28 +737,34 @@ class Machines(model_base.ResourceCollectionBase):
     def find_nodes_with_mac(self, mac_address):
         """Find a list of nodes that own a NIC with ``mac_address``"""
         node_list = []
+        index = self.indexes.get('mac_address', {})
+        for n in index.get(Machines._mac_key(mac_address), []):
+            if self.resources.get(n.resource_id) is n and n not in node_list:
+                node_list.append(n)
+
+        # Machines listed without their interface MACs must be checked
+        # against their interface collection
         for n in self.resources.values():
-            if n.interface_for_mac(mac_address):
+            if n.mac_addresses is None and n.interface_for_mac(mac_address):
                 node_list.append(n)
         return node_list
 
-    def query(self, query):
-        """Custom query method to deal with complex fields."""
-        result = list(self.resources.values())
-        for (k, v) in query.items():
-            if k.startswith('power_params.'):
-                field = k[13:]
-                result = [
-                    i for i in result if str(
-                        getattr(i, 'power_parameters', {}).
-                        get(field, None)) == str(v)
-                ]
-            else:
-                result = [
-                    i for i in result if str(getattr(i, k, None)) == str(v)
-                ]
-
-        return result
+    @staticmethod
+    def _mac_key(mac_address):
+        return mac_address.replace(':', '').upper()
+
+    def _index_keys(self, res, field):
+        """Custom index keys to deal with the list of interface MACs."""
+        if field == 'mac_address':
+            return [Machines._mac_key(m) for m in res.mac_addresses or []]
+        return super()._index_keys(res, field)
+
+    def _query_value(self, res, field):
+        """Custom query value to deal with complex fields."""
+        if field.startswith('power_params.'):
+            return (getattr(res, 'power_parameters', None) or {}).get(
+                field[13:], None)
+        return getattr(res, field, None)
 
     def add(self, res):
         """Create a new resource in this collection in MaaS.
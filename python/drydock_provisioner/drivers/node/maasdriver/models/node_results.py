@@ -23,7 +23,7 @@ class NodeResult(model_base.ResourceBase):
     resource_url = 'commissioning-results/'
     fields = [
         'resource_id', 'name', 'result_type', 'updated', 'data',
-        'script_result'
+        'script_result', 'node'
     ]
     json_fields = []
 
@@ -60,6 +60,11 @@ class NodeResult(model_base.ResourceBase):
     def get_type_desc(self):
         return NodeResult.type_rev_map.get(self.result_type)
 
+    def get_system_id(self):
+        """Return the system_id of the node this result is from."""
+        if isinstance(self.node, dict):
+            return self.node.get('system_id')
+
 
 class NodeResults(model_base.ResourceCollectionBase):
 
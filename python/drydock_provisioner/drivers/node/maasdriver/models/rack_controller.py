@@ -39,6 +39,7 @@ class RackController(maas_machine.Machine):
         'boot_mac',
         'owner_data',
         'service_set',
+        'mac_addresses',
     ]
     json_fields = ['hostname', 'power_type']
 
@@ -91,6 +92,6 @@ class RackControllers(maas_machine.Machines):
     def __init__(self, api_client, **kwargs):
         super().__init__(api_client)
 
-    def acquire_node(self, node_name):
+    def acquire_node(self, node_name, refresh=True):
         """Acquire not valid for nodes that are Rack Controllers."""
         raise errors.DriverError("Rack controllers cannot be acquired.")
@@ -0,0 +1,98 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Batch the work done when many machines reach a MaaS status."""
+
+import functools
+import logging
+import threading
+
+from concurrent.futures import Future
+
+
+class ResultCollector(object):
+    """Hand machines reaching a status in the same polling round to a handler.
+
+    Each subtask of a driver task waits on its own machine, but the work
+    done once a wait completes, such as fetching MaaS results and saving
+    build data, is cheaper in bulk. A collector shared by the subtasks
+    watches machines through the status watcher and passes all machines
+    that completed in the same polling round to ``handler`` in one call,
+    on a thread of its own so the watcher keeps polling.
+
+    :param status_watcher: An instance of MachineStatusWatcher
+    :param handler: Callable accepting a list of (item, status name) tuples
+                    for the items passed to ``watch``
+    """
+
+    def __init__(self, status_watcher, handler):
+        self.status_watcher = status_watcher
+        self.handler = handler
+        self.logger = logging.getLogger('drydock.nodedriver.maasdriver')
+
+        self._lock = threading.Lock()
+        # Lists of (item, status, future) waiting to be handled
+        self._pending = []
+
+    def watch(self, system_id, predicate, timeout, item):
+        """Watch a machine and handle ``item`` once the wait is complete.
+
+        See ``MachineStatusWatcher.watch`` for parameters.
+
+        :param item: Object passed to the handler with the machine's status
+        :return: a concurrent.futures.Future resolved once the batch
+                 including ``item`` is handled
+        """
+        future = Future()
+        status_future = self.status_watcher.watch(system_id, predicate,
+                                                  timeout)
+        status_future.add_done_callback(
+            functools.partial(self._finished, item, future))
+        return future
+
+    def _finished(self, item, future, status_future):
+        if status_future.exception() is not None:
+            future.set_exception(status_future.exception())
+            return
+
+        with self._lock:
+            self._pending.append((item, status_future.result(), future))
+            first = len(self._pending) == 1
+
+        if first:
+            self.status_watcher.call_after_poll(self._flush)
+
+    def _flush(self):
+        with self._lock:
+            batch = self._pending
+            self._pending = []
+
+        if batch:
+            threading.Thread(
+                target=self._handle,
+                args=(batch, ),
+                name='maas-result-collector',
+                daemon=True).start()
+
+    def _handle(self, batch):
+        self.logger.debug("Handling a batch of %d machines." % len(batch))
+
+        try:
+            self.handler([(item, status) for (item, status, _) in batch])
+        except Exception as ex:
+            for (_, _, future) in batch:
+                future.set_exception(ex)
+            return
+
+        for (_, _, future) in batch:
+            future.set_result(None)
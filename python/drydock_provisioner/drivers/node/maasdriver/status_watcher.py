@@ -0,0 +1,215 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Central polling of MaaS machine status for many waiting nodes."""
+
+import logging
+import threading
+import time
+
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError
+
+import drydock_provisioner.drivers.node.maasdriver.models.machine as maas_machine
+
+
+class _StatusWaiter(object):
+    """A request to be notified when a machine reaches a status."""
+
+    def __init__(self, system_id, predicate, deadline, status=None):
+        self.system_id = system_id
+        self.predicate = predicate
+        self.deadline = deadline
+        self.status = status
+        self.future = Future()
+
+
+class MachineStatusWatcher(object):
+    """Watch the status of MaaS machines on behalf of many waiters.
+
+    A single background thread lists the status of all watched machines
+    in one request per ``poll_interval`` and resolves the future of each
+    waiter whose machine reached the desired status. The thread runs only
+    while there are waiters.
+
+    :param api_client: An instance of api_client.MaasRequestFactory
+    :param poll_interval: Seconds between status queries to MaaS
+    """
+
+    # Seconds a status query may take before a blocked waiter stops
+    # waiting on the watcher
+    POLL_GRACE = 60
+
+    def __init__(self, api_client, poll_interval=10):
+        self.api_client = api_client
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger('drydock.nodedriver.maasdriver')
+
+        self._cv = threading.Condition()
+        self._waiters = []
+        self._thread = None
+        # Callables to run once the current polling round is notified
+        self._after_poll = []
+
+    def watch(self, system_id, predicate, timeout, status=None):
+        """Start watching a machine for a status.
+
+        :param system_id: The MaaS system_id of the machine
+        :param predicate: Callable accepting a status name and returning True
+                          once the wait is complete
+        :param timeout: Seconds to wait before giving up
+        :param status: The current status of the machine, if known
+        :return: a concurrent.futures.Future resolved with the last known
+                 status name once ``predicate`` is satisfied or ``timeout``
+                 has passed
+        """
+        return self._add_waiter(system_id, predicate, timeout,
+                                status=status).future
+
+    def wait_for_status(self, system_id, predicate, timeout, status=None):
+        """Block until a machine reaches a status.
+
+        See ``watch`` for parameters.
+
+        :return: the last known status name of the machine
+        """
+        waiter = self._add_waiter(system_id, predicate, timeout, status=status)
+
+        # Waiters past their deadline are released on the next poll, allow
+        # for a poll to complete before giving up on the watcher
+        try:
+            return waiter.future.result(
+                timeout=timeout + self.poll_interval + self.POLL_GRACE)
+        except TimeoutError:
+            self.logger.warning(
+                "Timed out waiting on status watcher for machine %s." %
+                system_id)
+            return waiter.status
+
+    def call_after_poll(self, fn):
+        """Call ``fn`` once all waiters of the current polling round are notified.
+
+        Intended for the done callbacks of futures returned by ``watch``, so
+        that work for all the machines reaching a status in the same polling
+        round can be done together. If not called from the polling thread,
+        ``fn`` is called immediately.
+
+        :param fn: Callable accepting no arguments
+        """
+        with self._cv:
+            if threading.current_thread() is self._thread:
+                self._after_poll.append(fn)
+                return
+
+        fn()
+
+    def _add_waiter(self, system_id, predicate, timeout, status=None):
+        waiter = _StatusWaiter(
+            system_id, predicate, time.monotonic() + timeout, status=status)
+
+        if status is not None and predicate(status):
+            waiter.future.set_result(status)
+            return waiter
+
+        with self._cv:
+            self._waiters.append(waiter)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._poll, name='maas-status-watcher', daemon=True)
+                self._thread.start()
+
+        return waiter
+
+    def _poll(self):
+        try:
+            while True:
+                with self._cv:
+                    if not self._waiters:
+                        self._thread = None
+                        return
+
+                time.sleep(self.poll_interval)
+
+                # Include machines watched while sleeping in this round
+                with self._cv:
+                    system_ids = list(set(w.system_id for w in self._waiters))
+
+                try:
+                    statuses = self._get_statuses(system_ids)
+                except Exception as ex:
+                    self.logger.warning(
+                        "Error polling MaaS machine status, will re-attempt: "
+                        "%s" % str(ex))
+                    statuses = dict()
+
+                self._notify(statuses)
+                self._run_after_poll()
+        except Exception as ex:
+            self.logger.error(
+                "MaaS status watcher failed, releasing all waiters.",
+                exc_info=ex)
+            with self._cv:
+                for w in self._waiters:
+                    if not w.future.done():
+                        w.future.set_exception(ex)
+                self._waiters = []
+                self._thread = None
+        finally:
+            with self._cv:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+            self._run_after_poll()
+
+    def _run_after_poll(self):
+        with self._cv:
+            after_poll = self._after_poll
+            self._after_poll = []
+
+        for fn in after_poll:
+            try:
+                fn()
+            except Exception as ex:
+                self.logger.error(
+                    "Error in status watcher callback.", exc_info=ex)
+
+    def _get_statuses(self, system_ids):
+        """Query MaaS for the status of ``system_ids`` in a single request."""
+        statuses = maas_machine.Machines(self.api_client).list_status(
+            system_ids=system_ids)
+
+        return {k: v.status_name for k, v in statuses.items()}
+
+    def _notify(self, statuses):
+        now = time.monotonic()
+
+        with self._cv:
+            pending = []
+            for w in self._waiters:
+                if statuses.get(w.system_id) is not None:
+                    w.status = statuses.get(w.system_id)
+                try:
+                    if w.status is not None and w.predicate(w.status):
+                        w.future.set_result(w.status)
+                    elif now >= w.deadline:
+                        w.future.set_result(w.status)
+                    else:
+                        pending.append(w)
+                except Exception as ex:
+                    # Fail only this waiter, others are still served
+                    if not w.future.done():
+                        w.future.set_exception(ex)
+
+            self.logger.debug(
+                "Polled status of %d MaaS machines, %d waiters pending." %
+                (len(statuses), len(pending)))
+            self._waiters = pending
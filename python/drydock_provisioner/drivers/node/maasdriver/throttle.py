@@ -0,0 +1,94 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Adaptive concurrency limit for requests to the MaaS API."""
+
+import threading
+
+
+class AdaptiveThrottle(object):
+    """Limit concurrent MaaS API requests using AIMD.
+
+    The number of requests allowed in flight grows by one for each window
+    of successful requests (additive increase) and is halved whenever MaaS
+    signals it is overloaded (multiplicative decrease). Callers wait in
+    ``acquire`` while the limit is reached.
+
+    :param max_limit: Upper bound on concurrent requests
+    :param min_limit: Lower bound on concurrent requests
+    :param decrease_factor: Multiplier applied to the limit when throttled
+    """
+
+    # Weight of the most recent sample in the latency moving average
+    LATENCY_WEIGHT = 0.2
+
+    def __init__(self, max_limit=16, min_limit=1, decrease_factor=0.5):
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.decrease_factor = decrease_factor
+
+        self.limit = float(self.max_limit)
+        self.in_flight = 0
+        self.queue_depth = 0
+        self.throttle_events = 0
+        self.avg_latency = None
+
+        self._cv = threading.Condition()
+
+    def acquire(self):
+        """Wait until a request is allowed to be sent."""
+        with self._cv:
+            self.queue_depth += 1
+            try:
+                while self.in_flight >= int(self.limit):
+                    self._cv.wait()
+            finally:
+                self.queue_depth -= 1
+            self.in_flight += 1
+
+    def release(self, latency=None, throttled=False):
+        """Record the outcome of a request sent after ``acquire``.
+
+        :param latency: Seconds the request took, if it completed
+        :param throttled: True if MaaS signalled it is overloaded
+        """
+        with self._cv:
+            self.in_flight -= 1
+
+            if throttled:
+                self.throttle_events += 1
+                self.limit = max(float(self.min_limit),
+                                 self.limit * self.decrease_factor)
+            else:
+                self.limit = min(
+                    float(self.max_limit), self.limit + 1.0 / self.limit)
+
+            if latency is not None:
+                if self.avg_latency is None:
+                    self.avg_latency = latency
+                else:
+                    self.avg_latency = (
+                        self.LATENCY_WEIGHT * latency
+                        + (1 - self.LATENCY_WEIGHT) * self.avg_latency)
+
+            self._cv.notify_all()
+
+    def get_metrics(self):
+        """Return a dict of the current throttle state."""
+        with self._cv:
+            return dict(
+                queue_depth=self.queue_depth,
+                in_flight=self.in_flight,
+                concurrency_limit=int(self.limit),
+                throttle_events=self.throttle_events,
+                avg_latency=self.avg_latency)
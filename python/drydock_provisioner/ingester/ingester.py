@@ -61,6 +61,7 @@ class Ingester(object):
                     design_state=None,
                     design_ref=None,
                     context=None,
+                    design_blob=None,
                     **kwargs):
         """Execute a data ingestion of the design reference.
 
@@ -70,6 +71,8 @@ class Ingester(object):
         :param design_state: - An instance of statemgmt.state.DrydockState
         :param design_ref: - The design reference to source design data from
         :param context: - Context of the request requesting ingestion
+        :param design_blob: - The design documents already retrieved from
+                              ``design_ref``, if None they are retrieved
         :param kwargs: - Keywork arguments to pass to the ingester plugin
         """
         if design_state is None:
@@ -88,7 +91,8 @@ class Ingester(object):
         self.logger.debug(
             "Ingester:ingest_data ingesting design parts for design %s" %
             design_ref)
-        design_blob = design_state.get_design_documents(design_ref)
+        if design_blob is None:
+            design_blob = design_state.get_design_documents(design_ref)
         self.logger.debug(
             "Ingesting design data of %d bytes." % len(design_blob))
 
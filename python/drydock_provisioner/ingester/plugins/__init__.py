@@ -15,8 +15,24 @@
 # Plugins to parse incoming topology and translate it to helm-drydock's
 # model representation
 
+import copy
 import logging
 
+import jsonschema
+from yaml import MappingNode
+from yaml import ScalarNode
+
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Use the libyaml based loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class IngesterPlugin(object):
     def __init__(self):
@@ -28,3 +44,97 @@ class IngesterPlugin(object):
 
     def ingest_data(self, **kwargs):
         return {}
+
+
+def load_documents(doc_blob, select=None):
+    """Parse the YAML documents of ``doc_blob`` one at a time.
+
+    Documents are composed into a node graph first. Documents not selected
+    by ``select`` are discarded without constructing Python objects from
+    their nodes.
+
+    :param doc_blob: bytes or file-like object of a YAML stream
+    :param select: Callable accepting the composed yaml.Node of a document
+                   and returning True if the document should be returned.
+                   If None, every document is returned.
+    """
+    loader = SafeLoader(doc_blob)
+    try:
+        while loader.check_node():
+            node = loader.get_node()
+            if select is None or select(node):
+                yield loader.construct_document(node)
+    finally:
+        loader.dispose()
+
+
+def get_node_value(node, key):
+    """Return the value of a top-level scalar field of a composed document.
+
+    :param node: yaml.Node of a document as composed by the loader
+    :param key: string name of the field
+    :return: the string value of ``key``, or None if the document is not a
+             mapping or ``key`` does not have a scalar value
+    """
+    if not isinstance(node, MappingNode):
+        return None
+
+    for key_node, value_node in node.value:
+        if (isinstance(key_node, ScalarNode) and key_node.value == key
+                and isinstance(value_node, ScalarNode)):
+            return value_node.value
+
+    return None
+
+
+class SchemaValidator(object):
+    """Validator of documents against a JSON schema compiled once.
+
+    With the ``fastjsonschema`` backend documents are first checked with
+    code generated from the schema. Only documents failing that check are
+    validated again with jsonschema to report every error found, so
+    the messages reported do not depend on the backend.
+
+    :param schema: dictionary of the Draft 4 JSON schema
+    :param backend: ``jsonschema`` or ``fastjsonschema``
+    """
+
+    DRAFT4_URI = 'http://json-schema.org/draft-04/schema#'
+
+    def __init__(self, schema, backend='jsonschema'):
+        self.logger = logging.getLogger('drydock.ingester')
+        self.validator = jsonschema.Draft4Validator(schema)
+        self.fast_validate = None
+
+        if backend == 'fastjsonschema':
+            if fastjsonschema is None:
+                self.logger.warning(
+                    "fastjsonschema is not installed, validating documents "
+                    "with jsonschema.")
+            else:
+                # Documents are validated as Draft 4 whatever the $schema
+                # of the schema, and must not be modified with defaults
+                fast_schema = copy.copy(schema)
+                fast_schema['$schema'] = self.DRAFT4_URI
+                try:
+                    self.fast_validate = fastjsonschema.compile(
+                        fast_schema, use_default=False)
+                except Exception as ex:
+                    self.logger.warning(
+                        "Schema could not be compiled with fastjsonschema, "
+                        "validating documents with jsonschema: %s" % str(ex))
+
+    def validate(self, instance):
+        """Validate ``instance`` against the schema.
+
+        :param instance: the parsed document data to validate
+        :return: list of error messages, empty if ``instance`` is valid
+        """
+        if self.fast_validate is not None:
+            try:
+                self.fast_validate(instance)
+                return []
+            except fastjsonschema.JsonSchemaException:
+                pass
+
+        return [e.message for e in self.validator.iter_errors(instance)]
@@ -15,20 +15,24 @@
 
 import yaml
 import logging
-import jsonschema
 import os
 import pkg_resources
 import copy
 import hashlib
+import json
 
 import drydock_provisioner.objects.fields as hd_fields
 
 from beaker.cache import CacheManager
 from beaker.util import parse_cache_config_options
 
+from drydock_provisioner import config
 from drydock_provisioner import error as errors
 from drydock_provisioner import objects
 from drydock_provisioner.ingester.plugins import IngesterPlugin
+from drydock_provisioner.ingester.plugins import SchemaValidator
+from drydock_provisioner.ingester.plugins import get_node_value
+from drydock_provisioner.ingester.plugins import load_documents
 
 cache_opts = {
     'cache.type': 'memory',
@@ -82,10 +86,10 @@ class DeckhandIngester(IngesterPlugin):
         :param doc_blob: bytes representing a utf-8 encoded YAML string
         """
         models = []
-        yaml_string = doc_blob.decode()
         self.logger.debug("yamlingester:parse_docs - Parsing YAML string.")
         try:
-            parsed_data = yaml.safe_load_all(yaml_string)
+            parsed_data = load_documents(
+                doc_blob, select=self.select_document)
         except yaml.YAMLError as err:
             if hasattr(err, 'problem_mark'):
                 mark = err.problem_mark
@@ -95,6 +99,8 @@ class DeckhandIngester(IngesterPlugin):
             else:
                 raise errors.IngesterError("Error parsing YAML: %s" % (err))
 
+        doc_cache = self.get_document_cache()
+
         # tracking processing status to provide a complete summary of issues
         ps = objects.Validation()
         ps.set_status(hd_fields.ValidationResult.Success)
@@ -109,11 +115,25 @@ class DeckhandIngester(IngesterPlugin):
                 continue
             if schema_ns == 'drydock':
                 try:
+                    doc_hash = self.hash_document(d)
                     doc_ref = objects.DocumentReference(
                         doc_type=hd_fields.DocumentType.Deckhand,
                         doc_schema=d.get('schema'),
-                        doc_name=d.get('metadata', {}).get('name', 'Unknown'))
-                    doc_errors = self.validate_drydock_document(d)
+                        doc_name=d.get('metadata', {}).get('name', 'Unknown'),
+                        doc_hash=doc_hash)
+                    # Documents unchanged since a previous parse are not
+                    # validated and processed again
+                    try:
+                        cached_doc = doc_cache.get(doc_hash)
+                    except KeyError:
+                        cached_doc = None
+                    if cached_doc is not None:
+                        doc_errors, model = cached_doc
+                        if model is not None:
+                            model = model.obj_clone()
+                    else:
+                        doc_errors = self.validate_drydock_document(d)
+                        model = None
                     if len(doc_errors) > 0:
                         for e in doc_errors:
                             ps.add_detail_msg(
@@ -128,9 +148,12 @@ class DeckhandIngester(IngesterPlugin):
                                     "Invalid input file - see Drydock Troubleshooting Guide for DD001"
                                 ))
                         ps.set_status(hd_fields.ActionResult.Failure)
+                        doc_cache.put(doc_hash, (doc_errors, None))
                         continue
-                    model = self.process_drydock_document(d)
-                    model.doc_ref = doc_ref
+                    if model is None:
+                        model = self.process_drydock_document(d)
+                        model.doc_ref = doc_ref
+                        doc_cache.put(doc_hash, (doc_errors, model.obj_clone()))
                     models.append(model)
                 except errors.IngesterError as ie:
                     msg = "Error processing document: %s" % str(ie)
@@ -162,6 +185,40 @@ class DeckhandIngester(IngesterPlugin):
                     ps.set_status(hd_fields.ActionResult.Failure)
         return (ps, models)
 
+    @staticmethod
+    def select_document(node):
+        """Select the documents to parse from composed YAML nodes.
+
+        Documents with a schema in a namespace other than ``drydock`` are
+        skipped. Documents without a well-formed schema are parsed so
+        their errors are reported.
+
+        :param node: yaml.Node of the composed document
+        """
+        schema = get_node_value(node, 'schema')
+        if schema is None:
+            return True
+        schema_parts = schema.split('/')
+        return len(schema_parts) != 3 or schema_parts[0] == 'drydock'
+
+    def get_document_cache(self):
+        """Return the cache of processed documents keyed by document hash.
+
+        Cached values are a tuple of the schema validation errors of the
+        document and the unmodified model processed from it.
+        """
+        return cache.get_cache('parsed_doc')
+
+    @staticmethod
+    def hash_document(doc):
+        """Hash the content of a parsed document.
+
+        :param doc: The dictionary from parsing the YAML document
+        """
+        doc_string = json.dumps(doc, sort_keys=True, default=str)
+        # This is not a security related hash, so use cheap and fast MD5
+        return hashlib.md5(doc_string.encode('utf-8')).hexdigest()
+
     def process_drydock_document(self, doc):
         """Process a parsed YAML document.
 
@@ -197,11 +254,9 @@ class DeckhandIngester(IngesterPlugin):
         errors_found = []
 
         if doc_version == 'v1':
-            if schemaname in self.v1_doc_schemas:
-                validator = jsonschema.Draft4Validator(
-                    self.v1_doc_schemas.get(schemaname))
-                for error in validator.iter_errors(doc.get('data', [])):
-                    errors_found.append(error.message)
+            if schemaname in self.v1_doc_validators:
+                validator = self.v1_doc_validators.get(schemaname)
+                errors_found.extend(validator.validate(doc.get('data', [])))
 
         return errors_found
 
@@ -695,6 +750,8 @@ class DeckhandIngester(IngesterPlugin):
 
     def load_schemas(self):
         self.v1_doc_schemas = dict()
+        self.v1_doc_validators = dict()
+        backend = config.config_mgr.conf.schema_validator
         schema_dir = self._get_schema_dir()
 
         for schema_file in os.listdir(schema_dir):
@@ -708,6 +765,8 @@ class DeckhandIngester(IngesterPlugin):
                 self.logger.debug(
                     "Loaded schema for document kind %s." % schema_for)
                 self.v1_doc_schemas[schema_for] = schema.get('data')
+                self.v1_doc_validators[schema_for] = SchemaValidator(
+                    self.v1_doc_schemas[schema_for], backend=backend)
             f.close()
 
     def _get_schema_dir(self):
@@ -16,15 +16,18 @@
 import yaml
 import logging
 import base64
-import jsonschema
 import os
 import pkg_resources
 
 import drydock_provisioner.objects.fields as hd_fields
 
+from drydock_provisioner import config
 from drydock_provisioner import error as errors
 from drydock_provisioner import objects
 from drydock_provisioner.ingester.plugins import IngesterPlugin
+from drydock_provisioner.ingester.plugins import SchemaValidator
+from drydock_provisioner.ingester.plugins import get_node_value
+from drydock_provisioner.ingester.plugins import load_documents
 
 
 class YamlIngester(IngesterPlugin):
@@ -61,10 +64,10 @@ class YamlIngester(IngesterPlugin):
         :param doc_blob: bytes representing a utf-8 encoded YAML string
         """
         models = []
-        yaml_string = doc_blob.decode()
         self.logger.debug("yamlingester:parse_docs - Parsing YAML string.")
         try:
-            parsed_data = yaml.safe_load_all(yaml_string)
+            parsed_data = load_documents(
+                doc_blob, select=self.select_document)
         except yaml.YAMLError as err:
             if hasattr(err, 'problem_mark'):
                 mark = err.problem_mark
@@ -133,6 +136,20 @@ class YamlIngester(IngesterPlugin):
                     models.append(model)
         return (ps, models)
 
+    @staticmethod
+    def select_document(node):
+        """Select the documents to parse from composed YAML nodes.
+
+        Only Drydock and Promenade documents are processed, others are
+        skipped.
+
+        :param node: yaml.Node of the composed document
+        """
+        if not isinstance(node, yaml.MappingNode):
+            return True
+        api = get_node_value(node, 'apiVersion')
+        return api is not None and api.startswith(('drydock/', 'promenade/'))
+
     def process_drydock_document(self, doc):
         """Process a parsed YAML document.
 
@@ -158,13 +175,9 @@ class YamlIngester(IngesterPlugin):
         :param doc: dictionary of the parsed document.
         """
         doc_kind = doc.get('kind')
-        if doc_kind in self.v1_doc_schemas:
-            validator = jsonschema.Draft4Validator(
-                self.v1_doc_schemas.get(doc_kind))
-            errors_found = []
-            for error in validator.iter_errors(doc):
-                errors_found.append(error.message)
-            return errors_found
+        if doc_kind in self.v1_doc_validators:
+            validator = self.v1_doc_validators.get(doc_kind)
+            return validator.validate(doc)
         else:
             return []
 
@@ -627,6 +640,8 @@ class YamlIngester(IngesterPlugin):
 
     def load_schemas(self):
         self.v1_doc_schemas = dict()
+        self.v1_doc_validators = dict()
+        backend = config.config_mgr.conf.schema_validator
         schema_dir = self._get_schema_dir()
 
         for schema_file in os.listdir(schema_dir):
@@ -640,6 +655,8 @@ class YamlIngester(IngesterPlugin):
                 self.logger.debug(
                     "Loaded schema for document kind %s." % schema_for)
                 self.v1_doc_schemas[schema_for] = schema
+                self.v1_doc_validators[schema_for] = SchemaValidator(
+                    self.v1_doc_schemas[schema_for], backend=backend)
             f.close()
 
     def _get_schema_dir(self):
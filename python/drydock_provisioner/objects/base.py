@@ -46,6 +46,24 @@ class DrydockObject(base.VersionedObject):
         else:
             raise ValueError("Unknown field %s" % (attrname))
 
+    def shallow_clone(self):
+        """Make a copy of this object sharing the values of its fields.
+
+        Unlike ``obj_clone`` nested objects and lists are not copied, so a
+        shallow clone is cheap to make. Field values of the clone are shared
+        with this object and should be replaced rather than modified in place.
+        """
+        nobj = self.__class__()
+        nobj._context = self._context
+        for name in self.fields:
+            if self.obj_attr_is_set(name):
+                # Values are already coerced, set the backing attribute to
+                # avoid the field copying them again
+                attrname = base._get_attrname(name)
+                setattr(nobj, attrname, getattr(self, attrname))
+        nobj._changed_fields = set(self._changed_fields)
+        return nobj
+
     def obj_to_simple(self):
         """
         Create a simple primitive representation of this object excluding
@@ -101,7 +119,7 @@ class DrydockObjectListBase(base.ObjectListBase):
         i = 0
         while i < len(self.objects):
             if self.objects[i].get_id() == obj.get_id():
-                objects[i] = obj
+                self.objects[i] = obj
                 return True
             i = i + 1
 
@@ -13,7 +13,6 @@
 # limitations under the License.
 """Models representing host profiles and constituent parts."""
 
-from copy import deepcopy
 
 import oslo_versionedobjects.fields as obj_fields
 
@@ -131,21 +130,40 @@ class HostProfile(base.DrydockPersistentObject, base.DrydockObject):
         self.kernel_params = objects.Utils.merge_dicts(self.kernel_params,
                                                        parent.kernel_params)
 
-        self.storage_devices = HostStorageDeviceList.from_basic_list(
-            HostStorageDevice.merge_lists(self.storage_devices,
-                                          parent.storage_devices))
+        self.storage_devices = self.inherit_list(
+            self.storage_devices, parent.storage_devices,
+            HostStorageDevice.merge_lists, HostStorageDeviceList)
 
-        self.volume_groups = HostVolumeGroupList.from_basic_list(
-            HostVolumeGroup.merge_lists(self.volume_groups,
-                                        parent.volume_groups))
+        self.volume_groups = self.inherit_list(
+            self.volume_groups, parent.volume_groups,
+            HostVolumeGroup.merge_lists, HostVolumeGroupList)
 
-        self.interfaces = HostInterfaceList.from_basic_list(
-            HostInterface.merge_lists(self.interfaces, parent.interfaces))
+        self.interfaces = self.inherit_list(
+            self.interfaces, parent.interfaces, HostInterface.merge_lists,
+            HostInterfaceList)
 
         self.source = hd_fields.ModelSource.Compiled
 
         return
 
+    @staticmethod
+    def inherit_list(child_list, parent_list, merge_fn, list_class):
+        """Compute the effective value of a list field.
+
+        A child that defines no members of its own shares the list of
+        its parent, which is already fully merged, rather than a copy. The
+        shared list must be copied before being modified.
+
+        :param child_list: the list defined by the child
+        :param parent_list: the effective list of the parent
+        :param merge_fn: function merging the child and parent lists
+        :param list_class: the DrydockObjectListBase class of the field
+        """
+        if not child_list and parent_list is not None:
+            return parent_list
+
+        return list_class.from_basic_list(merge_fn(child_list, parent_list))
+
 
 @base.DrydockObjectRegistry.register
 class HostProfileList(base.DrydockObjectListBase, base.DrydockObject):
@@ -210,10 +228,13 @@ class HostInterface(base.DrydockObject):
     # device, the selector will be decided and applied
 
     def add_selector(self, slave_selector):
-        if self.slave_selectors is None:
-            self.slave_selectors = objects.HardwareDeviceSelectorList()
+        # Replace rather than extend the list, it may be shared with the
+        # interface this one was cloned from
+        selectors = list(self.slave_selectors or [])
+        selectors.append(slave_selector)
 
-        self.slave_selectors.append(slave_selector)
+        self.slave_selectors = \
+            objects.HardwareDeviceSelectorList.from_basic_list(selectors)
 
     """
     Merge two lists of HostInterface models with child_list taking
@@ -234,7 +255,7 @@ class HostInterface(base.DrydockObject):
 
         if len(child_list) == 0 and len(parent_list) > 0:
             for p in parent_list:
-                pp = deepcopy(p)
+                pp = p.shallow_clone()
                 pp.source = hd_fields.ModelSource.Compiled
                 effective_list.append(pp)
         elif len(parent_list) == 0 and len(child_list) > 0:
@@ -242,7 +263,7 @@ class HostInterface(base.DrydockObject):
                 if i.get_name().startswith('!'):
                     continue
                 else:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
         elif len(parent_list) > 0 and len(child_list) > 0:
@@ -279,14 +300,14 @@ class HostInterface(base.DrydockObject):
                         break
 
                 if add:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
 
             for j in child_list:
                 if (j.device_name not in parent_interfaces
                         and not j.get_name().startswith("!")):
-                    jj = deepcopy(j)
+                    jj = j.shallow_clone()
                     jj.source = hd_fields.ModelSource.Compiled
                     effective_list.append(jj)
 
@@ -346,7 +367,7 @@ class HostVolumeGroup(base.DrydockObject):
 
         if len(child_list) == 0 and len(parent_list) > 0:
             for p in parent_list:
-                pp = deepcopy(p)
+                pp = p.shallow_clone()
                 pp.source = hd_fields.ModelSource.Compiled
                 effective_list.append(pp)
         elif len(parent_list) == 0 and len(child_list) > 0:
@@ -354,7 +375,7 @@ class HostVolumeGroup(base.DrydockObject):
                 if i.get_name().startswith('!'):
                     continue
                 else:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
         elif len(parent_list) > 0 and len(child_list) > 0:
@@ -388,14 +409,14 @@ class HostVolumeGroup(base.DrydockObject):
                         p.source = hd_fields.ModelSource.Compiled
                         effective_list.append(p)
             if add:
-                ii = deepcopy(i)
+                ii = i.shallow_clone()
                 ii.source = hd_fields.ModelSource.Compiled
                 effective_list.append(ii)
 
         for j in child_list:
             if (j.get_name() not in parent_devs
                     and not j.get_name().startswith("!")):
-                jj = deepcopy(j)
+                jj = j.shallow_clone()
                 jj.source = hd_fields.ModelSource.Compiled
                 effective_list.append(jj)
 
@@ -460,7 +481,7 @@ class HostStorageDevice(base.DrydockObject):
 
         if len(child_list) == 0 and len(parent_list) > 0:
             for p in parent_list:
-                pp = deepcopy(p)
+                pp = p.shallow_clone()
                 pp.source = hd_fields.ModelSource.Compiled
                 effective_list.append(pp)
         elif len(parent_list) == 0 and len(child_list) > 0:
@@ -468,7 +489,7 @@ class HostStorageDevice(base.DrydockObject):
                 if i.get_name().startswith('!'):
                     continue
                 else:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
         elif len(parent_list) > 0 and len(child_list) > 0:
@@ -505,14 +526,14 @@ class HostStorageDevice(base.DrydockObject):
                         p.source = hd_fields.ModelSource.Compiled
                         effective_list.append(p)
             if add:
-                ii = deepcopy(i)
+                ii = i.shallow_clone()
                 ii.source = hd_fields.ModelSource.Compiled
                 effective_list.append(ii)
 
         for j in child_list:
             if (j.get_name() not in parent_devs
                     and not j.get_name().startswith("!")):
-                jj = deepcopy(j)
+                jj = j.shallow_clone()
                 jj.source = hd_fields.ModelSource.Compiled
                 effective_list.append(jj)
 
@@ -597,7 +618,7 @@ class HostPartition(base.DrydockObject):
 
         if len(child_list) == 0 and len(parent_list) > 0:
             for p in parent_list:
-                pp = deepcopy(p)
+                pp = p.shallow_clone()
                 pp.source = hd_fields.ModelSource.Compiled
                 effective_list.append(pp)
         elif len(parent_list) == 0 and len(child_list) > 0:
@@ -605,7 +626,7 @@ class HostPartition(base.DrydockObject):
                 if i.get_name().startswith('!'):
                     continue
                 else:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
         elif len(parent_list) > 0 and len(child_list) > 0:
@@ -643,14 +664,14 @@ class HostPartition(base.DrydockObject):
                         p.source = hd_fields.ModelSource.Compiled
                         effective_list.append(p)
             if add:
-                ii = deepcopy(i)
+                ii = i.shallow_clone()
                 ii.source = hd_fields.ModelSource.Compiled
                 effective_list.append(ii)
 
         for j in child_list:
             if (j.get_name() not in parent_partitions
                     and not j.get_name().startswith("!")):
-                jj = deepcopy(j)
+                jj = j.shallow_clone()
                 jj.source = hd_fields.ModelSource.Compiled
                 effective_list.append(jj)
 
@@ -727,7 +748,7 @@ class HostVolume(base.DrydockObject):
 
         if len(child_list) == 0 and len(parent_list) > 0:
             for p in parent_list:
-                pp = deepcopy(p)
+                pp = p.shallow_clone()
                 pp.source = hd_fields.ModelSource.Compiled
                 effective_list.append(pp)
         elif len(parent_list) == 0 and len(child_list) > 0:
@@ -735,7 +756,7 @@ class HostVolume(base.DrydockObject):
                 if i.get_name().startswith('!'):
                     continue
                 else:
-                    ii = deepcopy(i)
+                    ii = i.shallow_clone()
                     ii.source = hd_fields.ModelSource.Compiled
                     effective_list.append(ii)
         elif len(parent_list) > 0 and len(child_list) > 0:
@@ -770,14 +791,14 @@ class HostVolume(base.DrydockObject):
                         p.source = hd_fields.ModelSource.Compiled
                         effective_list.append(p)
             if add:
-                ii = deepcopy(i)
+                ii = i.shallow_clone()
                 ii.source = hd_fields.ModelSource.Compiled
                 effective_list.append(ii)
 
         for j in child_list:
             if (j.get_name() not in parent_volumes
                     and not j.get_name().startswith("!")):
-                jj = deepcopy(j)
+                jj = j.shallow_clone()
                 jj.source = hd_fields.ModelSource.Compiled
                 effective_list.append(jj)
 
@@ -20,6 +20,9 @@ from defusedxml.ElementTree import fromstring
 import logging
 from oslo_versionedobjects import fields as ovo_fields
 
+from beaker.cache import CacheManager
+from beaker.util import parse_cache_config_options
+
 import drydock_provisioner.error as errors
 import drydock_provisioner.config as config
 import drydock_provisioner.objects as objects
@@ -27,6 +30,13 @@ import drydock_provisioner.objects.hostprofile
 import drydock_provisioner.objects.base as base
 import drydock_provisioner.objects.fields as hd_fields
 
+cache_opts = {
+    'cache.type': 'memory',
+    'expire': 1800,
+}
+
+cache = CacheManager(**parse_cache_config_options(cache_opts))
+
 
 @base.DrydockObjectRegistry.register
 class BaremetalNode(drydock_provisioner.objects.hostprofile.HostProfile):
@@ -52,7 +62,8 @@ class BaremetalNode(drydock_provisioner.objects.hostprofile.HostProfile):
     def compile_applied_model(self,
                               site_design,
                               state_manager,
-                              resolve_aliases=False):
+                              resolve_aliases=False,
+                              build_data=None):
         self.logger.debug("Compiling effective node model for %s" % self.name)
         self.apply_host_profile(site_design)
         self.apply_hardware_profile(site_design)
@@ -61,7 +72,8 @@ class BaremetalNode(drydock_provisioner.objects.hostprofile.HostProfile):
         if resolve_aliases:
             self.logger.debug(
                 "Resolving device aliases on node %s" % self.name)
-            self.apply_logicalnames(site_design, state_manager)
+            self.apply_logicalnames(
+                site_design, state_manager, build_data=build_data)
         return
 
     def apply_host_profile(self, site_design):
@@ -76,6 +88,14 @@ class BaremetalNode(drydock_provisioner.objects.hostprofile.HostProfile):
 
         hw_profile = site_design.get_hardware_profile(self.hardware_profile)
 
+        # Interfaces inherited unchanged are shared with the host profile,
+        # copy them before adding this node's selectors
+        if self.interfaces and self.parent_profile is not None:
+            parent = site_design.get_host_profile(self.parent_profile)
+            if self.interfaces is parent.interfaces:
+                self.interfaces = objects.HostInterfaceList.from_basic_list(
+                    [i.shallow_clone() for i in self.interfaces])
+
         for i in getattr(self, 'interfaces', []):
             for s in i.get_hw_slaves():
                 selector = hw_profile.resolve_alias("pci", s)
@@ -273,44 +293,72 @@ class BaremetalNode(drydock_provisioner.objects.hostprofile.HostProfile):
             % (alias_name, bus_type, address))
         return alias_name
 
-    def apply_logicalnames(self, site_design, state_manager):
+    def apply_logicalnames(self, site_design, state_manager, build_data=None):
         """Gets the logicalnames for devices from lshw.
 
         :param site_design: SiteDesign object.
         :param state_manager: DrydockState object.
+        :param build_data: List of the latest BuildData of this node, if
+                           already selected. If None, it is selected from
+                           ``state_manager``.
         :return: Returns sets a dictionary of aliases that map to logicalnames in self.logicalnames.
         """
         logicalnames = {}
 
-        results = state_manager.get_build_data(
-            node_name=self.get_name(), latest=True)
-        xml_data = None
+        if build_data is not None:
+            results = build_data
+        else:
+            results = state_manager.get_build_data(
+                node_name=self.get_name(), latest=True)
+        lshw_data = None
         for result in results:
             if result.generator == "lshw":
-                xml_data = result.data_element
+                lshw_data = result
                 break
 
-        if xml_data:
-            xml_root = fromstring(xml_data)
+        if lshw_data:
             try:
                 hardware_profile = site_design.get_hardware_profile(
                     self.hardware_profile)
-                for device in hardware_profile.devices:
-                    logicalname = self._apply_logicalname(
-                        xml_root, device.alias, device.bus_type,
-                        device.address)
-                    logicalnames[device.alias] = logicalname
             except errors.DesignError:
                 self.logger.exception(
                     "Failed to load hardware profile while "
                     "resolving logical names for node %s", self.get_name())
                 raise
+
+            devices = tuple((d.alias, d.bus_type, d.address)
+                            for d in hardware_profile.devices or [])
+
+            def resolve_logicalnames():
+                xml_root = fromstring(lshw_data.data_element)
+                return {
+                    alias: self._apply_logicalname(xml_root, alias, bus_type,
+                                                   address)
+                    for alias, bus_type, address in devices
+                }
+
+            # The lshw XML is only parsed once for each collection of build
+            # data, later compiles reuse the names resolved from it
+            cache_key = str((self.get_name(), str(lshw_data.task_id),
+                             str(lshw_data.collected_date), devices))
+            logicalnames = dict(
+                self.get_logicalname_cache().get(
+                    key=cache_key, createfunc=resolve_logicalnames))
         else:
             self.logger.info(
                 "No Build Data found for node_name %s" % (self.get_name()))
 
         self.logicalnames = logicalnames
 
+    @staticmethod
+    def get_logicalname_cache():
+        """Return the cache of logical names resolved from lshw build data.
+
+        Keys identify the node, the build data and the hardware profile
+        devices. Values are a dictionary of aliases to logicalnames.
+        """
+        return cache.get_cache('logicalnames')
+
     def get_logicalname(self, alias):
         """Gets the logicalname from self.logicalnames for an alias or returns the alias if not in the dictionary.
         """
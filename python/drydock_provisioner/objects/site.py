@@ -177,6 +177,8 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
 
     def __init__(self, **kwargs):
         super(SiteDesign, self).__init__(**kwargs)
+        # Keyed by field name, values are (list, {get_id(): position})
+        self._indexes = dict()
 
     # Assign UUID id
     def assign_id(self):
@@ -193,6 +195,50 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
     def set_site(self, site):
         self.site = site
 
+    def _index_item(self, field, item):
+        """Add the last item appended to list ``field`` to its index."""
+        model_list = getattr(self, field)
+        index = self._indexes.get(field)
+        if index is not None and index[0] is model_list:
+            index[1].setdefault(item.get_id(), len(model_list.objects) - 1)
+
+    def _find_item(self, field, key):
+        """Find the first item of list ``field`` with ``get_id()`` of ``key``.
+
+        The index of each list is checked against the list itself and
+        rebuilt when the list was replaced or modified outside of the
+        ``add_*`` methods.
+
+        :param field: Name of the list field to search
+        :param key: Value to match the ``get_id()`` value of the item returned
+        :return: the matching item, or None if there is no match
+        """
+        model_list = getattr(self, field, None)
+        if not model_list:
+            return None
+
+        index = self._indexes.get(field)
+        if index is not None and index[0] is model_list:
+            item = self._indexed_item(model_list, index[1], key)
+            if item is not None:
+                return item
+
+        positions = dict()
+        for i, item in enumerate(model_list.objects):
+            positions.setdefault(item.get_id(), i)
+        self._indexes[field] = (model_list, positions)
+
+        return self._indexed_item(model_list, positions, key)
+
+    @staticmethod
+    def _indexed_item(model_list, positions, key):
+        i = positions.get(key)
+        if i is not None and i < len(model_list.objects):
+            item = model_list.objects[i]
+            if item.get_id() == key:
+                return item
+        return None
+
     def add_network(self, new_network):
         if new_network is None:
             raise errors.DesignError("Invalid Network model")
@@ -201,12 +247,12 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.networks = objects.NetworkList()
 
         self.networks.append(new_network)
+        self._index_item('networks', new_network)
 
     def get_network(self, network_key):
-        if self.networks:
-            for n in self.networks:
-                if n.get_id() == network_key:
-                    return n
+        n = self._find_item('networks', network_key)
+        if n is not None:
+            return n
 
         raise errors.DesignError(
             "Network %s not found in design state" % network_key)
@@ -219,12 +265,12 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.network_links = objects.NetworkLinkList()
 
         self.network_links.append(new_network_link)
+        self._index_item('network_links', new_network_link)
 
     def get_network_link(self, link_key):
-        if self.network_links:
-            for l in self.network_links:
-                if l.get_id() == link_key:
-                    return l
+        l = self._find_item('network_links', link_key)
+        if l is not None:
+            return l
 
         raise errors.DesignError(
             "NetworkLink %s not found in design state" % link_key)
@@ -237,12 +283,13 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.racks = objects.RackList()
 
         self.racks.append(new_rack)
+        self._index_item('racks', new_rack)
 
     def get_rack(self, rack_key):
-        if self.racks:
-            for r in self.racks:
-                if r.get_id() == rack_key:
-                    return r
+        r = self._find_item('racks', rack_key)
+        if r is not None:
+            return r
+
         raise errors.DesignError(
             "Rack %s not found in design state" % rack_key)
 
@@ -255,16 +302,17 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.bootactions = objects.BootActionList()
 
         self.bootactions.append(new_ba)
+        self._index_item('bootactions', new_ba)
 
     def get_bootaction(self, ba_key):
         """Select a boot action from this site design with the matchkey key.
 
         :param ba_key: Value should match the ``get_id()`` value of the BootAction returned
         """
-        if self.bootactions:
-            for ba in self.bootactions:
-                if ba.get_id() == ba_key:
-                    return ba
+        ba = self._find_item('bootactions', ba_key)
+        if ba is not None:
+            return ba
+
         raise errors.DesignError(
             "BootAction %s not found in design state" % ba_key)
 
@@ -276,12 +324,12 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.host_profiles = objects.HostProfileList()
 
         self.host_profiles.append(new_host_profile)
+        self._index_item('host_profiles', new_host_profile)
 
     def get_host_profile(self, profile_key):
-        if self.host_profiles:
-            for p in self.host_profiles:
-                if p.get_id() == profile_key:
-                    return p
+        p = self._find_item('host_profiles', profile_key)
+        if p is not None:
+            return p
 
         raise errors.DesignError(
             "HostProfile %s not found in design state" % profile_key)
@@ -294,12 +342,12 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.hardware_profiles = objects.HardwareProfileList()
 
         self.hardware_profiles.append(new_hardware_profile)
+        self._index_item('hardware_profiles', new_hardware_profile)
 
     def get_hardware_profile(self, profile_key):
-        if self.hardware_profiles:
-            for p in self.hardware_profiles:
-                if p.get_id() == profile_key:
-                    return p
+        p = self._find_item('hardware_profiles', profile_key)
+        if p is not None:
+            return p
 
         raise errors.DesignError(
             "HardwareProfile %s not found in design state" % profile_key)
@@ -312,12 +360,12 @@ class SiteDesign(base.DrydockPersistentObject, base.DrydockObject):
             self.baremetal_nodes = objects.BaremetalNodeList()
 
         self.baremetal_nodes.append(new_baremetal_node)
+        self._index_item('baremetal_nodes', new_baremetal_node)
 
     def get_baremetal_node(self, node_key):
-        if self.baremetal_nodes:
-            for n in self.baremetal_nodes:
-                if n.get_id() == node_key:
-                    return n
+        n = self._find_item('baremetal_nodes', node_key)
+        if n is not None:
+            return n
 
         raise errors.DesignError(
             "BaremetalNode %s not found in design state" % node_key)
@@ -94,12 +94,14 @@ class ValidationMessage(TaskStatusMessage):
 class DocumentReference(base.DrydockObject):
     """Keep a reference to the original document that data was loaded from."""
 
-    VERSION = '1.0'
+    VERSION = '1.1'
 
     fields = {
         'doc_type': ovo_fields.StringField(),
         'doc_schema': ovo_fields.StringField(nullable=True),
         'doc_name': ovo_fields.StringField(nullable=True),
+        # Hash of the document content used to detect changed documents
+        'doc_hash': ovo_fields.StringField(nullable=True),
     }
 
     def __init__(self, **kwargs):
@@ -121,6 +123,14 @@ class DocumentReference(base.DrydockObject):
 
         return False
 
+    def __deepcopy__(self, memo):
+        """Share the reference when copying the model it is attached to.
+
+        References are not modified once created and can't be constructed
+        empty as the default deepcopy implementation requires.
+        """
+        return self
+
     def __hash__(self):
         """Override default hashing function."""
         return hash(
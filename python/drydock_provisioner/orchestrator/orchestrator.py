@@ -19,7 +19,10 @@ import logging
 import uuid
 import ulid2
 import concurrent.futures
+import collections
 import os
+import threading
+import copy
 
 import drydock_provisioner.config as config
 import drydock_provisioner.objects as objects
@@ -36,6 +39,8 @@ from .actions.orchestrator import DeployNodes
 from .actions.orchestrator import RelabelNodes
 from .actions.orchestrator import DestroyNodes
 from .validations.validator import Validator
+from .site_cache import EffectiveSiteCache
+from .site_cache import get_site_cache
 
 
 class Orchestrator(object):
@@ -58,6 +63,11 @@ class Orchestrator(object):
         self.state_manager = state_manager
         self.ingester = ingester
 
+        # LRU of compiled node models keyed by node name, values are tuples
+        # of the node's dependency key and the compiled model
+        self.compiled_nodes = collections.OrderedDict()
+        self.compiled_nodes_lock = threading.Lock()
+
         if self.state_manager is None or self.ingester is None:
             raise errors.OrchestratorError(
                 "Orchestrator requires instantiated state manager and ingester."
@@ -257,23 +267,82 @@ class Orchestrator(object):
         """Compute inheritance of the design model.
 
         Given a fully populated Site model, compute the effective
-        design by applying inheritance and references
+        design by applying inheritance and references. Nodes whose source
+        documents are unchanged since they were last compiled reuse the
+        previously compiled model. Other nodes are compiled concurrently
+        when ``design_compile_workers`` is greater than 1.
         """
         node_failed = []
 
         try:
             nodes = site_design.baremetal_nodes
-            for n in nodes or []:
+            to_compile = []
+            build_data_marker = None
+            if resolve_aliases and nodes:
+                build_data_marker = self._get_build_data_marker()
+            for n in list(nodes or []):
                 try:
-                    n.compile_applied_model(
+                    dependency_key = self._node_dependency_key(
+                        n,
                         site_design,
-                        state_manager=self.state_manager,
-                        resolve_aliases=resolve_aliases)
+                        resolve_aliases=resolve_aliases,
+                        build_data_marker=build_data_marker)
+                    compiled = self._get_compiled_node(n.name)
+                    if (dependency_key is not None and compiled is not None
+                            and compiled[0] == dependency_key):
+                        self.logger.debug(
+                            "Reusing compiled model for node %s.", n.name)
+                        # The cached node is private to the cache, so the
+                        # design gets a copy sharing nothing with the
+                        # host profiles of earlier designs
+                        nodes.replace_by_id(compiled[1].obj_clone())
+                        if n.parent_profile is not None:
+                            site_design.get_host_profile(
+                                n.parent_profile).apply_inheritance(
+                                    site_design)
+                        continue
+                    to_compile.append((n, dependency_key))
                 except Exception as ex:
                     node_failed.append(n)
                     self.logger.debug(
                         "Failed to build applied model for node %s.", n.name, exc_info=ex)
+
+            build_data = dict()
+            if resolve_aliases and to_compile:
+                build_data = self._get_lshw_build_data(
+                    [n for (n, _) in to_compile])
+
+            workers = config.config_mgr.conf.design_compile_workers
+            if workers > 1 and len(to_compile) > 1:
+                # Host profiles are shared between nodes, so compile them
+                # before compiling nodes concurrently
+                self._compile_host_profiles(
+                    site_design, [n for (n, _) in to_compile])
+                with concurrent.futures.ThreadPoolExecutor(
+                        max_workers=workers) as e:
+                    compile_futures = [
+                        e.submit(self._compile_node, n, site_design,
+                                 resolve_aliases, build_data.get(n.name))
+                        for (n, _) in to_compile
+                    ]
+                results = [f.result() for f in compile_futures]
+            else:
+                results = [
+                    self._compile_node(n, site_design, resolve_aliases,
+                                       build_data.get(n.name))
+                    for (n, _) in to_compile
+                ]
+
+            for (n, dependency_key), compiled in zip(to_compile, results):
+                if not compiled:
+                    node_failed.append(n)
+                elif dependency_key is not None:
+                    self._cache_compiled_node(n, dependency_key)
+
             if node_failed:
+                # Report failures in design order however nodes were compiled
+                node_order = [n.name for n in nodes]
+                node_failed.sort(key=lambda x: node_order.index(x.name))
                 raise errors.DesignError(
                     "Failed to build applied model for %s" % ",".join(
                         [x.name for x in node_failed]))
@@ -284,16 +353,180 @@ class Orchestrator(object):
 
         return
 
-    def get_described_site(self, design_ref):
+    def _get_compiled_node(self, node_name):
+        """Return the cached (dependency key, node) of ``node_name`` or None."""
+        with self.compiled_nodes_lock:
+            compiled = self.compiled_nodes.get(node_name)
+            if compiled is not None:
+                self.compiled_nodes.move_to_end(node_name)
+            return compiled
+
+    def _cache_compiled_node(self, node, dependency_key):
+        """Cache a copy of a compiled node, evicting the least recently used nodes."""
+        maxsize = config.config_mgr.conf.compiled_node_cache_size
+        if maxsize <= 0:
+            return
+
+        node = node.obj_clone()
+        with self.compiled_nodes_lock:
+            self.compiled_nodes[node.name] = (dependency_key, node)
+            self.compiled_nodes.move_to_end(node.name)
+            while len(self.compiled_nodes) > maxsize:
+                self.compiled_nodes.popitem(last=False)
+
+    def _compile_node(self,
+                      node,
+                      site_design,
+                      resolve_aliases=False,
+                      build_data=None):
+        """Compile the applied model of a node.
+
+        Return True if the node compiled successfully, otherwise False.
+
+        :param build_data: List of the latest BuildData of the node used to
+                           resolve aliases, if already selected
+        """
+        try:
+            node.compile_applied_model(
+                site_design,
+                state_manager=self.state_manager,
+                resolve_aliases=resolve_aliases,
+                build_data=build_data)
+            return True
+        except Exception as ex:
+            self.logger.debug(
+                "Failed to build applied model for node %s.", node.name, exc_info=ex)
+            return False
+
+    def _get_lshw_build_data(self, nodes):
+        """Select the latest lshw build data of ``nodes`` in one query.
+
+        Return a dictionary of node name to a list of BuildData to resolve
+        the node's aliases from. If the query fails the dictionary is empty
+        and each node selects its own build data when compiled.
+        """
+        try:
+            latest = self.state_manager.get_latest_build_data(
+                [n.name for n in nodes], generator='lshw')
+        except Exception as ex:
+            self.logger.debug(
+                "Failed to select build data for nodes.", exc_info=ex)
+            return dict()
+
+        return {n.name: [latest[n.name]] if n.name in latest else []
+                for n in nodes}
+
+    def _compile_host_profiles(self, site_design, nodes):
+        """Compile the host profiles that ``nodes`` inherit from.
+
+        Errors are ignored here and are reported when the node is compiled.
+        """
+        for n in nodes:
+            if n.parent_profile is not None:
+                try:
+                    site_design.get_host_profile(
+                        n.parent_profile).apply_inheritance(site_design)
+                except Exception as ex:
+                    self.logger.debug(
+                        "Failed to compile host profile %s." %
+                        n.parent_profile,
+                        exc_info=ex)
+
+    def _get_build_data_marker(self):
+        """Select a marker of the lshw build data collected so far.
+
+        Aliases are resolved from lshw build data, so models compiled with
+        ``resolve_aliases`` are only current while the marker is unchanged.
+        Return None if the marker cannot be selected.
+        """
+        try:
+            return self.state_manager.get_build_data_marker(generator='lshw')
+        except Exception as ex:
+            self.logger.debug(
+                "Failed to select build data marker.", exc_info=ex)
+            return None
+
+    def _node_dependency_key(self,
+                             node,
+                             site_design,
+                             resolve_aliases=False,
+                             build_data_marker=None):
+        """Compute a key of the source documents of a node's applied model.
+
+        The key is made from the hashes of the documents defining the node,
+        its host profile chain, its hardware profile and the networks and
+        network links it is attached to. Returns None if the key cannot be
+        computed, such as when documents were not loaded with a hash.
+
+        :param node: instance of objects.BaremetalNode
+        :param site_design: instance of objects.SiteDesign containing the node
+        :param resolve_aliases: whether device aliases will be resolved
+        :param build_data_marker: marker of the build data aliases are
+                                  resolved from, required if
+                                  ``resolve_aliases`` is True
+        """
+        if resolve_aliases and build_data_marker is None:
+            return None
+
+        try:
+            chain = [node]
+            while chain[-1].parent_profile is not None:
+                profile = site_design.get_host_profile(
+                    chain[-1].parent_profile)
+                if any(p is profile for p in chain):
+                    return None
+                chain.append(profile)
+
+            dependencies = list(chain)
+
+            hw_profile = next(
+                (p.hardware_profile for p in chain if p.hardware_profile),
+                None)
+            if hw_profile is not None:
+                dependencies.append(
+                    site_design.get_hardware_profile(hw_profile))
+
+            links = set()
+            networks = set()
+            for p in chain:
+                for i in p.interfaces or []:
+                    if i.network_link:
+                        links.add(i.network_link)
+                    # Networks prefixed with '!' are removed from the
+                    # interface rather than attached to it
+                    networks.update([
+                        n for n in i.networks or [] if not n.startswith('!')
+                    ])
+            for a in node.addressing or []:
+                networks.add(a.network)
+
+            dependencies.extend(
+                [site_design.get_network_link(link) for link in sorted(links)])
+            dependencies.extend(
+                [site_design.get_network(n) for n in sorted(networks)])
+        except errors.DesignError:
+            return None
+
+        doc_hashes = [getattr(d.doc_ref, 'doc_hash', None) for d in dependencies]
+        if None in doc_hashes:
+            return None
+
+        return (tuple(doc_hashes), resolve_aliases, build_data_marker)
+
+    def get_described_site(self, design_ref, design_blob=None):
         """Ingest design data referenced by design_ref.
 
         Return a tuple of the processing status and the populated instance
         of SiteDesign
 
         :param design_ref: Supported URI referencing a design document
+        :param design_blob: The design documents already retrieved from
+                            ``design_ref``, if None they are retrieved
         """
         status, site_design = self.ingester.ingest_data(
-            design_ref=design_ref, design_state=self.state_manager)
+            design_ref=design_ref,
+            design_state=self.state_manager,
+            design_blob=design_blob)
 
         return status, site_design
 
@@ -301,15 +534,65 @@ class Orchestrator(object):
         """Ingest design data and compile the effective model of the design.
 
         Return a tuple of the processing status and the populated instance
-        of SiteDesign after computing the inheritance chain
+        of SiteDesign after computing the inheritance chain. Compiled designs
+        are cached process-wide keyed on the content of the design, each
+        caller gets its own copy of the cached status and SiteDesign.
 
         :param design_ref: Supported URI referencing a design document
+        :param resolve_aliases: Whether to resolve device aliases from
+                                collected build data
+        """
+        try:
+            design_blob = self.state_manager.get_design_documents(design_ref)
+        except Exception as ex:
+            self.logger.error(
+                "Error getting site definition: %s" % str(ex), exc_info=ex)
+            return None, None
+
+        def compile_fn():
+            return self._compile_effective_site(
+                design_ref, design_blob, resolve_aliases=resolve_aliases)
+
+        # Aliases are resolved from build data, so the compiled model
+        # depends on the build data collected so far
+        generation = None
+        if resolve_aliases:
+            generation = self._get_build_data_marker()
+            if generation is None:
+                return compile_fn()[1]
+
+        cache_key = EffectiveSiteCache.design_key(
+            design_blob, resolve_aliases=resolve_aliases, generation=generation)
+
+        return get_site_cache().get(
+            cache_key, compile_fn, copy_fn=self._copy_effective_site)
+
+    @staticmethod
+    def _copy_effective_site(effective_site):
+        """Copy a cached tuple of processing status and SiteDesign."""
+        status, site_design = effective_site
+        return (copy.deepcopy(status) if status is not None else None,
+                site_design.obj_clone() if site_design is not None else None)
+
+    def _compile_effective_site(self,
+                                design_ref,
+                                design_blob,
+                                resolve_aliases=False):
+        """Compile the effective model of a design.
+
+        Return a tuple of whether the result can be cached and a tuple of
+        the processing status and the compiled SiteDesign.
+
+        :param design_ref: Supported URI referencing a design document
+        :param design_blob: The design documents retrieved from ``design_ref``
+        :param resolve_aliases: Whether to resolve device aliases
         """
         status = None
         site_design = None
         val = Validator(self)
         try:
-            status, site_design = self.get_described_site(design_ref)
+            status, site_design = self.get_described_site(
+                design_ref, design_blob=design_blob)
             if status.status == hd_fields.ValidationResult.Success:
                 self.compute_model_inheritance(
                     site_design, resolve_aliases=resolve_aliases)
@@ -326,8 +609,9 @@ class Orchestrator(object):
                 status.set_status(hd_fields.ActionResult.Failure)
             self.logger.error(
                 "Error getting site definition: %s" % str(ex), exc_info=ex)
+            return False, (status, site_design)
 
-        return status, site_design
+        return status is not None, (status, site_design)
 
     def get_target_nodes(self, task, failures=False, successes=False):
         """Compute list of target nodes for given ``task``.
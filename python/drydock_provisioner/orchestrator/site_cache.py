@@ -0,0 +1,138 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Process-wide cache of compiled effective site designs."""
+
+import collections
+import hashlib
+import logging
+import threading
+
+import drydock_provisioner.config as config
+
+
+class EffectiveSiteCache(object):
+    """LRU cache of compiled site designs keyed on design content.
+
+    Cached entries are never handed to callers directly. Each caller gets a
+    copy made by the ``copy_fn`` given to ``get``, so a caller modifying
+    its design does not affect the cache or other callers. Callers
+    compiling the same key concurrently wait for a single compilation
+    rather than each compiling the design.
+
+    :param maxsize: Maximum number of compiled designs to keep. A ``maxsize``
+                    of 0 disables caching.
+    """
+
+    def __init__(self, maxsize=16):
+        self.maxsize = maxsize
+        self.logger = logging.getLogger('drydock.orchestrator')
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        # Keys being compiled, values are threading.Event set when done
+        self._compiling = dict()
+
+    @staticmethod
+    def design_key(design_blob, resolve_aliases=False, generation=None):
+        """Compute the cache key of a design.
+
+        :param design_blob: The raw bytes of the design documents
+        :param resolve_aliases: Whether device aliases are resolved
+        :param generation: Marker of external state the compiled model
+                           depends on, such as collected build data
+        """
+        if isinstance(design_blob, str):
+            design_blob = design_blob.encode('utf-8')
+        return (hashlib.sha256(design_blob).hexdigest(), resolve_aliases,
+                generation)
+
+    def get(self, key, compile_fn, copy_fn=None):
+        """Get the compiled design for ``key``, compiling it if needed.
+
+        :param key: Cache key as returned by ``design_key``
+        :param compile_fn: Callable returning a tuple of
+                           (cacheable, value) for ``key``. Values that are
+                           not cacheable are returned to the caller only.
+        :param copy_fn: Callable returning a copy of a cached value to
+                        return to the caller. If None, the cached value is
+                        returned.
+        """
+        if copy_fn is None:
+            copy_fn = _no_copy
+
+        if self.maxsize <= 0:
+            return compile_fn()[1]
+
+        while True:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    cached = self._entries[key]
+                    break
+                event = self._compiling.get(key)
+                if event is None:
+                    event = threading.Event()
+                    self._compiling[key] = event
+                    cached = None
+                    break
+            event.wait()
+
+        if cached is not None:
+            return copy_fn(cached)
+
+        try:
+            cacheable, value = compile_fn()
+            if cacheable:
+                with self._lock:
+                    self._entries[key] = value
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+                return copy_fn(value)
+            return value
+        finally:
+            with self._lock:
+                self._compiling.pop(key, None)
+            event.set()
+
+    def clear(self):
+        """Discard all cached designs."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _no_copy(value):
+    return value
+
+
+_site_cache = None
+_site_cache_lock = threading.Lock()
+
+
+def get_site_cache():
+    """Return the process-wide instance of EffectiveSiteCache."""
+    global _site_cache
+
+    with _site_cache_lock:
+        if _site_cache is None:
+            _site_cache = EffectiveSiteCache(
+                maxsize=config.config_mgr.conf.effective_site_cache_size)
+        return _site_cache
+
+
+def reset_site_cache():
+    """Discard the process-wide EffectiveSiteCache and its contents."""
+    global _site_cache
+
+    with _site_cache_lock:
+        _site_cache = None
@@ -0,0 +1,132 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Index of the networks and addresses of a site design for validation."""
+
+import threading
+
+from netaddr import IPAddress, IPNetwork
+
+
+class AddressIndex(object):
+    """Networks, addresses and network links of a site design.
+
+    Addresses are encoded once as a tuple of IP version and integer value,
+    and networks as the integer range of their CIDR, so containment and
+    duplicate checks are integer comparisons and hash lookups. Each part
+    of the index is built the first time it is used and then shared by
+    all the rules validating the design.
+
+    :param site_design: instance of objects.SiteDesign
+    """
+
+    def __init__(self, site_design):
+        self.site_design = site_design
+
+        self._lock = threading.Lock()
+        self._networks = None
+        self._addresses = None
+        self._link_networks = None
+
+    @staticmethod
+    def encode_address(address):
+        """Encode an IP address as a tuple of (version, integer value).
+
+        :param address: string IP address
+        :raises: netaddr.AddrFormatError if ``address`` is not valid
+        """
+        ip = IPAddress(address)
+        return (ip.version, int(ip))
+
+    def get_networks(self):
+        """Return a dictionary of network name to network range.
+
+        Ranges are a tuple of (IPNetwork, version, first, last) where
+        ``first`` and ``last`` are the integer values of the first and last
+        addresses of the network.
+        """
+        with self._lock:
+            if self._networks is None:
+                networks = dict()
+                for net in self.site_design.networks or []:
+                    cidr = IPNetwork(net.cidr)
+                    networks[net.name] = (cidr, cidr.version, cidr.first,
+                                          cidr.last)
+                self._networks = networks
+            return self._networks
+
+    def network_contains(self, network_name, address):
+        """Check if ``address`` is within the CIDR of a network.
+
+        :param network_name: name of a network in the design
+        :param address: string IP address or encoded address
+        :raises: KeyError if ``network_name`` is not defined
+        """
+        (_, version, first, last) = self.get_networks()[network_name]
+        if not isinstance(address, tuple):
+            address = self.encode_address(address)
+        return address[0] == version and first <= address[1] <= last
+
+    def get_addresses(self):
+        """Return the static addresses assigned to baremetal nodes.
+
+        :return: list of tuples (node, address string, encoded address) in
+                 design order. The encoded address is None if the address
+                 cannot be parsed.
+        """
+        with self._lock:
+            if self._addresses is None:
+                addresses = []
+                for node in self.site_design.baremetal_nodes or []:
+                    for a in node.addressing or []:
+                        if a.address is None:
+                            continue
+                        try:
+                            encoded = self.encode_address(a.address)
+                        except Exception:
+                            encoded = None
+                        addresses.append((node, a.address, encoded))
+                self._addresses = addresses
+            return self._addresses
+
+    def get_duplicate_addresses(self):
+        """Find addresses assigned more than once.
+
+        :return: list of tuples (node, address string, first node) in design
+                 order for each assignment of an address already assigned
+                 to ``first node``
+        """
+        owners = dict()
+        duplicates = []
+        for (node, address, encoded) in self.get_addresses():
+            key = encoded if encoded is not None else address
+            if key in owners:
+                duplicates.append((node, address, owners[key]))
+            else:
+                owners[key] = node
+        return duplicates
+
+    def get_link_networks(self):
+        """Return a dictionary of network link name to allowed networks.
+
+        :return: dictionary of link name to a tuple of the list of allowed
+                 network names in design order and a set of the same names
+        """
+        with self._lock:
+            if self._link_networks is None:
+                link_networks = dict()
+                for link in self.site_design.network_links or []:
+                    allowed = link.allowed_networks or []
+                    link_networks[link.name] = (allowed, set(allowed))
+                self._link_networks = link_networks
+            return self._link_networks
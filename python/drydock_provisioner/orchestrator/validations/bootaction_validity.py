@@ -18,12 +18,14 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class BootactionDefined(Validators):
+    dependencies = Validators.NODE_KINDS + ('BootAction', 'Rack')
+
     """Issue warnings if no bootactions are defined for a node."""
 
     def __init__(self):
         super().__init__('Bootaction Definition', 'DD4001')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """Validate each node has at least one bootaction."""
         node_list = site_design.baremetal_nodes or []
         ba_list = site_design.bootactions or []
@@ -33,7 +35,7 @@ class BootactionDefined(Validators):
 
         for n in nodes_wo_ba:
             msg = "Node %s is not in scope for any bootactions." % n.name
-            self.report_warn(
+            context.report_warn(
                 msg, [n.doc_ref],
                 "It is expected all nodes have at least one post-deploy action."
             )
@@ -41,6 +43,8 @@ class BootactionDefined(Validators):
 
 
 class BootactionPackageListValid(Validators):
+    dependencies = ('BootAction', )
+
     """Check that bootactions with pkg_list assets are valid."""
 
     def __init__(self):
@@ -48,7 +52,7 @@ class BootactionPackageListValid(Validators):
         version_fields = r'(\d+:)?([a-zA-Z0-9.+~-]+)(-[a-zA-Z0-9.+~]+)'
         self.version_fields = re.compile(version_fields)
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """Validate that each package list in bootaction assets is valid."""
         ba_list = site_design.bootactions or []
 
@@ -57,7 +61,7 @@ class BootactionPackageListValid(Validators):
                 if a.type == 'pkg_list':
                     if not a.location and not a.package_list:
                         msg = "Bootaction has asset of type 'pkg_list' but no valid package data"
-                        self.report_error(
+                        context.report_error(
                             msg, [ba.doc_ref],
                             "pkg_list bootaction assets must specify a list of packages."
                         )
@@ -67,7 +71,7 @@ class BootactionPackageListValid(Validators):
                                 self.validate_package_version(v)
                             except errors.InvalidPackageListFormat as ex:
                                 msg = str(ex)
-                                self.report_error(
+                                context.report_error(
                                     msg, [ba.doc_ref],
                                     "pkg_list version specifications must be in a valid format."
                                 )
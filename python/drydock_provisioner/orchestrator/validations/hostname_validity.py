@@ -17,10 +17,12 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class HostnameValidity(Validators):
+    dependencies = Validators.NODE_KINDS + ('Network', )
+
     def __init__(self):
         super().__init__('Hostname Validity', 'DD3003')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         # Check FQDN length is <= 255 characters per RFC 1035
 
         node_list = site_design.baremetal_nodes or []
@@ -31,7 +33,7 @@ class HostnameValidity(Validators):
         for n in invalid_nodes:
             msg = "FQDN %s is invalid, greater than 255 characters." % n.get_fqdn(
                 site_design)
-            self.report_error(
+            context.report_error(
                 msg, [n.doc_ref],
                 "RFC 1035 requires full DNS names to be < 256 characters.")
 
@@ -46,7 +48,7 @@ class HostnameValidity(Validators):
                 if not valid_label.fullmatch(l):
                     msg = "FQDN %s is invalid - label '%s' is invalid." % (
                         n.get_fqdn(site_design), l)
-                    self.report_error(
+                    context.report_error(
                         msg, [n.doc_ref],
                         "RFC 1035 requires each label in a DNS name to be <= 63 characters and contain "
                         "only A-Z, a-z, 0-9, and hyphens.")
@@ -2,10 +2,12 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class HugepagesValidity(Validators):
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Hugepages', 'DD1008')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensures that if hugepages are specified in kernel params, that both
         size and count exist.
@@ -15,7 +17,7 @@ class HugepagesValidity(Validators):
                  and 'hugepagesz' not in baremetal_node.kernel_params)
                     or ('hugepages' not in baremetal_node.kernel_params
                         and 'hugepagesz' in baremetal_node.kernel_params)):
-                self.report_error(
+                context.report_error(
                     'Invalid hugepages kernel configuration',
                     [baremetal_node.doc_ref],
                     'hugepages and hugepagesz must be specified together')
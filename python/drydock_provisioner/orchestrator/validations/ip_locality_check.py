@@ -13,26 +13,26 @@
 # limitations under the License.
 from drydock_provisioner.orchestrator.validations.validators import Validators
 
-from netaddr import IPNetwork, IPAddress
-
 
 class IpLocalityCheck(Validators):
+    dependencies = Validators.NODE_KINDS + ('Network', )
+
     def __init__(self):
         super().__init__('IP Locality Check', "DD2002")
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensures that each IP addresses assigned to a baremetal node is within the defined CIDR for the network. Also
         verifies that the gateway IP for each static route of a network is within that network's CIDR.
         """
-        network_dict = {}  # Dictionary Format - network name: cidr
-
         baremetal_nodes_list = site_design.baremetal_nodes or []
         network_list = site_design.networks or []
+        # Dictionary Format - network name: (cidr, version, first, last)
+        network_dict = context.address_index.get_networks()
 
         if not network_list:
             msg = 'No networks found.'
-            self.report_warn(
+            context.report_warn(
                 msg, [],
                 'Site design likely incomplete without defined networks')
         else:
@@ -41,33 +41,30 @@ class IpLocalityCheck(Validators):
                 cidr = net.cidr
                 routes = net.routes or []
 
-                cidr_range = IPNetwork(cidr)
-                network_dict[name] = cidr_range
-
                 if routes:
                     for r in routes:
                         gateway = r.get('gateway')
 
                         if not gateway:
                             msg = 'No gateway found for route %s.' % routes
-                            self.report_error(
+                            context.report_error(
                                 msg, [net.doc_ref],
                                 diagnostic=
                                 "Define a network-local gateway for the route."
                             )
                         else:
-                            ip = IPAddress(gateway)
-                            if ip not in cidr_range:
+                            if not context.address_index.network_contains(
+                                    name, gateway):
                                 msg = (
                                     'The gateway IP Address %s is not within the defined CIDR: %s of %s.'
                                     % (gateway, cidr, name))
-                                self.report_error(
+                                context.report_error(
                                     msg, [net.doc_ref],
                                     "Route gateways must reside on the local network. Check "
                                     "gateway IP and CIDR netmask.")
         if not baremetal_nodes_list:
             msg = 'No baremetal_nodes found.'
-            self.report_warn(
+            context.report_warn(
                 msg, [],
                 "site design likely incomplete without defined networks.")
         else:
@@ -83,19 +80,19 @@ class IpLocalityCheck(Validators):
                         if ip_address_network_name not in network_dict:
                             msg = '%s is not a valid network.' \
                                   % (ip_address_network_name)
-                            self.report_error(
+                            context.report_error(
                                 msg, [node.doc_ref],
                                 "Define network or correct address definition."
                             )
                         else:
-                            if IPAddress(address) not in IPNetwork(
-                                    network_dict[ip_address_network_name]):
+                            if not context.address_index.network_contains(
+                                    ip_address_network_name, address):
                                 msg = (
                                     'The IP Address %s is not within the defined CIDR: %s of %s .'
                                     % (address,
-                                       network_dict[ip_address_network_name],
+                                       network_dict[ip_address_network_name][0],
                                        ip_address_network_name))
-                                self.report_error(
+                                context.report_error(
                                     msg, [node.doc_ref],
                                     "Define a valid address for this network.")
 
@@ -15,13 +15,15 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class MtuRational(Validators):
+    dependencies = ('Network', 'NetworkLink')
+
     MIN_MTU_SIZE = 1280
     MAX_MTU_SIZE = 65536
 
     def __init__(self):
         super().__init__('MTU Rationality', 'DD2003')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensure that the MTU for each network is equal or less than the MTU defined
         for the parent NetworkLink for that network.
@@ -39,7 +41,7 @@ class MtuRational(Validators):
                         or mtu > MtuRational.MAX_MTU_SIZE):
                 msg = ("MTU must be between %d and %d, value is %d" % (
                     MtuRational.MIN_MTU_SIZE, MtuRational.MAX_MTU_SIZE, mtu))
-                self.report_error(
+                context.report_error(
                     msg, [network_link.doc_ref],
                     "Define a valid MTU. Standard is 1500, Jumbo is 9100.")
 
@@ -54,7 +56,7 @@ class MtuRational(Validators):
                                 or network_mtu > MtuRational.MAX_MTU_SIZE):
                 msg = ("MTU must be between %d and %d, value is %d" % (
                     MtuRational.MIN_MTU_SIZE, MtuRational.MAX_MTU_SIZE, mtu))
-                self.report_error(
+                context.report_error(
                     msg, [network.doc_ref],
                     "Define a valid MTU. Standard is 1500, Jumbo is 9100.")
 
@@ -65,7 +67,7 @@ class MtuRational(Validators):
                 if network_mtu > parent_mtu:
                     msg = 'MTU must be <= the parent Network Link; for Network %s' % (
                         network.name)
-                    self.report_error(
+                    context.report_error(
                         msg, [network.doc_ref],
                         "Define a MTU less than or equal to that of the carrying network link."
                     )
@@ -17,10 +17,12 @@ import drydock_provisioner.objects.fields as hd_fields
 
 
 class NetworkTrunkingRational(Validators):
+    dependencies = ('Network', 'NetworkLink')
+
     def __init__(self):
         super().__init__('Network Trunking Rationalty', "DD2004")
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         This check ensures that for each NetworkLink if the allowed networks are greater then 1 trunking mode is
         enabled. It also makes sure that if trunking mode is disabled then a default network is defined.
@@ -34,7 +36,7 @@ class NetworkTrunkingRational(Validators):
                     trunk_mode == hd_fields.NetworkLinkTrunkingMode.Disabled):
                 msg = ('If there is more than 1 allowed network,'
                        'trunking mode must be enabled')
-                self.report_error(
+                context.report_error(
                     msg, [network_link.doc_ref],
                     "Reduce the allowed network list to 1 or enable trunking on the link."
                 )
@@ -44,7 +46,7 @@ class NetworkTrunkingRational(Validators):
                     Disabled and network_link.native_network is None):
 
                 msg = 'Trunking mode is disabled, a trunking default_network must be defined'
-                self.report_error(
+                context.report_error(
                     msg, [network_link.doc_ref],
                     "Non-trunked links must have a native network defined.")
             elif (network_link.trunk_mode == hd_fields.NetworkLinkTrunkingMode.
@@ -52,7 +54,7 @@ class NetworkTrunkingRational(Validators):
                 network = site_design.get_network(network_link.native_network)
                 if network and network.vlan_id:
                     msg = "Network link native network has a defined VLAN tag."
-                    self.report_error(
+                    context.report_error(
                         msg, [network.doc_ref, network_link.doc_ref],
                         "Tagged network not allowed on non-trunked network links."
                     )
@@ -15,10 +15,12 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class IpmiValidity(Validators):
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Valid IPMI Configuration', 'DD4001')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """For all IPMI-based nodes, check for a valid configuration.
 
         1. Check that the node has an IP address assigned on the oob network
@@ -35,8 +37,8 @@ class IpmiValidity(Validators):
                         msg = (
                             'OOB parameter %s for IPMI node %s missing.' % p,
                             baremetal_node.name)
-                        self.report_error(msg, [baremetal_node.doc_ref],
-                                          "Define OOB parameter %s" % p)
+                        context.report_error(msg, [baremetal_node.doc_ref],
+                                             "Define OOB parameter %s" % p)
                 oob_addr = None
                 if baremetal_node.oob_parameters.get('network', None):
                     oob_net = baremetal_node.oob_parameters.get('network')
@@ -46,7 +48,7 @@ class IpmiValidity(Validators):
                 if not oob_addr:
                     msg = ('OOB address missing for IPMI node %s.' %
                            baremetal_node.name)
-                    self.report_error(
+                    context.report_error(
                         msg, [baremetal_node.doc_ref],
                         "Provide address to node OOB interface.")
         return
@@ -15,10 +15,12 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class LibvirtValidity(Validators):
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Valid Libvirt Configuration', 'DD4002')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """For all libvirt-based nodes, check for a valid configuration.
 
         1. Check that the node has a valid libvirt_uri
@@ -33,18 +35,18 @@ class LibvirtValidity(Validators):
                 if not libvirt_uri:
                     msg = ('OOB parameter libvirt_uri missing for node %s.' %
                            baremetal_node.name)
-                    self.report_error(
+                    context.report_error(
                         msg, [baremetal_node.doc_ref],
                         "Provide libvirt URI to node hypervisor.")
                 else:
                     if not libvirt_uri.startswith("qemu+ssh"):
                         msg = 'OOB parameter libvirt_uri has invalid scheme.'
-                        self.report_error(
+                        context.report_error(
                             msg, [baremetal_node.doc_ref],
                             "Only scheme 'qemu+ssh' is supported.")
                 if not baremetal_node.boot_mac:
                     msg = 'libvirt-based node requries defined boot MAC address.'
-                    self.report_error(
+                    context.report_error(
                         msg, [baremetal_node.doc_ref],
                         "Specify the node's PXE MAC address in metadata.boot_mac"
                     )
@@ -18,7 +18,7 @@ class PlatformSelection(Validators):
     def __init__(self):
         super().__init__('Platform Selection', 'DD3001')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """Validate that the platform selection for all nodes is valid.
 
         Each node specifies an ``image`` and a ``kernel`` to use for
@@ -30,7 +30,7 @@ class PlatformSelection(Validators):
         except KeyError:
             msg = ("Platform Validation: No enabled node driver, image"
                    "and kernel selections not validated.")
-            self.report_warn(
+            context.report_warn(
                 msg, [],
                 "Cannot validate platform selection without accessing the node provisioner."
             )
@@ -50,12 +50,12 @@ class PlatformSelection(Validators):
                 if n.kernel in valid_kernels[n.image]:
                     continue
                 msg = "Platform Validation: invalid kernel %s" % (n.kernel)
-                self.report_error(
+                context.report_error(
                     msg, [n.doc_ref], "Select a valid kernel from: %s" %
                     ",".join(valid_kernels[n.image]))
                 continue
             msg = "Platform Validation: invalid image %s" % (n.image)
-            self.report_error(
+            context.report_error(
                 msg, [n.doc_ref],
                 "Select a valid image from: %s" % ",".join(valid_images))
 
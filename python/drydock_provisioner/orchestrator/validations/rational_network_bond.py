@@ -15,10 +15,12 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class RationalNetworkBond(Validators):
+    dependencies = ('NetworkLink', )
+
     def __init__(self):
         super().__init__('Network Bond Rationality', 'DD1006')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         This check ensures that each NetworkLink has a rational bonding setup.
         If the bonding mode is set to 'disabled' then it ensures that no other options are specified.
@@ -42,7 +44,7 @@ class RationalNetworkBond(Validators):
                         ]
                 ]):
                     msg = 'If bonding mode is disabled no other bond option can be specified'
-                    self.report_error(
+                    context.report_error(
                         msg, [network_link.doc_ref],
                         "Enable a bonding mode or remove the bond options.")
 
@@ -52,7 +54,7 @@ class RationalNetworkBond(Validators):
                 if network_link.bonding_up_delay < mon_rate:
                     msg = ('Up delay %d is less than mon rate %d' %
                            (network_link.bonding_up_delay, mon_rate))
-                    self.report_error(
+                    context.report_error(
                         msg, [network_link.doc_ref],
                         "Link up delay must be equal or greater than the mon_rate"
                     )
@@ -60,7 +62,7 @@ class RationalNetworkBond(Validators):
                 if network_link.bonding_down_delay < mon_rate:
                     msg = ('Down delay %d is less than mon rate %d' %
                            (network_link.bonding_down_delay, mon_rate))
-                    self.report_error(
+                    context.report_error(
                         msg, [network_link.doc_ref],
                         "Link down delay must be equal or greater than the mon_rate"
                     )
@@ -70,14 +72,14 @@ class RationalNetworkBond(Validators):
                 if network_link.get('bonding_xmit_hash'):
                     msg = ('Hash cannot be defined if bond mode is %s' %
                            (bonding_mode))
-                    self.report_error(
+                    context.report_error(
                         msg, [network_link.doc_ref],
                         "Hash mode is only applicable to LACP (802.3ad)")
 
                 if network_link.get('bonding_peer_rate'):
                     msg = ('Peer rate cannot be defined if bond mode is %s' %
                            (bonding_mode))
-                    self.report_error(
+                    context.report_error(
                         msg, [network_link.doc_ref],
                         "Peer rate is only applicable to LACP (802.3ad)")
 
@@ -12,27 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from drydock_provisioner.orchestrator.validations.storage_table import NodeStorage
 from drydock_provisioner.orchestrator.validations.validators import Validators
 
 class StorageMountpoints(Validators):
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Storage Mountpoint', "DD2004")
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensures that any partitioned physical device or logical volumes
         in a volume group do not use duplicate mount points.
         """
-        baremetal_nodes = site_design.baremetal_nodes or []
-
-        for baremetal_node in baremetal_nodes:
+        for node_storage in context.storage_table.get_nodes():
+            baremetal_node = node_storage.node
             mountpoint_list = []
-            storage_device_list = baremetal_node.storage_devices or []
-            for storage_device in storage_device_list:
+            for storage_device in node_storage.select(NodeStorage.DEVICE):
                 # Parsing the partitions and volume group of
                 # physical storage devices
 
-                partition_list = storage_device.partitions or []
+                partition_list = node_storage.select(NodeStorage.PARTITION,
+                                                     storage_device.name)
                 device_volume_group = storage_device.volume_group
 
                 for partition in partition_list:
@@ -45,7 +47,7 @@ class StorageMountpoints(Validators):
                     if mountpoint in mountpoint_list:
                         msg = ('Mountpoint "{}" already exists'
                                .format(mountpoint))
-                        self.report_error(
+                        context.report_error(
                             msg, [baremetal_node.doc_ref],
                             'Please use unique mountpoints.')
                         return
@@ -53,25 +55,22 @@ class StorageMountpoints(Validators):
                         mountpoint_list.append(mountpoint)
 
                 if device_volume_group:
-                    volume_groups = baremetal_node.volume_groups or []
-                    for volume_group in volume_groups:
-                        if volume_group.name == device_volume_group:
-                            logical_volume_list = volume_group.logical_volumes or []
-                            for logical_volume in logical_volume_list:
-                                # Load the mount point of each logical volume
-                                # which belongs to the assigned volume group
-                                # to a list
-
-                                mountpoint = logical_volume.mountpoint
-                                if mountpoint is None:
-                                    continue
-                                if mountpoint in mountpoint_list:
-                                    msg = ('Mountpoint "{}" already exists'
-                                           .format(mountpoint))
-                                    self.report_error(
-                                        msg, [baremetal_node.doc_ref],
-                                        'Please use unique mountpoints.')
-                                    return
-                                else:
-                                    mountpoint_list.append(mountpoint)
+                    # Load the mount point of each logical volume
+                    # which belongs to the assigned volume group
+                    # to a list
+                    logical_volume_list = node_storage.select(
+                        NodeStorage.LOGICAL_VOLUME, device_volume_group)
+                    for logical_volume in logical_volume_list:
+                        mountpoint = logical_volume.mountpoint
+                        if mountpoint is None:
+                            continue
+                        if mountpoint in mountpoint_list:
+                            msg = ('Mountpoint "{}" already exists'
+                                   .format(mountpoint))
+                            context.report_error(
+                                msg, [baremetal_node.doc_ref],
+                                'Please use unique mountpoints.')
+                            return
+                        else:
+                            mountpoint_list.append(mountpoint)
         return
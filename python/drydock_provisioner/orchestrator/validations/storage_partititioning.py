@@ -11,26 +11,29 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from drydock_provisioner.orchestrator.validations.storage_table import NodeStorage
 from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class StoragePartitioning(Validators):
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Storage Partitioning', "DD2002")
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         This checks that for each storage device a partition list OR volume group is defined. Also for each partition
         list it ensures that a file system and partition volume group are not defined in the same partition.
         """
-        baremetal_nodes = site_design.baremetal_nodes or []
         volume_group_check_list = []
 
-        for baremetal_node in baremetal_nodes:
-            storage_devices_list = baremetal_node.storage_devices or []
+        for node_storage in context.storage_table.get_nodes():
+            baremetal_node = node_storage.node
 
-            for storage_device in storage_devices_list:
-                partitions_list = storage_device.partitions or []
+            for storage_device in node_storage.select(NodeStorage.DEVICE):
+                partitions_list = node_storage.select(NodeStorage.PARTITION,
+                                                      storage_device.name)
                 volume_group = storage_device.volume_group
 
                 # error if both or neither is defined
@@ -39,7 +42,7 @@ class StoragePartitioning(Validators):
                     msg = (
                         'Either a volume group OR partitions must be defined for each storage '
                         'device.')
-                    self.report_error(
+                    context.report_error(
                         msg, [baremetal_node.doc_ref],
                         "A storage device must be used for exactly one of a volume group "
                         "physical volume or carved into partitions.")
@@ -56,7 +59,7 @@ class StoragePartitioning(Validators):
                     if all([fstype, partition_volume_group]):
                         msg = ('Both a volume group AND file system cannot be '
                                'defined in a single partition')
-                        self.report_error(
+                        context.report_error(
                             msg, [baremetal_node.doc_ref],
                             "A partition can be used for only one of a volume group "
                             "physical volume or formatted as a filesystem.")
@@ -67,12 +70,11 @@ class StoragePartitioning(Validators):
 
             # checks all volume groups are assigned to a partition or storage device
             # if one exist that wasn't found earlier it is unassigned
-            all_volume_groups = baremetal_node.volume_groups or []
-            for volume_group in all_volume_groups:
+            for volume_group in node_storage.select(NodeStorage.VOLUME_GROUP):
                 if volume_group.name not in volume_group_check_list:
                     msg = ('Volume group %s not assigned any physical volumes'
                            % (volume_group.name))
-                    self.report_error(
+                    context.report_error(
                         msg, [baremetal_node.doc_ref],
                         "Each volume group should be assigned at least one storage device "
                         "or partition as a physical volume.")
@@ -11,72 +11,81 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from drydock_provisioner.orchestrator.validations.storage_table import NodeStorage
 from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class StorageSizing(Validators):
+    version = '2'
+    dependencies = Validators.NODE_KINDS
+
     def __init__(self):
         super().__init__('Storage Sizing', 'DD2003')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensures that for a partitioned physical device or logical volumes
         in a volume group, if sizing is a percentage then those percentages
         do not sum > 99% and have no negative values
         """
-        baremetal_nodes = site_design.baremetal_nodes or []
-
-        for baremetal_node in baremetal_nodes:
-            storage_device_list = baremetal_node.storage_devices or []
+        for node_storage in context.storage_table.get_nodes():
+            baremetal_node = node_storage.node
+            volume_errors = self.check_volume_groups(node_storage)
 
-            for storage_device in storage_device_list:
-                partition_list = storage_device.partitions or []
+            for storage_device in node_storage.select(NodeStorage.DEVICE):
                 partition_sum = 0
-                for partition in partition_list:
-                    size = partition.size
-                    percent = size.split('%')
-                    if len(percent) == 2:
-                        if int(percent[0]) < 0:
+                for partition in node_storage.select(NodeStorage.PARTITION,
+                                                     storage_device.name):
+                    if partition.percent is not None:
+                        if partition.percent < 0:
                             msg = (
                                 'Storage partition %s on device %s size is < 0'
                                 % (partition.name, storage_device.name))
-                            self.report_error(
+                            context.report_error(
                                 msg, [baremetal_node.doc_ref],
                                 "Partition size must be a positive number.")
 
-                        partition_sum += int(percent[0])
+                        partition_sum += partition.percent
 
                     if partition_sum > 99:
                         msg = (
                             'Cumulative partition sizes on device %s is greater than 99%%.'
                             % (storage_device.name))
-                        self.report_error(
+                        context.report_error(
                             msg, [baremetal_node.doc_ref],
                             "Percentage-based sizes must sum to less than 100%."
                         )
 
-                volume_groups = baremetal_node.volume_groups or []
-                volume_sum = 0
-                for volume_group in volume_groups:
-                    logical_volume_list = volume_group.logical_volumes or []
-                    for logical_volume in logical_volume_list:
-                        size = logical_volume.size
-                        percent = size.split('%')
-                        if len(percent) == 2:
-                            if int(percent[0]) < 0:
-                                msg = ('Logical Volume %s size is < 0 ' %
-                                       (logical_volume.name))
-                                self.report_error(msg,
-                                                  [baremetal_node.doc_ref], "")
-                            volume_sum += int(percent[0])
-
-                    if volume_sum > 99:
-                        msg = ('Cumulative logical volume size is greater '
-                               'than 99% in volume group %s' %
-                               (volume_group.name))
-                        self.report_error(
-                            msg, [baremetal_node.doc_ref],
-                            "Percentage-based sizes must sum to less than 100%."
-                        )
+                for (msg, diagnostic) in volume_errors:
+                    context.report_error(msg, [baremetal_node.doc_ref],
+                                         diagnostic)
 
         return
+
+    @staticmethod
+    def check_volume_groups(node_storage):
+        """Check the percentage sizes of the logical volumes of a node.
+
+        :param node_storage: instance of storage_table.NodeStorage
+        :return: list of tuples (message, diagnostic) of the errors found
+        """
+        errors = []
+        volume_sum = 0
+        for volume_group in node_storage.select(NodeStorage.VOLUME_GROUP):
+            for logical_volume in node_storage.select(
+                    NodeStorage.LOGICAL_VOLUME, volume_group.name):
+                if logical_volume.percent is not None:
+                    if logical_volume.percent < 0:
+                        msg = ('Logical Volume %s size is < 0 ' %
+                               (logical_volume.name))
+                        errors.append((msg, ""))
+                    volume_sum += logical_volume.percent
+
+            if volume_sum > 99:
+                msg = ('Cumulative logical volume size is greater '
+                       'than 99% in volume group %s' % (volume_group.name))
+                errors.append(
+                    (msg,
+                     "Percentage-based sizes must sum to less than 100%."))
+
+        return errors
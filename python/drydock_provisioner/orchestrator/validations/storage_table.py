@@ -0,0 +1,145 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Table of the storage layout of a site design for validation."""
+
+import collections
+import threading
+
+from drydock_provisioner.orchestrator.util import SimpleBytes
+
+# A storage device, partition, volume group or logical volume of a node.
+# ``parent`` is the name of the storage device of a partition or the
+# volume group of a logical volume. ``percent`` and ``bytes`` are the
+# parsed ``size`` or None if it is not of that form.
+StorageRow = collections.namedtuple('StorageRow', [
+    'kind', 'parent', 'name', 'size', 'percent', 'bytes', 'mountpoint',
+    'fstype', 'volume_group'
+])
+
+
+class NodeStorage(object):
+    """Storage rows of a single baremetal node in design order.
+
+    Each storage device row is followed by the rows of its partitions and
+    each volume group row by the rows of its logical volumes.
+
+    :param node: instance of objects.BaremetalNode
+    """
+
+    DEVICE = 'device'
+    PARTITION = 'partition'
+    VOLUME_GROUP = 'volume_group'
+    LOGICAL_VOLUME = 'logical_volume'
+
+    def __init__(self, node):
+        self.node = node
+        self.rows = []
+
+    def select(self, kind, parent=None):
+        """Return the rows of ``kind`` in design order.
+
+        :param kind: one of the row kinds of NodeStorage
+        :param parent: if not None, only return rows of this parent
+        """
+        return [
+            r for r in self.rows
+            if r.kind == kind and (parent is None or r.parent == parent)
+        ]
+
+
+class StorageTable(object):
+    """Storage layout of the baremetal nodes of a site design.
+
+    Size expressions are parsed once when the table is built and then
+    shared by all the rules validating the design.
+
+    :param site_design: instance of objects.SiteDesign
+    """
+
+    def __init__(self, site_design):
+        self.site_design = site_design
+
+        self._lock = threading.Lock()
+        self._nodes = None
+
+    @staticmethod
+    def parse_percent(size):
+        """Parse a percentage size expression such as ``30%``.
+
+        :param size: string size expression
+        :return: integer percentage or None if ``size`` is not a percentage
+        """
+        if size is None:
+            return None
+        percent = size.split('%')
+        if len(percent) != 2:
+            return None
+        try:
+            return int(percent[0])
+        except ValueError:
+            return None
+
+    @staticmethod
+    def parse_bytes(size):
+        """Parse an absolute size expression such as ``20g``.
+
+        :param size: string size expression
+        :return: integer number of bytes or None if ``size`` is not valid
+        """
+        if size is None:
+            return None
+        try:
+            return SimpleBytes.calculate_bytes(size)
+        except Exception:
+            return None
+
+    def get_nodes(self):
+        """Return a list of NodeStorage for each baremetal node in order."""
+        with self._lock:
+            if self._nodes is None:
+                self._nodes = [
+                    self._build_node(n)
+                    for n in self.site_design.baremetal_nodes or []
+                ]
+            return self._nodes
+
+    def _build_node(self, node):
+        node_storage = NodeStorage(node)
+        rows = node_storage.rows
+
+        for d in node.storage_devices or []:
+            rows.append(
+                StorageRow(NodeStorage.DEVICE, None, d.name, None, None, None,
+                           None, None, d.volume_group))
+            for p in d.partitions or []:
+                rows.append(
+                    self._volume_row(NodeStorage.PARTITION, d.name, p,
+                                     p.fstype, p.volume_group))
+
+        for vg in node.volume_groups or []:
+            rows.append(
+                StorageRow(NodeStorage.VOLUME_GROUP, None, vg.name, None, None,
+                           None, None, None, None))
+            for lv in vg.logical_volumes or []:
+                rows.append(
+                    self._volume_row(NodeStorage.LOGICAL_VOLUME, vg.name, lv,
+                                     None, None))
+
+        return node_storage
+
+    def _volume_row(self, kind, parent, volume, fstype, volume_group):
+        return StorageRow(kind, parent, volume.name, volume.size,
+                          self.parse_percent(volume.size),
+                          self.parse_bytes(volume.size), volume.mountpoint,
+                          fstype, volume_group)
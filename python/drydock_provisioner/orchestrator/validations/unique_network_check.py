@@ -15,50 +15,44 @@ from drydock_provisioner.orchestrator.validations.validators import Validators
 
 
 class UniqueNetworkCheck(Validators):
+    dependencies = Validators.NODE_KINDS + ('NetworkLink', )
+
     def __init__(self):
         super().__init__('Allowed Network Check', 'DD1007')
 
-    def run_validation(self, site_design, orchestrator=None):
+    def run_validation(self, site_design, context, orchestrator=None):
         """
         Ensures that each network name appears at most once between all NetworkLink
         allowed networks
         """
-        network_link_list = site_design.network_links or []
-        link_allowed_nets = {}
+        # Dictionary Format - link name: (allowed network list, set)
+        link_allowed_nets = context.address_index.get_link_networks()
+        link_names = list(link_allowed_nets)
 
-        for network_link in network_link_list:
-            allowed_network_list = network_link.allowed_networks
-            link_allowed_nets[network_link.name] = allowed_network_list
+        # Positions in link_names of the links allowing each network
+        network_links = {}
+        for pos, network_link_name in enumerate(link_names):
+            for name in link_allowed_nets[network_link_name][1]:
+                network_links.setdefault(name, []).append(pos)
 
         # This checks the allowed networks for each network link against
-        # the other allowed networks
-        checked_pairs = []
-        for network_link_name in link_allowed_nets:
-            allowed_network_list_1 = link_allowed_nets[network_link_name]
-
-            for network_link_name_2 in link_allowed_nets:
-                if (network_link_name is not network_link_name_2
-                        and sorted([network_link_name, network_link_name_2
-                                    ]) not in checked_pairs):
-                    checked_pairs.append(
-                        sorted([network_link_name, network_link_name_2]))
-                    allowed_network_list_2 = link_allowed_nets[
-                        network_link_name_2]
-                    # creates a list of duplicated allowed networks
-                    duplicated_names = [
-                        i for i in allowed_network_list_1
-                        if i in allowed_network_list_2
-                    ]
+        # those of the network links following it
+        for pos, network_link_name in enumerate(link_names):
+            duplicated_names = []
+            for name in link_allowed_nets[network_link_name][0]:
+                duplicated_names.extend(
+                    (other, name) for other in network_links[name]
+                    if other > pos)
 
-                    for name in duplicated_names:
-                        msg = (
-                            'Allowed network %s duplicated on NetworkLink %s and NetworkLink '
-                            '%s' % (name, network_link_name,
-                                    network_link_name_2))
-                        self.report_error(
-                            msg, [],
-                            "Each network is only allowed to cross a single network link."
-                        )
+            # Sort is stable, names stay in allowed network order
+            for (other, name) in sorted(duplicated_names, key=lambda d: d[0]):
+                msg = (
+                    'Allowed network %s duplicated on NetworkLink %s and NetworkLink '
+                    '%s' % (name, network_link_name, link_names[other]))
+                context.report_error(
+                    msg, [],
+                    "Each network is only allowed to cross a single network link."
+                )
 
         node_list = site_design.baremetal_nodes or []
 
@@ -68,11 +62,11 @@ class UniqueNetworkCheck(Validators):
                 nic_link = i.network_link
                 for nw in i.networks:
                     try:
-                        if nw not in link_allowed_nets[nic_link]:
+                        if nw not in link_allowed_nets[nic_link][1]:
                             msg = (
                                 "Interface %s attached to network %s not allowed on interface link"
                                 % (i.get_name(), nw))
-                            self.report_error(
+                            context.report_error(
                                 msg, [n.doc_ref],
                                 "Interfaces can only be attached to networks allowed on the network link "
                                 "connected to the interface.")
@@ -80,7 +74,7 @@ class UniqueNetworkCheck(Validators):
                         msg = (
                             "Interface %s connected to undefined network link %s."
                             % (i.get_name(), nic_link))
-                        self.report_error(
+                        context.report_error(
                             msg, [n.doc_ref],
                             "Define the network link attached to this interface."
                         )
@@ -13,10 +13,20 @@
 # limitations under the License.
 """Business Logic Validation"""
 
+import concurrent.futures
+import hashlib
+
+from beaker.cache import CacheManager
+from beaker.util import parse_cache_config_options
+
+import drydock_provisioner.config as config
 import drydock_provisioner.objects.fields as hd_fields
 
 from drydock_provisioner.objects.validation import Validation
 
+from drydock_provisioner.orchestrator.validations.address_index import AddressIndex
+from drydock_provisioner.orchestrator.validations.storage_table import StorageTable
+
 from drydock_provisioner.orchestrator.validations.boot_storage_rational import BootStorageRational
 from drydock_provisioner.orchestrator.validations.hugepages_validity import HugepagesValidity
 from drydock_provisioner.orchestrator.validations.ip_locality_check import IpLocalityCheck
@@ -35,6 +45,13 @@ from drydock_provisioner.orchestrator.validations.bootaction_validity import Boo
 from drydock_provisioner.orchestrator.validations.bootaction_validity import BootactionPackageListValid
 from drydock_provisioner.orchestrator.validations.storage_mountpoints import StorageMountpoints
 
+cache_opts = {
+    'cache.type': 'memory',
+    'expire': 1800,
+}
+
+cache = CacheManager(**parse_cache_config_options(cache_opts))
+
 
 class Validator():
     def __init__(self, orchestrator):
@@ -54,16 +71,41 @@ class Validator():
         defined, update it with validation messages. Otherwise a new status instance
         will be created and returned.
 
+        Rules are run concurrently when ``validation_workers`` is greater
+        than 1. Messages are reported in the order of the rule set however
+        the rules were run.
+
         :param site_design: instance of objects.SiteDesign
         :param result_status: instance of objects.TaskStatus
         """
         if result_status is None:
             result_status = Validation()
 
+        kind_hashes = self.hash_document_kinds(site_design)
+        # Rules checking addresses share one index of the design
+        address_index = AddressIndex(site_design)
+        # Rules checking storage share one table of parsed sizes
+        storage_table = StorageTable(site_design)
+
+        workers = config.config_mgr.conf.validation_workers
+        if workers > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=workers) as e:
+                rule_futures = [
+                    e.submit(self._execute_rule, rule, site_design,
+                             kind_hashes, address_index, storage_table)
+                    for rule in rule_set
+                ]
+            rule_results = [f.result() for f in rule_futures]
+        else:
+            rule_results = [
+                self._execute_rule(rule, site_design, kind_hashes,
+                                   address_index, storage_table)
+                for rule in rule_set
+            ]
+
         validation_error = False
-        for rule in rule_set:
-            message_list = rule.execute(
-                site_design=site_design, orchestrator=self.orchestrator)
+        for message_list in rule_results:
             result_status.message_list.extend(message_list)
             error_msg = [m for m in message_list if m.error]
             result_status.error_count = result_status.error_count + len(
@@ -81,6 +123,96 @@ class Validator():
 
         return result_status
 
+    def _execute_rule(self, rule, site_design, kind_hashes, address_index,
+                      storage_table):
+        """Run ``rule`` or reuse its results for unchanged documents.
+
+        :param rule: instance of Validators
+        :param site_design: instance of objects.SiteDesign
+        :param kind_hashes: dictionary as returned by ``hash_document_kinds``
+        :param address_index: AddressIndex of ``site_design``
+        :param storage_table: StorageTable of ``site_design``
+        """
+        cache_key = self.rule_key(rule, kind_hashes)
+
+        def run_rule():
+            return rule.execute(
+                site_design=site_design,
+                orchestrator=self.orchestrator,
+                address_index=address_index,
+                storage_table=storage_table)
+
+        if cache_key is None:
+            return run_rule()
+
+        return list(
+            self.get_result_cache().get(key=cache_key, createfunc=run_rule))
+
+    @staticmethod
+    def get_result_cache():
+        """Return the cache of validation rule results keyed by rule_key."""
+        return cache.get_cache('validation_results')
+
+    @staticmethod
+    def rule_key(rule, kind_hashes):
+        """Compute the cache key of the results of ``rule``.
+
+        Return None if the results of ``rule`` cannot be cached.
+
+        :param rule: instance of Validators
+        :param kind_hashes: dictionary as returned by ``hash_document_kinds``
+        """
+        if rule.dependencies is None:
+            return None
+
+        dependency_hashes = []
+        for kind in sorted(rule.dependencies):
+            kind_hash = kind_hashes.get(kind)
+            if kind_hash is None:
+                return None
+            dependency_hashes.append(kind_hash)
+
+        return "%s:%s:%s" % (rule.__class__.__name__, rule.version,
+                             ":".join(dependency_hashes))
+
+    @staticmethod
+    def hash_document_kinds(site_design):
+        """Hash the source documents of each kind in a site design.
+
+        The hash of a kind is None if the hash of any of its documents
+        is not known, e.g. the documents were not ingested from Deckhand.
+
+        :param site_design: instance of objects.SiteDesign
+        :return: dictionary of document kind to hash
+        """
+        kind_hashes = dict()
+
+        for kind, attr in DOCUMENT_KINDS.items():
+            items = getattr(site_design, attr, None) or []
+            digest = hashlib.sha256()
+            for i in items:
+                doc_hash = getattr(getattr(i, 'doc_ref', None), 'doc_hash',
+                                   None)
+                if doc_hash is None:
+                    digest = None
+                    break
+                digest.update(doc_hash.encode('utf-8'))
+            kind_hashes[kind] = (digest.hexdigest()
+                                 if digest is not None else None)
+
+        return kind_hashes
+
+
+# Document kinds and the SiteDesign fields holding their models
+DOCUMENT_KINDS = {
+    'Network': 'networks',
+    'NetworkLink': 'network_links',
+    'HostProfile': 'host_profiles',
+    'HardwareProfile': 'hardware_profiles',
+    'BaremetalNode': 'baremetal_nodes',
+    'Rack': 'racks',
+    'BootAction': 'bootactions',
+}
 
 rule_set = [
     BootStorageRational(),
@@ -15,13 +15,29 @@
 
 from drydock_provisioner import objects
 from drydock_provisioner.objects import fields as hd_fields
+from drydock_provisioner.orchestrator.validations.address_index import AddressIndex
+from drydock_provisioner.orchestrator.validations.storage_table import StorageTable
 
 
-class Validators:
-    def __init__(self, long_name, name):
+class ValidationContext(object):
+    """Messages reported by a single run of a validation rule.
+
+    A new context is created for each run so that a rule can validate
+    several designs concurrently.
+
+    :param long_name: String - long name of the rule, prepended to messages
+    :param name: String - name of the rule, e.g. ``DD1001``
+    :param address_index: AddressIndex of the design being validated
+    :param storage_table: StorageTable of the design being validated
+    """
+
+    def __init__(self, long_name, name, address_index=None,
+                 storage_table=None):
         self.name = name
         self.long_name = long_name
-        self.reset_message_list()
+        self.address_index = address_index
+        self.storage_table = storage_table
+        self.messages = []
 
     def report_msg(self, msg, docs, diagnostic, error, level):
         """Add a validation message to the result list.
@@ -58,13 +74,55 @@ class Validators:
         errors = [x for x in self.messages if x.error]
         return len(errors)
 
-    def reset_message_list(self):
-        self.messages = []
 
-    def execute(self, site_design, orchestrator=None):
-        self.reset_message_list()
-        self.run_validation(site_design, orchestrator=orchestrator)
-        if self.error_count() == 0:
-            self.report_info("Validation successful.", [], "")
+class Validators:
+    """Base class of validation rules.
+
+    Rule instances hold no state between runs. Messages are reported to
+    the ValidationContext passed to ``run_validation``.
+
+    Results of a rule are cached for the documents of the kinds listed in
+    ``dependencies``. Rules depending on anything else, such as the node
+    driver, leave ``dependencies`` as None and are always run. Change
+    ``version`` when the logic of a rule changes.
+    """
+
+    # Kinds of documents compiled into the applied model of a node
+    NODE_KINDS = ('BaremetalNode', 'HostProfile', 'HardwareProfile')
+
+    version = '1'
+    dependencies = None
+
+    def __init__(self, long_name, name):
+        self.name = name
+        self.long_name = long_name
+
+    def execute(self,
+                site_design,
+                orchestrator=None,
+                address_index=None,
+                storage_table=None):
+        """Run this rule against ``site_design``.
+
+        :param site_design: instance of objects.SiteDesign
+        :param orchestrator: instance of Orchestrator
+        :param address_index: AddressIndex of ``site_design`` shared with
+                              other rules. If None, a new index is used.
+        :param storage_table: StorageTable of ``site_design`` shared with
+                              other rules. If None, a new table is used.
+        :return: list of objects.ValidationMessage reported by the rule
+        """
+        if address_index is None:
+            address_index = AddressIndex(site_design)
+        if storage_table is None:
+            storage_table = StorageTable(site_design)
+        context = ValidationContext(
+            self.long_name,
+            self.name,
+            address_index=address_index,
+            storage_table=storage_table)
+        self.run_validation(site_design, context, orchestrator=orchestrator)
+        if context.error_count() == 0:
+            context.report_info("Validation successful.", [], "")
 
-        return self.messages
+        return context.messages
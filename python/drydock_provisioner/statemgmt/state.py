@@ -573,14 +573,23 @@ class DrydockState(object):
                 "Error querying boot action %s" % action_id, exc_info=ex)
 
     def post_build_data(self, build_data):
-        """Write a new build data element to the database.
+        """Write new build data elements to the database.
 
-        :param build_data: objects.BuildData instance to write
+        A list of elements is written with a single multi-row insert.
+
+        :param build_data: objects.BuildData instance or list of instances
+                           to write
         """
+        if isinstance(build_data, list):
+            if not build_data:
+                return True
+            values = [bd.to_db() for bd in build_data]
+        else:
+            values = build_data.to_db()
+
         try:
             with self.db_engine.connect() as conn:
-                query = self.build_data_tbl.insert().values(
-                    **build_data.to_db())
+                query = self.build_data_tbl.insert().values(values)
                 conn.execute(query)
                 return True
         except Exception as ex:
@@ -654,6 +663,70 @@ class DrydockState(object):
             self.logger.error("Error selecting build data.", exc_info=ex)
             raise errors.BuildDataError("Error selecting build data.")
 
+    def get_latest_build_data(self, node_names, generator):
+        """Retrieve the latest build data of ``generator`` for many nodes.
+
+        Select the chronologically latest build data from ``generator``
+        for each node in ``node_names`` with a single query.
+
+        :param node_names: list of string names of the nodes to select
+        :param generator: String description of the source of data
+                          (e.g. ``lshw``)
+        :returns: dictionary of node name to objects.BuildData instance,
+                  nodes without build data are omitted
+        """
+        if not node_names:
+            return dict()
+
+        try:
+            with self.db_engine.connect() as conn:
+                query = sql.text(
+                    'SELECT DISTINCT ON (node_name) build_data.* '
+                    'FROM build_data '
+                    'WHERE build_data.node_name = ANY(:nodenames) '
+                    'AND build_data.generator = :generator '
+                    'ORDER BY node_name, build_data.collected_date DESC')
+                rs = conn.execute(
+                    query, nodenames=list(node_names), generator=generator)
+                result_data = rs.fetchall()
+
+            build_data = [
+                objects.BuildData.from_db(dict(r)) for r in result_data
+            ]
+            return {bd.node_name: bd for bd in build_data}
+        except Exception as ex:
+            self.logger.error("Error selecting build data.", exc_info=ex)
+            raise errors.BuildDataError("Error selecting build data.")
+
+    def get_build_data_marker(self, generator=None):
+        """Select a marker of the build data collected so far.
+
+        The marker changes whenever build data is added or removed by any
+        Drydock instance sharing the database, so it can be used to detect
+        that models derived from build data are out of date.
+
+        :param generator: String description of the source of data to
+                          limit the marker to (e.g. ``lshw``)
+        :returns: tuple of the number of build data rows and the latest
+                  collected date
+        """
+        try:
+            with self.db_engine.connect() as conn:
+                query = sql.select([
+                    sql.func.count(),
+                    sql.func.max(self.build_data_tbl.c.collected_date)
+                ])
+                if generator is not None:
+                    query = query.where(
+                        self.build_data_tbl.c.generator == generator)
+                rs = conn.execute(query)
+                count, latest = rs.fetchone()
+
+            return (count, latest)
+        except Exception as ex:
+            self.logger.error("Error selecting build data.", exc_info=ex)
+            raise errors.BuildDataError("Error selecting build data.")
+
     def get_now(self):
         """Query the database for now() from dual.
         """
@@ -23,10 +23,28 @@ import drydock_provisioner.objects as objects
 from drydock_provisioner.statemgmt.state import DrydockState
 from drydock_provisioner.ingester.ingester import Ingester
 from drydock_provisioner.orchestrator.orchestrator import Orchestrator
+from drydock_provisioner.orchestrator.site_cache import reset_site_cache
+from drydock_provisioner.orchestrator.validations.validator import Validator
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def clear_site_cache():
+    """Don't share compiled site designs between tests."""
+    reset_site_cache()
+    yield
+    reset_site_cache()
+
+
+@pytest.fixture(autouse=True)
+def clear_validation_cache():
+    """Don't share validation results between tests."""
+    Validator.get_result_cache().clear()
+    yield
+    Validator.get_result_cache().clear()
+
+
 @pytest.fixture()
 def deckhand_ingester():
     ingester = Ingester()
@@ -142,9 +160,18 @@ def mock_get_build_data(drydock_state):
             data_element="<mocktest></mocktest>")
         return [build_data]
 
+    def latest_side_effect(node_names, generator):
+        return {n: side_effect()[0] for n in node_names}
+
     drydock_state.real_get_build_data = drydock_state.get_build_data
     drydock_state.get_build_data = Mock(side_effect=side_effect)
+    drydock_state.real_get_latest_build_data = \
+        drydock_state.get_latest_build_data
+    drydock_state.get_latest_build_data = Mock(
+        side_effect=latest_side_effect)
 
     yield
     drydock_state.get_build_data = Mock(wraps=None, side_effect=None)
     drydock_state.get_build_data = drydock_state.real_get_build_data
+    drydock_state.get_latest_build_data = \
+        drydock_state.real_get_latest_build_data
@@ -110,3 +110,51 @@ class TestBuildData(object):
         assert len(bd_list) == 1
 
         assert bd_list[0].to_dict() == build_data1.to_dict()
+
+    def test_build_data_select_latest_many(self, blank_state):
+        """Test that latest build data is selected for many nodes at once."""
+        now = datetime.utcnow()
+
+        build_data = []
+        for node_name in ['foo', 'bar']:
+            for days, generator in [(0, 'lshw'), (1, 'lshw'), (0, 'other')]:
+                build_data.append(
+                    objects.BuildData(
+                        node_name=node_name,
+                        generator=generator,
+                        data_format='text/plain',
+                        data_element='%s %d' % (node_name, days),
+                        task_id=uuid.uuid4(),
+                        collected_date=now - timedelta(days=days)))
+
+        for bd in build_data:
+            assert blank_state.post_build_data(bd)
+
+        bd_dict = blank_state.get_latest_build_data(
+            ['foo', 'bar', 'baz'], generator='lshw')
+
+        assert sorted(bd_dict.keys()) == ['bar', 'foo']
+        assert bd_dict['foo'].to_dict() == build_data[0].to_dict()
+        assert bd_dict['bar'].to_dict() == build_data[3].to_dict()
+
+    def test_build_data_marker(self, blank_state):
+        """Test that the build data marker changes as build data is added."""
+        empty = blank_state.get_build_data_marker(generator='lshw')
+
+        assert empty == (0, None)
+
+        build_data = objects.BuildData(
+            node_name='foo',
+            generator='lshw',
+            data_format='text/plain',
+            data_element='Hello World!',
+            task_id=uuid.uuid4(),
+            collected_date=datetime.utcnow())
+
+        assert blank_state.post_build_data(build_data)
+
+        marker = blank_state.get_build_data_marker(generator='lshw')
+
+        assert marker == (1, build_data.collected_date)
+        assert blank_state.get_build_data_marker(
+            generator='other') == empty
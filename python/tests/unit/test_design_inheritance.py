@@ -47,3 +47,27 @@ class TestClass(object):
         iface = node.get_applied_interface('pxe')
 
         assert len(iface.get_hw_slaves()) == 1
+
+    def test_inherited_lists_shared(self, input_files, setup,
+                                    deckhand_orchestrator,
+                                    mock_get_build_data):
+        """Test that unchanged inherited lists are shared with the profile."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        design_status, design_data = deckhand_orchestrator.get_effective_site(
+            design_ref)
+
+        node = design_data.get_baremetal_node("compute01")
+        profile = design_data.get_host_profile(node.parent_profile)
+
+        assert node.storage_devices is profile.storage_devices
+        assert node.volume_groups is profile.volume_groups
+
+        # Interfaces are copied before node hardware selectors are added
+        assert node.interfaces is not profile.interfaces
+        for i in profile.interfaces:
+            assert not i.get_slave_selectors()
+        for i in node.interfaces:
+            if i.get_hw_slaves():
+                assert i.get_slave_selectors()
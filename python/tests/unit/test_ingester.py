@@ -15,6 +15,7 @@
 
 from drydock_provisioner.statemgmt.state import DrydockState
 import drydock_provisioner.objects as objects
+from drydock_provisioner.ingester.plugins.deckhand import DeckhandIngester
 
 
 class TestClass(object):
@@ -80,3 +81,26 @@ class TestClass(object):
         assert design_status.status == objects.fields.ValidationResult.Success
         assert len(design_data.host_profiles) == 2
         assert len(design_data.baremetal_nodes) == 2
+
+    def test_ingest_deckhand_skips_foreign_docs(self, setup):
+        """Test that documents outside the drydock namespace are skipped."""
+        doc_blob = b"""
+---
+schema: promenade/Unconstructable/v1
+metadata:
+  name: foreign
+data: !!python/name:os.system
+---
+schema: drydock/Network/v1
+metadata:
+  schema: metadata/Document/v1
+  name: oob
+data:
+  cidr: 172.16.100.0/24
+...
+"""
+        ingester = DeckhandIngester()
+        design_status, models = ingester.parse_docs(doc_blob)
+
+        assert design_status.status == objects.fields.ValidationResult.Success
+        assert [m.name for m in models] == ['oob']
@@ -0,0 +1,144 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver API client.'''
+import pytest
+
+import drydock_provisioner.config as config
+import drydock_provisioner.error as errors
+
+from drydock_provisioner.drivers.node.maasdriver.api_client import MaasRequestFactory
+from drydock_provisioner.drivers.node.maasdriver.api_client import get_shared_request_factory
+from drydock_provisioner.drivers.node.maasdriver.driver import MaasNodeDriver
+from drydock_provisioner.drivers.node.maasdriver.throttle import AdaptiveThrottle
+
+
+class TestMaasApiClient():
+    def test_request_timeout(self, mocker):
+        '''Test that the configured timeout is used for requests.'''
+        maas_client = MaasRequestFactory(
+            'http://localhost/MAAS', 'aaaa:bbbb:cccc', timeout=(5, 60))
+
+        resp = mocker.MagicMock()
+        resp.status_code = 200
+        send = mocker.patch.object(
+            maas_client.http_session, 'send', return_value=resp)
+
+        maas_client.get('version/')
+        assert send.call_args[1]['timeout'] == (5, 60)
+
+        maas_client.get('version/', timeout=(1, 1))
+        assert send.call_args[1]['timeout'] == (1, 1)
+
+    def test_request_throttled(self, mocker):
+        '''Test that requests MaaS throttles are retried with backoff.'''
+        maas_client = MaasRequestFactory(
+            'http://localhost/MAAS',
+            'aaaa:bbbb:cccc',
+            pool_maxsize=8,
+            throttle_retries=2)
+
+        throttled = mocker.MagicMock(status_code=503, headers={})
+        ok = mocker.MagicMock(status_code=200, headers={})
+        send = mocker.patch.object(
+            maas_client.http_session, 'send', side_effect=[throttled, ok])
+        sleep = mocker.patch(
+            'drydock_provisioner.drivers.node.maasdriver.api_client.time.sleep'
+        )
+
+        assert maas_client.get('machines/') is ok
+        assert send.call_count == 2
+        sleep.assert_called_once_with(1)
+
+        metrics = maas_client.get_metrics()
+        assert metrics['throttle_events'] == 1
+        assert metrics['in_flight'] == 0
+        assert metrics['concurrency_limit'] < 8
+
+        throttled.headers = {'Retry-After': '7'}
+        send.side_effect = [throttled, throttled, throttled]
+        with pytest.raises(errors.TransientDriverError):
+            maas_client.get('machines/')
+        sleep.assert_called_with(7.0)
+
+    def test_request_throttled_not_idempotent(self, mocker):
+        '''Test that only a 429 is retried for non-idempotent requests.'''
+        maas_client = MaasRequestFactory(
+            'http://localhost/MAAS', 'aaaa:bbbb:cccc', throttle_retries=2)
+
+        unavailable = mocker.MagicMock(status_code=503, headers={})
+        too_many = mocker.MagicMock(status_code=429, headers={})
+        ok = mocker.MagicMock(status_code=200, headers={})
+        send = mocker.patch.object(
+            maas_client.http_session, 'send', side_effect=[unavailable, ok])
+        mocker.patch(
+            'drydock_provisioner.drivers.node.maasdriver.api_client.time.sleep'
+        )
+
+        with pytest.raises(errors.DriverError):
+            maas_client.post('machines/r7mqnw/', op='deploy')
+        assert send.call_count == 1
+
+        send.side_effect = [too_many, ok]
+        assert maas_client.post('machines/r7mqnw/', op='deploy') is ok
+        assert send.call_count == 3
+
+    def test_adaptive_throttle(self):
+        '''Test the AIMD adjustment of the concurrency limit.'''
+        throttle = AdaptiveThrottle(max_limit=4)
+
+        for i in range(4):
+            throttle.acquire()
+        assert throttle.get_metrics()['in_flight'] == 4
+
+        throttle.release(latency=0.5, throttled=True)
+        assert throttle.get_metrics()['concurrency_limit'] == 2
+
+        for i in range(3):
+            throttle.release(latency=0.5)
+
+        for i in range(20):
+            throttle.acquire()
+            throttle.release(latency=0.5)
+
+        metrics = throttle.get_metrics()
+        assert metrics['concurrency_limit'] == 4
+        assert metrics['throttle_events'] == 1
+        assert metrics['avg_latency'] == pytest.approx(0.5)
+
+    def test_shared_request_factory(self, setup):
+        '''Test that a single request factory is shared per MaaS endpoint.'''
+        config.config_mgr.conf.register_opts(
+            MaasNodeDriver.maasdriver_options, group='maasdriver')
+        config.config_mgr.conf.set_override(
+            name='maas_api_url',
+            override='http://localhost/MAAS',
+            group='maasdriver')
+        config.config_mgr.conf.set_override(
+            name='maas_api_key', override='aaaa:bbbb:cccc', group='maasdriver')
+        config.config_mgr.conf.set_override(
+            name='http_read_timeout', override=90, group='maasdriver')
+
+        first = get_shared_request_factory()
+        second = get_shared_request_factory()
+
+        assert first is second
+        assert first.timeout == (2, 90)
+
+        config.config_mgr.conf.set_override(
+            name='maas_api_key', override='dddd:eeee:ffff', group='maasdriver')
+
+        assert get_shared_request_factory() is not first
+
+        for opt in ['maas_api_url', 'maas_api_key', 'http_read_timeout']:
+            config.config_mgr.conf.clear_override(opt, group='maasdriver')
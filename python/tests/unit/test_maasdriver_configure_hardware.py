@@ -0,0 +1,204 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver ConfigureHardware action.'''
+import uuid
+
+import drydock_provisioner.objects.fields as hd_fields
+
+from drydock_provisioner.drivers.node.maasdriver.actions.node import ConfigureHardware
+from drydock_provisioner.drivers.node.maasdriver.driver import MaasNodeDriver
+from drydock_provisioner.drivers.node.maasdriver.status_watcher import MachineStatusWatcher
+
+
+class MockedResponse():
+    """An object that looks like a requests response wrapping a MAAS API response."""
+
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self, **kwargs):
+        return self.content
+
+
+class TestMaasConfigureHardware():
+    def test_complete_commissioning_batch(self, setup, mocker):
+        '''Test that results of a batch of nodes are fetched and saved once.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            "id": 3,
+            "data": "SGVsbG8gV29ybGQh",
+            "result_type": 0,
+            "updated": "2018-07-06T14:32:20.129",
+            "node": {
+                "system_id": "r7mqnw"
+            },
+            "name": "hello_world"
+        }, {
+            "id": 4,
+            "data": "SGVsbG8gV29ybGQh",
+            "result_type": 2,
+            "updated": "2018-07-06T14:32:20.129",
+            "node": {
+                "system_id": "r7mqnx"
+            },
+            "name": "hello_world"
+        }])
+
+        task = mocker.MagicMock()
+        task.task_id = uuid.uuid4()
+        state_manager = mocker.MagicMock()
+
+        action = ConfigureHardware(
+            task,
+            mocker.MagicMock(),
+            state_manager,
+            maas_client=api_client,
+            inventory=mocker.MagicMock(),
+            status_watcher=mocker.MagicMock())
+
+        commissioned = []
+        for (name, system_id, status) in [('n1', 'r7mqnw', 'Ready'),
+                                          ('n2', 'r7mqnx',
+                                           'Failed commissioning')]:
+            node = mocker.MagicMock()
+            node.configure_mock(name=name)
+            machine = mocker.MagicMock()
+            machine.configure_mock(
+                resource_id=system_id,
+                hostname=name,
+                api_client=api_client)
+            machine.get_details.return_value = {'lshw': b'<xml/>'}
+            commissioned.append(((action, node, machine), status))
+
+        mocker.patch(
+            'drydock_provisioner.drivers.node.maasdriver.actions.node.get_internal_api_href',
+            mocker.MagicMock(return_value='http://drydock/api/v1.0'))
+
+        ConfigureHardware.complete_commissioning(commissioned)
+
+        api_client.get.assert_called_once()
+        assert sorted(api_client.get.call_args[1]['files']['system_id']) == [
+            'r7mqnw', 'r7mqnx'
+        ]
+
+        state_manager.post_build_data.assert_called_once()
+        build_data = state_manager.post_build_data.call_args[0][0]
+        assert sorted([(bd.node_name, bd.generator) for bd in build_data]) == [
+            ('n1', 'commission:hello_world'), ('n1', 'lshw'),
+            ('n2', 'testing:hello_world')
+        ]
+
+        # One status message per node and one save for the batch
+        assert task.add_status_msg.call_count == 2
+        task.save.assert_called_once()
+
+        task.success.assert_called_once_with(
+            focus=commissioned[0][0][1].get_id())
+        task.failure.assert_called_once_with(
+            focus=commissioned[1][0][1].get_id())
+
+    def test_commission_nodes_single_fetch(self, setup, mocker):
+        '''Test that nodes commissioned by many subtasks share a results fetch.'''
+        node_names = ['n1', 'n2', 'n3']
+        system_ids = {'n1': 'r7mqnw', 'n2': 'r7mqnx', 'n3': 'r7mqny'}
+
+        def mocked_get(url, **kwargs):
+            if url == 'machines/':
+                return MockedResponse([{
+                    'system_id': i,
+                    'status_name': 'Ready'
+                } for i in kwargs['params']['id']])
+            elif url == 'commissioning-results/':
+                return MockedResponse([{
+                    "id": n,
+                    "data": "SGVsbG8gV29ybGQh",
+                    "result_type": 0,
+                    "updated": "2018-07-06T14:32:20.129",
+                    "node": {
+                        "system_id": i
+                    },
+                    "name": "hello_world"
+                } for (n, i) in enumerate(kwargs['files']['system_id'])])
+            return MockedResponse([])
+
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = mocked_get
+
+        node_mod = 'drydock_provisioner.drivers.node.maasdriver.actions.node'
+        driver_mod = 'drydock_provisioner.drivers.node.maasdriver.driver'
+        mocker.patch(
+            driver_mod + '.get_shared_request_factory',
+            return_value=api_client)
+        mocker.patch(driver_mod + '.MachineInventory')
+        mocker.patch(
+            node_mod + '.get_internal_api_href',
+            return_value='http://drydock/api/v1.0')
+
+        def find_node(maas_client, node_model, inventory=None):
+            machine = mocker.MagicMock()
+            machine.configure_mock(
+                resource_id=system_ids[node_model.name],
+                hostname=node_model.name,
+                status_name='New',
+                api_client=api_client)
+            machine.get_details.return_value = {}
+            return machine
+
+        mocker.patch(node_mod + '.find_node_in_maas', side_effect=find_node)
+
+        nodes = []
+        for name in node_names:
+            node = mocker.MagicMock()
+            node.configure_mock(name=name)
+            nodes.append(node)
+
+        task = mocker.MagicMock()
+        task.configure_mock(
+            action=hd_fields.OrchestratorAction.ConfigureHardware, retry=0)
+        state_manager = mocker.MagicMock()
+        state_manager.get_task.return_value = task
+
+        orchestrator = mocker.MagicMock()
+        orchestrator.get_target_nodes.return_value = nodes
+        orchestrator.get_effective_site.return_value = (mocker.MagicMock(),
+                                                        mocker.MagicMock())
+        orchestrator.create_nodefilter_from_nodelist.side_effect = (
+            lambda node_list: node_list)
+        orchestrator.process_node_filter.side_effect = (
+            lambda node_filter, site_design: node_filter)
+
+        def create_task(**kwargs):
+            subtask = mocker.MagicMock()
+            subtask.configure_mock(**kwargs)
+            subtask.task_id = uuid.uuid4()
+            subtask.get_id.return_value = subtask.task_id
+            return subtask
+
+        orchestrator.create_task.side_effect = create_task
+
+        driver = MaasNodeDriver(
+            orchestrator=orchestrator, state_manager=state_manager)
+        driver.status_watcher = MachineStatusWatcher(
+            api_client, poll_interval=0.5)
+
+        driver.execute_task(uuid.uuid4())
+
+        urls = [c[0][0] for c in api_client.get.call_args_list]
+        assert urls.count('commissioning-results/') == 1
+
+        state_manager.post_build_data.assert_called_once()
+        build_data = state_manager.post_build_data.call_args[0][0]
+        assert sorted([bd.node_name for bd in build_data]) == node_names
@@ -0,0 +1,154 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver DeployNode action.'''
+import concurrent.futures
+import threading
+
+from drydock_provisioner.drivers.node.maasdriver.actions.node import DeployNode
+import drydock_provisioner.objects.fields as hd_fields
+
+
+class TestMaasDeployNode():
+    def test_start_async(self, setup, mocker):
+        '''Test that waiting on deployment does not hold an executor thread.'''
+        task = mocker.MagicMock()
+        status_watcher = mocker.MagicMock()
+        status_futures = [
+            concurrent.futures.Future(),
+            concurrent.futures.Future()
+        ]
+        status_watcher.watch.side_effect = status_futures
+
+        action = DeployNode(
+            task,
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            maas_client=mocker.MagicMock(),
+            inventory=mocker.MagicMock(),
+            status_watcher=status_watcher)
+
+        deployments = [(mocker.MagicMock(), mocker.MagicMock()),
+                       (mocker.MagicMock(), mocker.MagicMock())]
+        mocker.patch.object(
+            action, 'begin_deployments', return_value=deployments)
+        finish = mocker.patch.object(action, 'finish_deployment')
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as e:
+            action_future = action.start_async(e)
+
+            # The single worker is free for other work while nodes deploy
+            assert e.submit(lambda: True).result(timeout=5)
+            assert status_watcher.watch.call_count == 2
+            assert not action_future.done()
+
+            status_futures[0].set_result('Deployed')
+            status_futures[1].set_result('Failed deployment')
+
+            action_future.result(timeout=5)
+
+        finish.assert_any_call(deployments[0][0], deployments[0][1],
+                               'Deployed')
+        finish.assert_any_call(deployments[1][0], deployments[1][1],
+                               'Failed deployment')
+        task.set_status.assert_called_once_with(
+            hd_fields.TaskStatus.Complete)
+
+    def test_start_async_watch_error(self, setup, mocker):
+        '''Test that a failed status wait fails the node and completes.'''
+        task = mocker.MagicMock()
+        status_watcher = mocker.MagicMock()
+        status_future = concurrent.futures.Future()
+        status_watcher.watch.return_value = status_future
+
+        action = DeployNode(
+            task,
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            maas_client=mocker.MagicMock(),
+            inventory=mocker.MagicMock(),
+            status_watcher=status_watcher)
+
+        node = mocker.MagicMock()
+        mocker.patch.object(
+            action,
+            'begin_deployments',
+            return_value=[(node, mocker.MagicMock())])
+        finish = mocker.patch.object(action, 'finish_deployment')
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as e:
+            action_future = action.start_async(e)
+            assert e.submit(lambda: True).result(timeout=5)
+
+            status_future.set_exception(ValueError('boom'))
+
+            action_future.result(timeout=5)
+
+        finish.assert_not_called()
+        task.failure.assert_called_once_with(focus=node.get_id())
+        task.set_status.assert_called_once_with(
+            hd_fields.TaskStatus.Complete)
+
+    def test_start_async_executor_shutdown(self, setup, mocker):
+        '''Test that nodes finish off the watcher thread after shutdown.'''
+        task = mocker.MagicMock()
+        status_watcher = mocker.MagicMock()
+        status_future = concurrent.futures.Future()
+        status_watcher.watch.return_value = status_future
+
+        action = DeployNode(
+            task,
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            maas_client=mocker.MagicMock(),
+            inventory=mocker.MagicMock(),
+            status_watcher=status_watcher)
+
+        mocker.patch.object(
+            action,
+            'begin_deployments',
+            return_value=[(mocker.MagicMock(), mocker.MagicMock())])
+        threads = []
+        mocker.patch.object(
+            action,
+            'finish_deployment',
+            side_effect=lambda *args: threads.append(threading.current_thread()))
+
+        e = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        action_future = action.start_async(e)
+        assert e.submit(lambda: True).result(timeout=5)
+        e.shutdown()
+
+        status_future.set_result('Deployed')
+        action_future.result(timeout=5)
+
+        assert threads[0] is not threading.current_thread()
+        assert threads[0].name == 'maas-deploy-finish'
+
+    def test_start_async_begin_error(self, setup, mocker):
+        '''Test that an error starting deployments fails the action future.'''
+        action = DeployNode(
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            mocker.MagicMock(),
+            maas_client=mocker.MagicMock(),
+            inventory=mocker.MagicMock(),
+            status_watcher=mocker.MagicMock())
+
+        mocker.patch.object(
+            action, 'begin_deployments', side_effect=ValueError('boom'))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as e:
+            action_future = action.start_async(e)
+            assert isinstance(
+                action_future.exception(timeout=5), ValueError)
@@ -0,0 +1,121 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver shared machine inventory.'''
+from drydock_provisioner.drivers.node.maasdriver.inventory import MachineInventory
+
+
+class MockedResponse():
+    """An object that looks like a requests response wrapping a MAAS API response."""
+
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self):
+        return self.content
+
+
+def mocked_get(url, **kwargs):
+    if url == 'machines/':
+        return MockedResponse([{
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+            'status_name': 'New',
+        }, {
+            'system_id': 'r7mqnx',
+            'hostname': 'node02',
+            'status_name': 'New',
+        }])
+    elif url == 'machines/r7mqnw/':
+        return MockedResponse({
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+            'status_name': 'Commissioning',
+        })
+    return MockedResponse([])
+
+
+class TestMaasInventory():
+    def test_inventory_shared_snapshot(self, mocker):
+        '''Test that the inventory is fetched once within the TTL.'''
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = mocked_get
+
+        inventory = MachineInventory(api_client, ttl=60)
+
+        first = inventory.get_machines()
+        second = inventory.get_machines()
+
+        assert first is second
+        assert len(first) == 2
+        api_client.get.assert_called_once_with('machines/')
+
+    def test_inventory_no_ttl(self, mocker):
+        '''Test that a zero TTL refreshes the inventory on every access.'''
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = mocked_get
+
+        inventory = MachineInventory(api_client, ttl=0)
+
+        inventory.get_machines()
+        inventory.get_machines()
+
+        assert api_client.get.call_count == 2
+
+    def test_inventory_invalidate_machine(self, mocker):
+        '''Test that invalidating a machine only reloads that machine.'''
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = mocked_get
+
+        inventory = MachineInventory(api_client, ttl=60)
+
+        before = inventory.get_machines()
+        inventory.invalidate('r7mqnw')
+        after = inventory.get_machines()
+
+        assert before is not after
+        assert before.select('r7mqnw').status_name == 'New'
+        assert after.select('r7mqnw').status_name == 'Commissioning'
+        assert after.select('r7mqnx') is before.select('r7mqnx')
+
+        urls = [c[0][0] for c in api_client.get.call_args_list]
+        assert urls == ['machines/', 'machines/r7mqnw/']
+
+    def test_inventory_reload_failure(self, mocker):
+        '''Test that a failed reload keeps the machine and retries later.'''
+        api_client = mocker.MagicMock()
+        fail = [True]
+
+        def flaky_get(url, **kwargs):
+            if url == 'machines/r7mqnw/' and fail[0]:
+                fail[0] = False
+                raise Exception('MaaS unavailable')
+            return mocked_get(url, **kwargs)
+
+        api_client.get.side_effect = flaky_get
+
+        inventory = MachineInventory(api_client, ttl=60)
+
+        inventory.get_machines()
+        inventory.invalidate('r7mqnw')
+
+        failed = inventory.get_machines()
+        assert failed.select('r7mqnw').status_name == 'New'
+
+        retried = inventory.get_machines()
+        assert retried.select('r7mqnw').status_name == 'Commissioning'
+
+        urls = [c[0][0] for c in api_client.get.call_args_list]
+        assert urls == ['machines/', 'machines/r7mqnw/', 'machines/r7mqnw/']
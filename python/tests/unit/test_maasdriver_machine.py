@@ -0,0 +1,193 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver machine model.'''
+import json
+
+from drydock_provisioner.drivers.node.maasdriver.models.machine import Machine
+from drydock_provisioner.drivers.node.maasdriver.models.machine import Machines
+from drydock_provisioner.drivers.node.maasdriver.models.machine import MachineStatus
+
+
+class MockedResponse():
+    """An object that looks like a requests response wrapping a MAAS API response."""
+
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self, **kwargs):
+        return json.loads(json.dumps(self.content), **kwargs)
+
+
+class TestMaasMachine():
+    def test_machines_refresh_lazy(self, mocker):
+        '''Test that listing machines does not load machine sub-resources.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+        }, {
+            'system_id': 'r7mqnx',
+            'hostname': 'node02',
+        }])
+
+        machine_list = Machines(api_client)
+        machine_list.refresh()
+
+        api_client.get.assert_called_once_with('machines/')
+        assert len(machine_list) == 2
+
+    def test_machine_interfaces_loaded_on_access(self, mocker):
+        '''Test that machine interfaces are loaded once on first access.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'id': 5,
+            'name': 'eth0',
+            'mac_address': '00:11:22:33:44:55',
+            'links': [],
+        }])
+
+        machine = Machine.from_dict(api_client, {
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+        })
+
+        assert not machine.interfaces.is_loaded()
+        api_client.get.assert_not_called()
+
+        assert machine.interface_for_mac('00:11:22:33:44:55') is not None
+        assert machine.get_network_interface('eth0') is not None
+
+        api_client.get.assert_called_once_with('nodes/r7mqnw/interfaces/')
+
+    def test_machine_prefetch(self, mocker):
+        '''Test that prefetch only loads the requested sub-resources.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([])
+
+        machine = Machine.from_dict(api_client, {
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+        })
+        machine.prefetch('volume_groups')
+
+        api_client.get.assert_called_once_with('nodes/r7mqnw/volume-groups/')
+        assert machine.volume_groups.is_loaded()
+        assert not machine.block_devices.is_loaded()
+        assert not machine.interfaces.is_loaded()
+
+    def test_machines_indexed_query(self, mocker):
+        '''Test machine lookups by indexed attributes.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+            'interface_set': [{
+                'mac_address': '00:11:22:33:44:55'
+            }],
+        }, {
+            'system_id': 'r7mqnx',
+            'hostname': 'node02',
+            'interface_set': [{
+                'mac_address': '00:11:22:33:44:66'
+            }],
+        }])
+
+        machine_list = Machines(api_client)
+        machine_list.refresh()
+
+        assert machine_list.singleton({
+            'hostname': 'node02'
+        }).resource_id == 'r7mqnx'
+        assert machine_list.singleton({'hostname': 'node03'}) is None
+
+        nodes = machine_list.find_nodes_with_mac('00:11:22:33:44:55')
+        assert [n.resource_id for n in nodes] == ['r7mqnw']
+
+        # Attributes changed in place are still found
+        machine_list.select('r7mqnw').hostname = 'node03'
+        assert machine_list.singleton({
+            'hostname': 'node03'
+        }).resource_id == 'r7mqnw'
+
+        # A stale index entry does not hide a resource that now matches
+        machine_list.select('r7mqnx').hostname = 'node01'
+        assert machine_list.singleton({
+            'hostname': 'node01'
+        }).resource_id == 'r7mqnx'
+
+        # MACs are matched without loading machine interfaces
+        api_client.get.assert_called_once_with('machines/')
+
+    def test_machines_collect_power_params(self, mocker):
+        '''Test power parameters are loaded for all machines in one request.'''
+
+        def mocked_get(url, **kwargs):
+            if kwargs.get('op') == 'power_parameters':
+                return MockedResponse({
+                    'r7mqnw': {
+                        'power_address': '172.16.1.11'
+                    },
+                    'r7mqnx': {
+                        'power_address': '172.16.1.12'
+                    },
+                })
+            return MockedResponse([{
+                'system_id': 'r7mqnw',
+                'hostname': 'node01',
+            }, {
+                'system_id': 'r7mqnx',
+                'hostname': 'node02',
+            }])
+
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = mocked_get
+
+        machine_list = Machines(api_client)
+        machine_list.refresh()
+        machine_list.collect_power_params()
+        machine_list.collect_power_params()
+
+        node = machine_list.singleton({
+            'power_params.power_address': '172.16.1.12'
+        })
+        assert node.resource_id == 'r7mqnx'
+        assert api_client.get.call_count == 2
+
+    def test_machines_list_status(self, mocker):
+        '''Test that a status listing keeps only the status fields.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'hostname': 'node01',
+            'status_name': 'Deploying',
+            'power_state': 'on',
+            'interface_set': [{
+                'id': 5,
+                'mac_address': '00:11:22:33:44:55',
+            }],
+        }])
+
+        statuses = Machines(api_client).list_status(system_ids=['r7mqnw'])
+
+        api_client.get.assert_called_once_with(
+            'machines/', params={'id': ['r7mqnw']})
+
+        status = statuses['r7mqnw']
+        assert isinstance(status, MachineStatus)
+        assert status.hostname == 'node01'
+        assert status.status_name == 'Deploying'
+        assert status.power_state == 'on'
+        assert not hasattr(status, '__dict__')
@@ -0,0 +1,142 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+'''Tests for the maasdriver machine status watcher.'''
+import json
+
+from drydock_provisioner.drivers.node.maasdriver.status_watcher import MachineStatusWatcher
+
+
+class MockedResponse():
+    """An object that looks like a requests response wrapping a MAAS API response."""
+
+    status_code = 200
+
+    def __init__(self, content):
+        self.content = content
+
+    def json(self, **kwargs):
+        return json.loads(json.dumps(self.content), **kwargs)
+
+
+class TestMaasStatusWatcher():
+    def test_wait_for_status(self, mocker):
+        '''Test that many waiters are served by one status query per poll.'''
+        polls = [
+            [{
+                'system_id': 'r7mqnw',
+                'status_name': 'Deploying'
+            }, {
+                'system_id': 'r7mqnx',
+                'status_name': 'Deployed'
+            }],
+            [{
+                'system_id': 'r7mqnw',
+                'status_name': 'Failed deployment'
+            }],
+        ]
+
+        api_client = mocker.MagicMock()
+        api_client.get.side_effect = [MockedResponse(p) for p in polls]
+
+        watcher = MachineStatusWatcher(api_client, poll_interval=0)
+
+        def deployed(s):
+            return s.startswith('Deployed') or s.startswith('Failed')
+
+        f1 = watcher.watch('r7mqnw', deployed, 60)
+        f2 = watcher.watch('r7mqnx', deployed, 60)
+
+        assert f1.result(timeout=5) == 'Failed deployment'
+        assert f2.result(timeout=5) == 'Deployed'
+
+        first_ids = api_client.get.call_args_list[0][1]['params']['id']
+        assert sorted(first_ids) == ['r7mqnw', 'r7mqnx']
+        assert api_client.get.call_count == 2
+
+    def test_wait_for_status_timeout(self, mocker):
+        '''Test that a waiter is released with the last status on timeout.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'status_name': 'Commissioning'
+        }])
+
+        watcher = MachineStatusWatcher(api_client, poll_interval=0)
+
+        status = watcher.wait_for_status(
+            'r7mqnw', lambda s: s == 'Ready', 0, status='New')
+        assert status == 'Commissioning'
+
+    def test_wait_for_current_status(self, mocker):
+        '''Test that no query is made if the current status is sufficient.'''
+        api_client = mocker.MagicMock()
+
+        watcher = MachineStatusWatcher(api_client, poll_interval=0)
+
+        status = watcher.wait_for_status(
+            'r7mqnw', lambda s: s == 'Ready', 60, status='Ready')
+        assert status == 'Ready'
+        api_client.get.assert_not_called()
+
+    def test_waiter_predicate_error(self, mocker):
+        '''Test that a failing predicate only fails its own waiter.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'status_name': 'Ready'
+        }, {
+            'system_id': 'r7mqnx',
+            'status_name': 'Ready'
+        }])
+
+        watcher = MachineStatusWatcher(api_client, poll_interval=0)
+
+        def broken(s):
+            raise ValueError('bad predicate')
+
+        f1 = watcher.watch('r7mqnw', broken, 60)
+        f2 = watcher.watch('r7mqnx', lambda s: s == 'Ready', 60)
+
+        assert isinstance(f1.exception(timeout=5), ValueError)
+        assert f2.result(timeout=5) == 'Ready'
+
+        # The watcher keeps serving new waiters
+        status = watcher.wait_for_status(
+            'r7mqnx', lambda s: s == 'Ready', 60, status='New')
+        assert status == 'Ready'
+
+    def test_watcher_restarts_after_failure(self, mocker):
+        '''Test that waiters are released and a new poll thread is started.'''
+        api_client = mocker.MagicMock()
+        api_client.get.return_value = MockedResponse([{
+            'system_id': 'r7mqnw',
+            'status_name': 'Ready'
+        }])
+
+        watcher = MachineStatusWatcher(api_client, poll_interval=0)
+        notify = watcher._notify
+        failures = [RuntimeError('boom')]
+
+        def flaky_notify(statuses):
+            if failures:
+                raise failures.pop()
+            notify(statuses)
+
+        mocker.patch.object(watcher, '_notify', side_effect=flaky_notify)
+
+        f1 = watcher.watch('r7mqnw', lambda s: s == 'Ready', 60)
+        assert isinstance(f1.exception(timeout=5), RuntimeError)
+
+        f2 = watcher.watch('r7mqnw', lambda s: s == 'Ready', 60)
+        assert f2.result(timeout=5) == 'Ready'
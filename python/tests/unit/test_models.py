@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pytest
+
+import drydock_provisioner.error as errors
 import drydock_provisioner.objects as objects
 from drydock_provisioner.objects import fields
 
@@ -91,3 +94,51 @@ class TestClass(object):
 
         assert 'bootstrap_protocol' in hwprofile.obj_what_changed()
         assert 'bios_version' not in hwprofile.obj_what_changed()
+
+    def test_interface_shallow_clone(self):
+        objects.register_all()
+
+        iface = objects.HostInterface()
+        iface.device_name = 'bond0'
+        iface.source = fields.ModelSource.Designed
+        iface.networks = ['oob']
+        iface.slave_selectors = objects.HardwareDeviceSelectorList()
+
+        clone = iface.shallow_clone()
+
+        assert clone.device_name == 'bond0'
+        assert clone.networks is iface.networks
+
+        selector = objects.HardwareDeviceSelector(
+            selector_type='name', selector='eth0')
+        clone.add_selector(selector)
+
+        assert len(clone.get_slave_selectors()) == 1
+        assert len(iface.get_slave_selectors()) == 0
+
+    def test_sitedesign_lookups(self):
+        objects.register_all()
+
+        design = objects.SiteDesign()
+
+        for i in range(3):
+            design.add_network(
+                objects.Network(name='net%d' % i, site='test_site'))
+
+        assert design.get_network('net1').name == 'net1'
+
+        design.add_network(objects.Network(name='net3', site='test_site'))
+        assert design.get_network('net3').name == 'net3'
+
+        # Replacing an item or the whole list is seen by lookups
+        replacement = objects.Network(
+            name='net1', site='test_site', mtu=9000)
+        design.networks.replace_by_id(replacement)
+        assert design.get_network('net1') is replacement
+
+        design.networks = objects.NetworkList.from_basic_list(
+            [objects.Network(name='net4', site='test_site')])
+        assert design.get_network('net4').name == 'net4'
+
+        with pytest.raises(errors.DesignError):
+            design.get_network('net1')
@@ -15,6 +15,7 @@
 from unittest.mock import Mock
 
 import drydock_provisioner.objects as objects
+import drydock_provisioner.objects.node as node
 
 
 class TestClass(object):
@@ -137,11 +138,20 @@ class TestClass(object):
                 data_element=xml_example)
             return [build_data]
 
+        def latest_side_effect(node_names, generator):
+            return {n: side_effect()[0] for n in node_names}
+
         drydock_state.get_build_data = Mock(side_effect=side_effect)
+        drydock_state.get_latest_build_data = Mock(
+            side_effect=latest_side_effect)
 
         design_status, design_data = deckhand_orchestrator.get_effective_site(
             design_ref, resolve_aliases=True)
 
+        # Build data of all nodes is selected in one query
+        drydock_state.get_latest_build_data.assert_called_once()
+        drydock_state.get_build_data.assert_not_called()
+
         nodes = design_data.baremetal_nodes
 
         expected = {
@@ -160,3 +170,41 @@ class TestClass(object):
         # Logicalname is not found, returns the alias
         assert nodes[0].logicalnames['prim_nic02'] == 'prim_nic02'
         assert nodes[0].get_logicalname('prim_nic02') == 'prim_nic02'
+
+    def test_apply_logicalnames_cached(self, input_files,
+                                       deckhand_orchestrator, drydock_state,
+                                       mocker):
+        """Test lshw data is parsed once for each build data collection"""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+
+        design_ref = "file://%s" % str(input_file)
+
+        xml_example = (
+            "<list><node id='network:0' class='network'>"
+            "<businfo>pci@0000:00:03.0</businfo>"
+            "<logicalname>eno1</logicalname></node></list>")
+
+        build_data = objects.BuildData(
+            node_name="controller01",
+            task_id="tid",
+            generator="lshw",
+            data_format="text/plain",
+            data_element=xml_example)
+
+        mocker.patch.object(
+            drydock_state, 'get_build_data', return_value=[build_data])
+
+        design_status, design_data = deckhand_orchestrator.get_effective_site(
+            design_ref)
+
+        parse = mocker.patch(
+            'drydock_provisioner.objects.node.fromstring',
+            wraps=node.fromstring)
+
+        n = design_data.get_baremetal_node('controller01').obj_clone()
+        n.apply_logicalnames(design_data, state_manager=drydock_state)
+        n.apply_logicalnames(design_data, state_manager=drydock_state)
+
+        assert parse.call_count == 1
+        assert n.logicalnames['prim_nic01'] == 'eno1'
+        assert n.logicalnames['primary_boot'] == 'primary_boot'
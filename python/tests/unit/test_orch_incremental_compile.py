@@ -0,0 +1,100 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test recompiling only the nodes affected by a design change."""
+
+import pytest
+
+import drydock_provisioner.config as config
+import drydock_provisioner.objects.fields as hd_fields
+
+
+class TestIncrementalCompile(object):
+    def test_recompile_changed_node(self, input_files, setup,
+                                    deckhand_orchestrator,
+                                    mock_get_build_data, mocker):
+        """Test that only nodes with changed documents are recompiled."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        status, first = deckhand_orchestrator.get_effective_site(design_ref)
+        assert status.status == hd_fields.ValidationResult.Success
+
+        changed_file = input_files.join("deckhand_fullsite_changed.yaml")
+        changed_file.write(input_file.read().replace(
+            '172.16.1.23', '172.16.1.24'))
+        changed_ref = "file://%s" % str(changed_file)
+
+        compile_spy = mocker.spy(deckhand_orchestrator, '_compile_node')
+
+        status, second = deckhand_orchestrator.get_effective_site(changed_ref)
+        assert status.status == hd_fields.ValidationResult.Success
+
+        compiled = [c[0][0].name for c in compile_spy.call_args_list]
+        assert compiled == ['compute02']
+
+        for name in ['controller01', 'compute01']:
+            first_node = first.get_baremetal_node(name)
+            second_node = second.get_baremetal_node(name)
+            assert (first_node.obj_to_primitive()
+                    == second_node.obj_to_primitive())
+
+        assert second.get_baremetal_node('compute02').get_network_address(
+            'mgmt') == '172.16.1.24'
+
+    def test_reused_node_copied(self, input_files, setup,
+                                deckhand_orchestrator, mock_get_build_data):
+        """Test that reused nodes share no state with earlier designs."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        status, first = deckhand_orchestrator.get_described_site(design_ref)
+        deckhand_orchestrator.compute_model_inheritance(first)
+
+        status, second = deckhand_orchestrator.get_described_site(design_ref)
+        deckhand_orchestrator.compute_model_inheritance(second)
+
+        first_node = first.get_baremetal_node('compute01')
+        second_node = second.get_baremetal_node('compute01')
+        assert first_node is not second_node
+
+        second_node.tags.append('changed')
+        assert 'changed' not in first_node.tags
+
+        status, third = deckhand_orchestrator.get_described_site(design_ref)
+        deckhand_orchestrator.compute_model_inheritance(third)
+        assert 'changed' not in third.get_baremetal_node('compute01').tags
+
+    def test_compiled_nodes_bounded(self, input_files, small_node_cache,
+                                    deckhand_orchestrator,
+                                    mock_get_build_data):
+        """Test that the compiled nodes kept for reuse are bounded."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        status, design = deckhand_orchestrator.get_described_site(design_ref)
+        assert status.status == hd_fields.ValidationResult.Success
+
+        deckhand_orchestrator.compute_model_inheritance(design)
+
+        node_names = [n.name for n in design.baremetal_nodes]
+        assert len(node_names) > 2
+        compiled = list(deckhand_orchestrator.compiled_nodes.keys())
+        assert compiled == node_names[-2:]
+
+    @pytest.fixture()
+    def small_node_cache(self, setup):
+        config.config_mgr.conf.set_override(
+            name='compiled_node_cache_size', override=2)
+        yield
+        config.config_mgr.conf.clear_override('compiled_node_cache_size')
@@ -0,0 +1,67 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test compiling node models concurrently."""
+import pytest
+
+import drydock_provisioner.config as config
+import drydock_provisioner.error as errors
+import drydock_provisioner.objects.fields as hd_fields
+
+
+class TestParallelCompile(object):
+    def test_parallel_compile(self, input_files, setup, deckhand_orchestrator,
+                              mock_get_build_data, parallel_compile):
+        """Test that nodes compiled concurrently match a serial compile."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        status, design = deckhand_orchestrator.get_effective_site(design_ref)
+
+        assert status.status == hd_fields.ValidationResult.Success
+
+        for n in design.baremetal_nodes:
+            assert n.source == hd_fields.ModelSource.Compiled
+            assert n.hardware_profile is not None
+
+        node = design.get_baremetal_node('compute01')
+        assert node.kernel_params.get('hugepagesz') == '1G'
+
+    def test_parallel_compile_failures(self, input_files, setup,
+                                       deckhand_orchestrator,
+                                       mock_get_build_data, parallel_compile):
+        """Test that failures are reported in design order."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        status, design = deckhand_orchestrator.get_described_site(design_ref)
+
+        # Parsed models are cached by the ingester, so modify copies
+        for n in list(design.baremetal_nodes):
+            broken = n.obj_clone()
+            broken.hardware_profile = None
+            broken.parent_profile = None
+            design.baremetal_nodes.replace_by_id(broken)
+
+        with pytest.raises(errors.DesignError) as ex:
+            deckhand_orchestrator.compute_model_inheritance(design)
+
+        assert str(ex.value).endswith(",".join(
+            [n.name for n in design.baremetal_nodes]))
+
+    @pytest.fixture()
+    def parallel_compile(self, setup):
+        config.config_mgr.conf.set_override(
+            name='design_compile_workers', override=4)
+        yield
+        config.config_mgr.conf.clear_override('design_compile_workers')
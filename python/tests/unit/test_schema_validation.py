@@ -7,6 +7,8 @@ import pytest
 
 from jsonschema.exceptions import ValidationError
 
+from drydock_provisioner.ingester.plugins import SchemaValidator
+
 
 class BaseSchemaValidationTest(object):
     def _test_validate(self, schema, expect_failure, input_files, input):
@@ -151,6 +153,28 @@ class TestValidation(BaseSchemaValidationTest):
         self._test_validate('rack.yaml', True, input_files,
                             "invalid_rack.yaml")
 
+    @pytest.mark.parametrize('backend', ['jsonschema', 'fastjsonschema'])
+    def test_schema_validator_errors(self, input_files, backend):
+        """Test SchemaValidator reports every jsonschema error message."""
+        schema_dir = pkg_resources.resource_filename('drydock_provisioner',
+                                                     'schemas')
+        with open(os.path.join(schema_dir, 'rack.yaml'), 'r') as f:
+            schema = yaml.safe_load(f)['data']
+
+        with open(str(input_files.join('invalid_rack.yaml')), 'r') as f:
+            instance = yaml.safe_load(f)['spec']
+
+        validator = SchemaValidator(schema, backend=backend)
+
+        expected = [
+            e.message
+            for e in jsonschema.Draft4Validator(schema).iter_errors(instance)
+        ]
+
+        assert expected
+        assert validator.validate(instance) == expected
+        assert validator.validate({}) == []
+
     @pytest.fixture(scope='module')
     def input_files(self, tmpdir_factory, request):
         tmpdir = tmpdir_factory.mktemp('data')
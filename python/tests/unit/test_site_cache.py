@@ -0,0 +1,143 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the cache of compiled effective site designs."""
+import concurrent.futures
+import threading
+
+from drydock_provisioner.orchestrator.site_cache import EffectiveSiteCache
+
+
+class TestEffectiveSiteCache(object):
+    def test_design_key(self):
+        """Test that keys depend on design content and compile options."""
+        key = EffectiveSiteCache.design_key(b'foo')
+
+        assert key == EffectiveSiteCache.design_key('foo')
+        assert key != EffectiveSiteCache.design_key(b'bar')
+        assert key != EffectiveSiteCache.design_key(
+            b'foo', resolve_aliases=True)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used design is evicted."""
+        cache = EffectiveSiteCache(maxsize=2)
+
+        cache.get('a', lambda: (True, 'a'))
+        cache.get('b', lambda: (True, 'b'))
+        cache.get('a', lambda: (True, 'x'))
+        cache.get('c', lambda: (True, 'c'))
+
+        assert cache.get('a', lambda: (True, 'x')) == 'a'
+        assert cache.get('b', lambda: (True, 'x')) == 'x'
+
+    def test_uncacheable(self):
+        """Test that failed compilations are not cached."""
+        cache = EffectiveSiteCache(maxsize=2)
+
+        assert cache.get('a', lambda: (False, 'failed')) == 'failed'
+        assert cache.get('a', lambda: (True, 'a')) == 'a'
+
+    def test_concurrent_compile(self):
+        """Test that concurrent callers share a single compilation."""
+        cache = EffectiveSiteCache(maxsize=2)
+        compiling = threading.Event()
+        calls = []
+
+        def compile_fn():
+            calls.append(1)
+            compiling.wait(timeout=5)
+            return (True, object())
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as e:
+            futures = [e.submit(cache.get, 'a', compile_fn) for i in range(4)]
+            compiling.set()
+            results = [f.result(timeout=5) for f in futures]
+
+        assert len(calls) == 1
+        assert all(r is results[0] for r in results)
+
+    def test_copy_fn(self):
+        """Test that cached values are copied for each caller."""
+        cache = EffectiveSiteCache(maxsize=2)
+
+        first = cache.get('a', lambda: (True, ['a']), copy_fn=list)
+        first.append('b')
+
+        assert cache.get('a', lambda: (True, ['x']), copy_fn=list) == ['a']
+
+    def test_effective_site_shared(self, input_files, setup,
+                                   deckhand_orchestrator, mock_get_build_data,
+                                   mocker):
+        """Test that the orchestrator compiles a design once."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        compile_spy = mocker.spy(deckhand_orchestrator,
+                                 '_compile_effective_site')
+
+        status, first = deckhand_orchestrator.get_effective_site(design_ref)
+        status, second = deckhand_orchestrator.get_effective_site(design_ref)
+
+        assert compile_spy.call_count == 1
+
+        # Each caller gets its own copy of the cached design
+        assert first is not second
+        assert (first.get_baremetal_node('compute01') is
+                not second.get_baremetal_node('compute01'))
+
+    def test_effective_site_single_fetch(self, input_files, setup,
+                                         deckhand_orchestrator,
+                                         mock_get_build_data, mocker):
+        """Test that the design is fetched once to key and compile it."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        state_manager = deckhand_orchestrator.state_manager
+        mocker.patch.object(
+            state_manager,
+            'get_design_documents',
+            wraps=state_manager.get_design_documents)
+
+        status, design = deckhand_orchestrator.get_effective_site(design_ref)
+
+        assert design is not None
+        state_manager.get_design_documents.assert_called_once_with(design_ref)
+
+    def test_effective_site_build_data_marker(self, input_files, setup,
+                                              deckhand_orchestrator,
+                                              mock_get_build_data, mocker):
+        """Test that designs resolving aliases are keyed on build data."""
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        compile_spy = mocker.spy(deckhand_orchestrator,
+                                 '_compile_effective_site')
+
+        state_manager = deckhand_orchestrator.state_manager
+        mocker.patch.object(
+            state_manager, 'get_build_data_marker', return_value=(1, 'a'))
+
+        deckhand_orchestrator.get_effective_site(
+            design_ref, resolve_aliases=True)
+        deckhand_orchestrator.get_effective_site(
+            design_ref, resolve_aliases=True)
+
+        assert compile_spy.call_count == 1
+
+        # Build data posted by another Drydock instance
+        state_manager.get_build_data_marker.return_value = (2, 'b')
+
+        deckhand_orchestrator.get_effective_site(
+            design_ref, resolve_aliases=True)
+
+        assert compile_spy.call_count == 2
@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import drydock_provisioner.config as config
+import drydock_provisioner.objects as objects
 import drydock_provisioner.objects.fields as hd_fields
 from drydock_provisioner.orchestrator.orchestrator import Orchestrator
 from drydock_provisioner.orchestrator.validations.validator import Validator
+from drydock_provisioner.orchestrator.validations.boot_storage_rational import BootStorageRational
+from drydock_provisioner.orchestrator.validations.mtu_rational import MtuRational
 
 
 class TestDesignValidator(object):
@@ -51,3 +55,74 @@ class TestDesignValidator(object):
         response = val.validate_design(site_design)
 
         assert response.status == hd_fields.ValidationResult.Success
+
+    def test_validate_design_parallel(self, deckhand_ingester, drydock_state,
+                                      input_files, mock_get_build_data):
+        """Test rules run concurrently report messages in rule order."""
+
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        orch = Orchestrator(
+            state_manager=drydock_state, ingester=deckhand_ingester)
+
+        status, site_design = Orchestrator.get_effective_site(orch, design_ref)
+
+        val = Validator(orch)
+        serial = val.validate_design(site_design)
+
+        config.config_mgr.conf.set_override(
+            name='validation_workers', override=4)
+        try:
+            parallel = val.validate_design(site_design)
+        finally:
+            config.config_mgr.conf.clear_override('validation_workers')
+
+        assert parallel.status == serial.status
+        assert parallel.error_count == serial.error_count
+        assert [(m.name, m.message) for m in parallel.message_list] == [
+            (m.name, m.message) for m in serial.message_list
+        ]
+
+    def test_validate_design_cached(self, deckhand_ingester, drydock_state,
+                                    input_files, mock_get_build_data, mocker):
+        """Test rules are only re-run when the documents they use change."""
+
+        input_file = input_files.join("deckhand_fullsite.yaml")
+        design_ref = "file://%s" % str(input_file)
+
+        orch = Orchestrator(
+            state_manager=drydock_state, ingester=deckhand_ingester)
+
+        status, site_design = Orchestrator.get_effective_site(orch, design_ref)
+
+        assert status.status == hd_fields.ValidationResult.Success
+
+        mtu_spy = mocker.spy(MtuRational, 'run_validation')
+        storage_spy = mocker.spy(BootStorageRational, 'run_validation')
+
+        # The design was validated when it was compiled
+        val = Validator(orch)
+        response = val.validate_design(site_design)
+
+        assert mtu_spy.call_count == 0
+        assert storage_spy.call_count == 0
+        assert response.status == hd_fields.ValidationResult.Success
+
+        # Change the source of each network
+        for n in site_design.networks:
+            n.doc_ref = objects.DocumentReference(
+                doc_type=n.doc_ref.doc_type,
+                doc_schema=n.doc_ref.doc_schema,
+                doc_name=n.doc_ref.doc_name,
+                doc_hash='changed')
+
+        val.validate_design(site_design)
+
+        assert mtu_spy.call_count == 1
+        assert storage_spy.call_count == 0
+
+        # The cached design is not changed
+        status, cached = Orchestrator.get_effective_site(orch, design_ref)
+
+        assert all(n.doc_ref.doc_hash != 'changed' for n in cached.networks)
@@ -0,0 +1,59 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the address index shared by IP validation rules."""
+
+import drydock_provisioner.objects as objects
+
+from drydock_provisioner.orchestrator.validations.address_index import AddressIndex
+
+
+class TestAddressIndex(object):
+    def test_network_contains(self, setup):
+        """Test addresses are matched against the named network."""
+        design = objects.SiteDesign()
+        design.add_network(
+            objects.Network(name='v4', site='test', cidr='172.16.0.0/24'))
+        design.add_network(
+            objects.Network(name='v6', site='test', cidr='2001:db8::/64'))
+
+        index = AddressIndex(design)
+
+        assert index.network_contains('v4', '172.16.0.10')
+        assert index.network_contains('v4', '172.16.0.255')
+        assert not index.network_contains('v4', '172.16.1.0')
+        assert index.network_contains('v6', '2001:db8::10')
+        # An IPv6 address with the same integer value as an IPv4 address
+        assert not index.network_contains('v4', '::ac10:a')
+
+    def test_duplicate_addresses(self, setup):
+        """Test duplicate addresses are reported in design order."""
+        design = objects.SiteDesign()
+
+        for name, addresses in [('n1', ['10.0.0.1', '10.0.0.2']),
+                                ('n2', ['10.0.0.3', '10.0.0.4']),
+                                ('n3', [None, '10.0.0.2'])]:
+            node = objects.BaremetalNode(name=name, site='test')
+            node.addressing = objects.IpAddressAssignmentList()
+            for a in addresses:
+                node.addressing.append(
+                    objects.IpAddressAssignment(
+                        type='static', address=a, network='v4'))
+            design.add_baremetal_node(node)
+
+        index = AddressIndex(design)
+
+        duplicates = [(n.name, a, f.name)
+                      for (n, a, f) in index.get_duplicate_addresses()]
+
+        assert duplicates == [('n3', '10.0.0.2', 'n1')]
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Test Validation Rule Unique Network"""
 
+import concurrent.futures
 import re
 import logging
 
@@ -68,3 +69,31 @@ class TestMtu(object):
             ])
 
         assert len(message_list) == 4
+
+    def test_mtu_concurrent_designs(self, mocker, deckhand_ingester,
+                                    drydock_state, input_files):
+        """Test a rule instance validates designs concurrently."""
+        orch = Orchestrator(
+            state_manager=drydock_state, ingester=deckhand_ingester)
+
+        designs = []
+        for f in ["validation.yaml", "invalid_validation.yaml"]:
+            design_ref = "file://%s" % str(input_files.join(f))
+            status, site_design = Orchestrator.get_effective_site(
+                orch, design_ref)
+            designs.append(site_design)
+
+        validator = MtuRational()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as e:
+            results = list(
+                e.map(lambda d: validator.execute(d, orchestrator=orch),
+                      designs * 10))
+
+        for i, message_list in enumerate(results):
+            if i % 2 == 0:
+                assert len(message_list) == 1
+                assert not message_list[0].error
+            else:
+                assert len(message_list) == 4
+                assert all(m.error for m in message_list)
@@ -0,0 +1,83 @@
+# Copyright 2018 AT&T Intellectual Property.  All other rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test the storage table shared by storage validation rules."""
+
+import drydock_provisioner.objects as objects
+
+from drydock_provisioner.orchestrator.validations.storage_table import NodeStorage
+from drydock_provisioner.orchestrator.validations.storage_table import StorageTable
+
+
+class TestStorageTable(object):
+    def test_parse_sizes(self):
+        """Test size expressions are parsed as percentages or bytes."""
+        assert StorageTable.parse_percent('30%') == 30
+        assert StorageTable.parse_percent('-5%') == -5
+        assert StorageTable.parse_percent('>5%') is None
+        assert StorageTable.parse_percent('30g') is None
+        assert StorageTable.parse_percent(None) is None
+
+        assert StorageTable.parse_bytes('20g') == 20 * 1000 * 1000 * 1000
+        assert StorageTable.parse_bytes('500MB') == 500 * 1000 * 1000
+        assert StorageTable.parse_bytes('30%') is None
+        assert StorageTable.parse_bytes(None) is None
+
+    def test_node_rows(self, setup):
+        """Test the storage of a node is tabulated in design order."""
+        node = objects.BaremetalNode(name='n1', site='test')
+        node.storage_devices = objects.HostStorageDeviceList()
+        node.volume_groups = objects.HostVolumeGroupList()
+
+        sda = objects.HostStorageDevice(name='sda', volume_group=None)
+        sda.partitions = objects.HostPartitionList()
+        for name, size, vg in [('root', '30g', None), ('pv', '50%', 'vg1')]:
+            sda.partitions.append(
+                objects.HostPartition(
+                    name=name,
+                    size=size,
+                    volume_group=vg,
+                    mountpoint=None,
+                    fstype=None))
+        node.storage_devices.append(sda)
+
+        vg1 = objects.HostVolumeGroup(name='vg1')
+        vg1.logical_volumes = objects.HostVolumeList()
+        vg1.logical_volumes.append(
+            objects.HostVolume(name='lv1', size='40%', mountpoint='/var'))
+        node.volume_groups.append(vg1)
+
+        design = objects.SiteDesign()
+        design.add_baremetal_node(node)
+
+        nodes = StorageTable(design).get_nodes()
+
+        assert len(nodes) == 1
+        assert nodes[0].node is node
+        assert [(r.kind, r.parent, r.name) for r in nodes[0].rows] == [
+            (NodeStorage.DEVICE, None, 'sda'),
+            (NodeStorage.PARTITION, 'sda', 'root'),
+            (NodeStorage.PARTITION, 'sda', 'pv'),
+            (NodeStorage.VOLUME_GROUP, None, 'vg1'),
+            (NodeStorage.LOGICAL_VOLUME, 'vg1', 'lv1'),
+        ]
+
+        (root, pv) = nodes[0].select(NodeStorage.PARTITION, 'sda')
+        assert root.bytes == 30 * 1000 * 1000 * 1000
+        assert root.percent is None
+        assert pv.percent == 50
+        assert pv.volume_group == 'vg1'
+
+        (lv1, ) = nodes[0].select(NodeStorage.LOGICAL_VOLUME)
+        assert lv1.percent == 40
+        assert lv1.mountpoint == '/var'